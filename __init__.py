@@ -5,19 +5,35 @@ Import ReadyPlayerMe avatars directly into Blender with a modern webview UI.
 This addon is compatible with Blender 4.5+ extensions platform.
 """
 
+import argparse
+import atexit
 import importlib.util
 import json
 import os
-import subprocess
 import sys
-import tempfile
-import threading
+import time
 import urllib.parse
-import urllib.request
 from pathlib import Path
 
 import bpy
+import numpy as np
 from bpy.utils import previews
+from mathutils import Matrix
+
+from . import (
+    rpm_avatar_api,
+    rpm_batch,
+    rpm_blend_cache,
+    rpm_cache,
+    rpm_download,
+    rpm_glb,
+    rpm_import_queue,
+    rpm_library,
+    rpm_persist,
+    rpm_thumbnails,
+    rpm_trace,
+    rpm_ui_session,
+)
 
 
 def _is_pywebview_available():
@@ -32,6 +48,47 @@ def _get_config_backup_path():
     backup_file = os.path.join(config_dir, 'readyplayerme_prefs.json')
     return backup_file
 
+avatar_library = None
+
+def _get_library_path():
+    """Avatar library file in Blender's config directory."""
+    config_dir = bpy.utils.user_resource('CONFIG', create=True)
+    return os.path.join(config_dir, rpm_library.LIBRARY_NAME)
+
+def _get_avatar_library():
+    global avatar_library
+    if avatar_library is None:
+        avatar_library = rpm_library.AvatarStore(_get_library_path())
+    return avatar_library
+
+def _migrate_legacy_avatars(items):
+    """Move avatars kept by older versions into the library if it is empty."""
+    avatars = [
+        {
+            'avatar_id': it.get('avatar_id', '') or '',
+            'glb_url': it.get('glb_url', '') or '',
+            'thumb_url': it.get('thumb_url', '') or '',
+        }
+        for it in items if it.get('avatar_id')
+    ]
+    library = _get_avatar_library()
+    if avatars and not len(library):
+        library.sync(avatars)
+        print(f'RPM: Migrated {len(avatars)} avatars into the avatar library')
+
+def _migrate_legacy_prefs():
+    """Empty the old avatar_items / scraped_avatars_json copies in the prefs."""
+    p = bpy.context.preferences.addons[__name__].preferences
+    if not (p.avatar_items or p.scraped_avatars_json):
+        return
+    _migrate_legacy_avatars([
+        {'avatar_id': it.avatar_id, 'glb_url': it.glb_url, 'thumb_url': it.thumb_url}
+        for it in p.avatar_items
+    ])
+    p.avatar_items.clear()
+    p.scraped_avatars_json = ''
+    _mark_prefs_dirty()
+
 def _backup_prefs_to_config():
     """Backup preferences to Blender's config directory before unregister."""
     try:
@@ -52,15 +109,6 @@ def _backup_prefs_to_config():
             'login_email': prefs.login_email or '',
             'login_password': prefs.login_password or '',
             'dev_mode': prefs.dev_mode,
-            'scraped_avatars_json': prefs.scraped_avatars_json or '',
-            'avatar_items': [
-                {
-                    'glb_url': item.glb_url or '',
-                    'thumb_url': item.thumb_url or '',
-                    'avatar_id': item.avatar_id or ''
-                }
-                for item in prefs.avatar_items
-            ]
         }
 
         # Write backup
@@ -83,29 +131,707 @@ def _restore_prefs_from_config():
         p = bpy.context.preferences.addons[__name__].preferences
 
         # Only restore if current prefs appear empty (to avoid overwriting manual edits)
-        if not p.login_email and not p.avatar_items:
+        if not p.login_email and (data.get('login_email') or data.get('avatar_items')):
             p.login_email = data.get('login_email', '') or ''
             p.login_password = data.get('login_password', '') or ''
             p.dev_mode = data.get('dev_mode', False)
-            p.scraped_avatars_json = data.get('scraped_avatars_json', '') or ''
-
-            # Restore avatar items
-            p.avatar_items.clear()
-            for item_data in data.get('avatar_items', []):
-                new_item = p.avatar_items.add()
-                new_item.glb_url = item_data.get('glb_url', '') or ''
-                new_item.thumb_url = item_data.get('thumb_url', '') or ''
-                new_item.avatar_id = item_data.get('avatar_id', '') or ''
-
-            print(f'RPM: Restored {len(p.avatar_items)} avatars from config backup')
+            # Backups written before the avatar library existed carry the avatars
+            _migrate_legacy_avatars(data.get('avatar_items') or [])
+            print('RPM: Restored preferences from config backup')
             # Save restored prefs back to userpref.blend
-            try:
-                bpy.ops.wm.save_userpref()
-            except Exception:
-                pass
+            _mark_prefs_dirty()
     except Exception as e:
         print(f'RPM: Failed to restore preferences: {e}')
 
+prefs_saver = None
+
+def _save_userpref():
+    try:
+        bpy.ops.wm.save_userpref()
+        print('RPM: User preferences saved')
+    except Exception as se:
+        # No usable context (e.g. during exit); keep the config backup current
+        print('RPM: Could not save user preferences', se)
+        _backup_prefs_to_config()
+
+def _mark_prefs_dirty():
+    """Schedule a coalesced save of the addon preferences."""
+    global prefs_saver
+    if prefs_saver is None:
+        prefs_saver = rpm_persist.SaveScheduler(_save_userpref)
+    prefs_saver.mark_dirty()
+    try:
+        # Lets Blender's own auto-save on exit pick the change up too
+        bpy.context.preferences.is_dirty = True
+    except Exception:
+        pass
+    if not bpy.app.timers.is_registered(_flush_prefs_timer):
+        bpy.app.timers.register(_flush_prefs_timer, first_interval=prefs_saver.delay,
+                                persistent=True)
+
+def _flush_prefs_timer():
+    """Timer: save the preferences once updates have been quiet long enough."""
+    if prefs_saver is None:
+        return None
+    wait = prefs_saver.seconds_until_due()
+    if wait is None:
+        return None
+    if wait > 0:
+        return wait
+    prefs_saver.flush()
+    print(
+        f'RPM: Preference saves: {prefs_saver.writes} writes for '
+        f'{prefs_saver.requests} updates ({prefs_saver.saved_writes} saved)'
+    )
+    return None
+
+def _flush_prefs():
+    """Write any pending preference change now (unregister and exit)."""
+    if prefs_saver is not None and prefs_saver.dirty:
+        prefs_saver.flush()
+
+def _read_shape_key_coords(key_blocks, vert_count):
+    """Read every key block into a (keys, verts, 3) float32 array."""
+    coords = np.empty((len(key_blocks), vert_count * 3), dtype=np.float32)
+    for i, kb in enumerate(key_blocks):
+        # ``points`` is copied as a raw array; ``data`` goes through the
+        # generic per-item path and is a few hundred times slower
+        kb.points.foreach_get('co', coords[i])
+    return coords.reshape(len(key_blocks), vert_count, 3)
+
+def _rebase_shape_keys(mesh, act_index):
+    """Add the active key's offset from the reference key to every other key.
+
+    Vectorized equivalent of ``sk.co = ref.co + (act.co - ref.co) + (sk.co - ref.co)``
+    for each key block other than the active and reference keys, so that the
+    active key can become the new basis without changing any morph target.
+    """
+    key_blocks = mesh.shape_keys.key_blocks
+    ref_index = 0  # reference_key is always the first key block
+    if act_index == ref_index or len(key_blocks) < 3:
+        return
+
+    coords = _read_shape_key_coords(key_blocks, len(mesh.vertices))
+    act_delta = coords[act_index] - coords[ref_index]
+
+    others = np.ones(len(key_blocks), dtype=bool)
+    others[[ref_index, act_index]] = False
+    coords[others] += act_delta
+
+    for i in np.flatnonzero(others):
+        key_blocks[i].points.foreach_set('co', coords[i].ravel())
+    mesh.update()
+
+# Key block settings carried along when key blocks are reordered; slider_max
+# is widened first so the original slider range can always be restored
+_SHAPE_KEY_PROPS = ('slider_min', 'slider_max', 'value', 'mute', 'vertex_group',
+                    'interpolation', 'lock_shape')
+
+def _promote_shape_key(mesh, index, coords=None):
+    """Make key block ``index`` the reference key, keeping the others in order.
+
+    Data-API equivalent of moving the key to the top with repeated
+    ``object.shape_key_move(type='UP')``: key blocks before it shift down one
+    slot, with their names, settings and coordinates. Every key becomes
+    relative to the new reference key. ``coords`` (keys x verts x 3, in the
+    current order) replaces the stored coordinates when given.
+    """
+    key_blocks = mesh.shape_keys.key_blocks
+    if index <= 0:
+        return
+    replace = coords is not None
+    if not replace:
+        coords = _read_shape_key_coords(key_blocks, len(mesh.vertices))
+    state = [(kb.name, {p: getattr(kb, p) for p in _SHAPE_KEY_PROPS}) for kb in key_blocks]
+    order = [index] + [i for i in range(len(key_blocks)) if i != index]
+
+    # Temporary names first so that no rename collides with a key not yet moved
+    for i, kb in enumerate(key_blocks):
+        kb.name = f'__rpm_key_{i}'
+    for dst, src in enumerate(order):
+        kb = key_blocks[dst]
+        if replace or src != dst:
+            kb.points.foreach_set('co', coords[src].ravel())
+        name, props = state[src]
+        kb.name = name
+        kb.slider_max = 10.0
+        for prop, value in props.items():
+            setattr(kb, prop, value)
+
+    reference = key_blocks[0]
+    for kb in key_blocks:
+        kb.relative_key = reference
+    mesh.attributes['position'].data.foreach_set('vector', coords[index].ravel())
+    mesh.update()
+
+def _apply_pose_as_basis(aobj):
+    """Make the active shape key the basis without changing any morph target."""
+    if not aobj.data.shape_keys:
+        return
+    act_index = aobj.active_shape_key_index
+    _rebase_shape_keys(aobj.data, act_index)
+    _promote_shape_key(aobj.data, act_index)
+    aobj.active_shape_key_index = 0
+
+def _deformed_coords(context, obj):
+    """``obj``'s basis as deformed by its modifiers, as a (verts, 3) array.
+
+    Evaluates the object like ``object.modifier_apply_as_shapekey`` does for
+    the imported meshes, whose only modifier is the armature.
+    """
+    mesh = obj.data
+    # Like the operator, deform the basis rather than the current shape-key mix
+    pinned = obj.show_only_shape_key, obj.active_shape_key_index
+    obj.show_only_shape_key = True
+    obj.active_shape_key_index = 0
+    try:
+        evaluated = obj.evaluated_get(context.evaluated_depsgraph_get())
+        deformed = evaluated.to_mesh()
+        try:
+            if len(deformed.vertices) != len(mesh.vertices):
+                raise RuntimeError(f"modifiers on {obj.name} change the vertex count")
+            co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            deformed.attributes['position'].data.foreach_get('vector', co)
+        finally:
+            evaluated.to_mesh_clear()
+    finally:
+        obj.show_only_shape_key, obj.active_shape_key_index = pinned
+    return co.reshape(-1, 3)
+
+def _bake_pose_as_basis(context, obj, name):
+    """Make ``obj``'s posed shape its basis, keeping the old one as the second key.
+
+    Does the work of ``object.modifier_apply_as_shapekey`` followed by
+    ``_apply_pose_as_basis`` in one pass: the posed basis comes from the
+    depsgraph, every morph target is offset by the same displacement, and
+    all keys are written once in their final order (the new basis, the old
+    basis, then the morph targets).
+    """
+    mesh = obj.data
+    if mesh.shape_keys is None:
+        obj.shape_key_add(name="Basis", from_mix=False)
+    coords = _read_shape_key_coords(mesh.shape_keys.key_blocks, len(mesh.vertices))
+    posed = _deformed_coords(context, obj)
+    coords[1:] += posed - coords[0]
+    obj.shape_key_add(name=name, from_mix=False)
+    _promote_shape_key(mesh, len(coords), np.concatenate([coords, posed[np.newaxis]]))
+    obj.active_shape_key_index = 0
+
+def _assign_weights(obj, table):
+    """Add (vertex, group, weight) rows of ``table`` to ``obj``'s vertex groups.
+
+    Uses one ``VertexGroup.add`` call per distinct weight of each group.
+    """
+    table = table[np.lexsort((table[:, 2], table[:, 1]))]
+    runs = np.flatnonzero(np.any(np.diff(table[:, 1:], axis=0) != 0, axis=1)) + 1
+    for run in np.split(table, runs):
+        obj.vertex_groups[int(run[0, 1])].add(
+            run[:, 0].astype(np.int64).tolist(), float(run[0, 2]), 'REPLACE'
+        )
+
+def _join_meshes(context, target, others):
+    """Join the mesh objects ``others`` into ``target``.
+
+    Runs ``object.join`` with a context override instead of changing the
+    selection and active object, so the view layer is left alone. The
+    operator keeps everything a part carries (edge attributes such as
+    seams, sharp edges and creases, loose edges, custom normals, vertex
+    groups and shape keys by name) and is much faster than rebuilding the
+    mesh through the data API.
+    """
+    parts = [target] + list(others)
+    with context.temp_override(active_object=target, object=target,
+                               selected_objects=parts, selected_editable_objects=parts):
+        bpy.ops.object.join()
+    return target
+
+def _apply_pose_as_rest(context, armature):
+    """Make the current pose the rest pose, like ``pose.armature_apply``.
+
+    Edit bones only exist in edit mode, so this is the one step that still
+    switches modes; the bone matrices themselves are set directly.
+    """
+    matrices = {pb.name: pb.matrix.copy() for pb in armature.pose.bones}
+    with context.temp_override(active_object=armature, object=armature,
+                               selected_objects=[armature],
+                               selected_editable_objects=[armature]):
+        bpy.ops.object.mode_set(mode='EDIT')
+        try:
+            for eb in armature.data.edit_bones:
+                eb.matrix = matrices[eb.name]
+        finally:
+            bpy.ops.object.mode_set(mode='OBJECT')
+    for pb in armature.pose.bones:
+        pb.matrix_basis = Matrix.Identity(4)
+
+def _post_import(context, armature, trace=None):
+    """Post-process an imported avatar without touching the selection.
+
+    Joins the armature's meshes, stores the imported pose on each mesh as
+    its basis (the original rest shape is kept as ``oldBasis``) and makes
+    that pose the armature's rest pose. Replaces the former chain of
+    select/join/apply-as-shape-key/shape-key-move/armature-apply operators:
+    only the join still runs as an operator, under a context override, so
+    an import is one undo step with no forced redraw.
+    """
+    context.view_layer.update()
+    armature.data.show_bone_custom_shapes = False
+
+    meshes = [obj for obj in armature.children if obj.type == 'MESH']
+    if len(meshes) > 1:
+        with rpm_trace.stage(trace, 'join'):
+            meshes = [_join_meshes(context, meshes[0], meshes[1:])]
+    if not meshes:
+        return
+
+    for mesh in meshes:
+        modifier = next(
+            (m for m in mesh.modifiers if m.type == 'ARMATURE' and m.object == armature), None
+        )
+        if modifier:
+            with rpm_trace.stage(trace, 'pose_shape_key'):
+                _bake_pose_as_basis(context, mesh, modifier.name)
+        elif mesh.data.shape_keys:
+            with rpm_trace.stage(trace, 'shape_key_rebase'):
+                mesh.active_shape_key_index = len(mesh.data.shape_keys.key_blocks) - 1
+                _apply_pose_as_basis(mesh)
+        else:
+            continue
+        mesh.data.shape_keys.key_blocks[1].name = "oldBasis"
+        mesh.data.shape_keys.key_blocks[0].name = "Basis"
+    context.view_layer.objects.active = armature
+    armature.show_in_front = True
+    with rpm_trace.stage(trace, 'rest_pose'):
+        _apply_pose_as_rest(context, armature)
+
+# glTF is Y up and Blender Z up: (x, y, z) -> (x, -z, y)
+_GLTF_AXES = np.array([
+    [1.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, -1.0, 0.0],
+    [0.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0],
+])
+# The glTF importer turns each bone 90 degrees about X so it points along the node's +Y
+_BONE_CORRECTION = np.array([
+    [1.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, -1.0, 0.0],
+    [0.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0],
+])
+
+def _gltf_to_blender(matrices):
+    return _GLTF_AXES @ matrices @ _GLTF_AXES.T
+
+def _gltf_coords(co):
+    """glTF positions or normals (n x 3) as Blender float32 coordinates."""
+    out = np.empty((len(co), 3), dtype=np.float32)
+    out[:, 0] = co[:, 0]
+    out[:, 1] = -co[:, 2]
+    out[:, 2] = co[:, 1]
+    return out
+
+def _without_scale(matrix):
+    out = matrix.copy()
+    out[:3, :3] /= np.linalg.norm(matrix[:3, :3], axis=0)
+    return out
+
+def _glb_images(glb, created):
+    """Pack every embedded image of the GLB into a Blender image."""
+    images = []
+    for index, source in enumerate(glb.gltf.get('images', [])):
+        data = bytes(glb.view_bytes(source['bufferView']))
+        image = bpy.data.images.new(source.get('name') or f"Image_{index}", 8, 8)
+        created.append(image)
+        image.pack(data=data, data_len=len(data))
+        image.source = 'FILE'
+        images.append(image)
+    return images
+
+def _glb_material(glb, index, images, created):
+    """Principled BSDF material for a glTF metallic-roughness material."""
+    gltf = glb.gltf
+    source = gltf['materials'][index]
+    pbr = source.get('pbrMetallicRoughness', {})
+    material = bpy.data.materials.new(source.get('name') or f"Material_{index}")
+    created.append(material)
+    material.use_nodes = True
+    material.use_backface_culling = not source.get('doubleSided', False)
+    nodes, links = material.node_tree.nodes, material.node_tree.links
+    bsdf = nodes.get("Principled BSDF")
+
+    def texture(info, y, data=False):
+        node = nodes.new('ShaderNodeTexImage')
+        node.location = (-700, y)
+        node.image = images[gltf['textures'][info['index']]['source']]
+        if data:
+            node.image.colorspace_settings.is_data = True
+        return node
+
+    def multiply(socket, factor, y):
+        if isinstance(factor, (int, float)):
+            node = nodes.new('ShaderNodeMath')
+            node.operation = 'MULTIPLY'
+            links.new(socket, node.inputs[0])
+            node.inputs[1].default_value = factor
+            output = node.outputs[0]
+        else:
+            node = nodes.new('ShaderNodeMix')
+            node.data_type = 'RGBA'
+            node.blend_type = 'MULTIPLY'
+            node.inputs['Factor'].default_value = 1.0
+            links.new(socket, node.inputs[6])
+            node.inputs[7].default_value = list(factor) + [1.0] * (4 - len(factor))
+            output = node.outputs[2]
+        node.location = (-350, y)
+        return output
+
+    base = pbr.get('baseColorFactor', [1.0, 1.0, 1.0, 1.0])
+    bsdf.inputs["Base Color"].default_value = base
+    bsdf.inputs["Alpha"].default_value = base[3]
+    if 'baseColorTexture' in pbr:
+        node = texture(pbr['baseColorTexture'], 300)
+        color = node.outputs["Color"]
+        if base[:3] != [1.0, 1.0, 1.0]:
+            color = multiply(color, base, 300)
+        links.new(color, bsdf.inputs["Base Color"])
+        if source.get('alphaMode') == 'BLEND':
+            alpha = node.outputs["Alpha"]
+            links.new(multiply(alpha, base[3], 150) if base[3] != 1.0 else alpha, bsdf.inputs["Alpha"])
+    if source.get('alphaMode') == 'BLEND':
+        material.surface_render_method = 'BLENDED'
+
+    metallic = pbr.get('metallicFactor', 1.0)
+    roughness = pbr.get('roughnessFactor', 1.0)
+    bsdf.inputs["Metallic"].default_value = metallic
+    bsdf.inputs["Roughness"].default_value = roughness
+    if 'metallicRoughnessTexture' in pbr:
+        node = texture(pbr['metallicRoughnessTexture'], 0, data=True)
+        split = nodes.new('ShaderNodeSeparateColor')
+        split.location = (-450, 0)
+        links.new(node.outputs["Color"], split.inputs["Color"])
+        for channel, name, factor, y in (("Blue", "Metallic", metallic, 0),
+                                         ("Green", "Roughness", roughness, -100)):
+            socket = split.outputs[channel]
+            links.new(multiply(socket, factor, y) if factor != 1.0 else socket, bsdf.inputs[name])
+
+    if 'normalTexture' in source:
+        node = texture(source['normalTexture'], -300, data=True)
+        normal_map = nodes.new('ShaderNodeNormalMap')
+        normal_map.location = (-350, -300)
+        normal_map.inputs["Strength"].default_value = source['normalTexture'].get('scale', 1.0)
+        links.new(node.outputs["Color"], normal_map.inputs["Color"])
+        links.new(normal_map.outputs["Normal"], bsdf.inputs["Normal"])
+
+    emissive = source.get('emissiveFactor', [0.0, 0.0, 0.0])
+    if 'emissiveTexture' in source or any(emissive):
+        bsdf.inputs["Emission Strength"].default_value = 1.0
+        bsdf.inputs["Emission Color"].default_value = list(emissive) + [1.0]
+        if 'emissiveTexture' in source:
+            color = texture(source['emissiveTexture'], -600).outputs["Color"]
+            if emissive != [1.0, 1.0, 1.0]:
+                color = multiply(color, emissive, -600)
+            links.new(color, bsdf.inputs["Emission Color"])
+    return material
+
+def _glb_armature(context, glb, collection, created):
+    """Armature for the GLB's skin, in the glTF importer's bind pose and current pose.
+
+    Like the glTF importer, the rest pose comes from the inverse bind
+    matrices (without scale), bones point along their node's +Y and are as
+    long as the distance to their nearest child, and the nodes' transforms
+    become the pose. Returns the armature object and its bone names in
+    joint order.
+    """
+    gltf = glb.gltf
+    nodes = gltf['nodes']
+    skin = gltf['skins'][0]
+    joints = skin['joints']
+    parents = rpm_glb.node_parents(gltf)
+    world = rpm_glb.world_matrices(gltf)
+    joint_index = {node: i for i, node in enumerate(joints)}
+    bone_parent = [joint_index.get(parents[node]) for node in joints]
+    root = next(node for node, parent in zip(joints, bone_parent) if parent is None)
+    armature_node = parents[root]
+    armature_world = world[armature_node] if armature_node is not None else np.eye(4)
+
+    to_armature = np.linalg.inv(armature_world)
+    posed = np.array([to_armature @ world[node] for node in joints])
+    if 'inverseBindMatrices' in skin:
+        bind = np.linalg.inv(glb.matrices(skin['inverseBindMatrices']))
+    else:
+        bind = posed
+
+    def depth(i):
+        return 0 if bone_parent[i] is None else depth(bone_parent[i]) + 1
+
+    order = sorted(range(len(joints)), key=depth)
+    local = [None] * len(joints)
+    rest = np.empty_like(bind)
+    for i in order:
+        p = bone_parent[i]
+        local[i] = _without_scale(bind[i] if p is None else np.linalg.solve(bind[p], bind[i]))
+        rest[i] = local[i] if p is None else rest[p] @ local[i]
+    offsets = [float(np.linalg.norm(m[:3, 3])) for m in local]
+    lengths = [1.0] * len(joints)
+    for i in order:
+        children = [offsets[c] for c, p in enumerate(bone_parent) if p == i and offsets[c] > 1e-4]
+        if children:
+            lengths[i] = min(children)
+        elif bone_parent[i] is not None:
+            lengths[i] = lengths[bone_parent[i]]
+        elif offsets[i] > 1e-4:
+            lengths[i] = offsets[i]
+    rest = _gltf_to_blender(rest) @ _BONE_CORRECTION
+    posed = _gltf_to_blender(posed) @ _BONE_CORRECTION
+
+    name = nodes[armature_node].get('name', "Armature") if armature_node is not None else "Armature"
+    data = bpy.data.armatures.new(name)
+    created.append(data)
+    armature = bpy.data.objects.new(name, data)
+    created.append(armature)
+    collection.objects.link(armature)
+    armature.matrix_world = Matrix(_gltf_to_blender(armature_world).tolist())
+
+    # mode_set enters edit mode on the view layer's active object, whatever
+    # the context override says; the armature ends up active anyway
+    context.view_layer.objects.active = armature
+    with context.temp_override(active_object=armature, object=armature,
+                               selected_objects=[armature],
+                               selected_editable_objects=[armature]):
+        bpy.ops.object.mode_set(mode='EDIT')
+        try:
+            edit_bones = []
+            for i, node in enumerate(joints):
+                eb = data.edit_bones.new(nodes[node].get('name') or f"bone_{i}")
+                eb.tail = (0.0, 1.0, 0.0)
+                eb.matrix = Matrix(rest[i].tolist())
+                eb.length = lengths[i]
+                edit_bones.append(eb)
+            for eb, p in zip(edit_bones, bone_parent):
+                if p is not None:
+                    eb.parent = edit_bones[p]
+            names = [eb.name for eb in edit_bones]
+        finally:
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+    for i, name in enumerate(names):
+        p = bone_parent[i]
+        rest_local = rest[i] if p is None else np.linalg.solve(rest[p], rest[i])
+        pose_local = posed[i] if p is None else np.linalg.solve(posed[p], posed[i])
+        armature.pose.bones[name].matrix_basis = Matrix(np.linalg.solve(rest_local, pose_local).tolist())
+    return armature, names
+
+def _glb_mesh(glb, node_index, armature, group_names, materials, collection, created):
+    """Skinned mesh object for a glTF mesh node, parented to ``armature``.
+
+    Primitives are merged into one mesh with a material slot each; every
+    primitive keeps only the vertices its indices use, as in the glTF
+    importer. Accessors are read as views of the mapped file and written
+    with ``foreach_set``.
+    """
+    gltf = glb.gltf
+    node = gltf['nodes'][node_index]
+    source = gltf['meshes'][node['mesh']]
+    primitives = source['primitives']
+    target_count = len(primitives[0].get('targets', []))
+    uv_sets = [n for n in range(2) if all(f'TEXCOORD_{n}' in p['attributes'] for p in primitives)]
+    with_normals = all('NORMAL' in p['attributes'] for p in primitives)
+
+    co, normals, loops, face_materials, weights = [], [], [], [], []
+    uvs = {n: [] for n in uv_sets}
+    deltas = [[] for _ in range(target_count)]
+    slots = []
+    offset = 0
+    for prim in primitives:
+        attributes = prim['attributes']
+        indices = glb.accessor(prim['indices']).ravel()
+        used, remapped = np.unique(indices, return_inverse=True)
+        count = gltf['accessors'][attributes['POSITION']]['count']
+        # Skip the gather (and its copy) when the primitive uses every vertex
+        every = len(used) == count
+
+        def read(accessor):
+            values = glb.accessor(accessor)
+            return values if every else values[used]
+
+        co.append(_gltf_coords(read(attributes['POSITION'])))
+        if with_normals:
+            normals.append(_gltf_coords(read(attributes['NORMAL'])))
+        for n in uv_sets:
+            uv = np.array(read(attributes[f'TEXCOORD_{n}']), dtype=np.float32)
+            uv[:, 1] = 1.0 - uv[:, 1]
+            uvs[n].append(uv)
+        for t, target in enumerate(prim.get('targets', [])):
+            if 'POSITION' in target:
+                deltas[t].append(_gltf_coords(read(target['POSITION'])))
+            else:
+                deltas[t].append(np.zeros((len(used), 3), dtype=np.float32))
+        s = 0
+        while f'JOINTS_{s}' in attributes and f'WEIGHTS_{s}' in attributes:
+            joint = read(attributes[f'JOINTS_{s}']).astype(np.int64)
+            weight = read(attributes[f'WEIGHTS_{s}'])
+            vertex = np.repeat(np.arange(len(used)) + offset, joint.shape[1])
+            table = np.column_stack([vertex, joint.ravel(), weight.ravel()])
+            weights.append(table[table[:, 2] > 0.0])
+            s += 1
+
+        material = prim.get('material')
+        if material not in slots:
+            slots.append(material)
+        face_materials.append(np.full(len(remapped) // 3, slots.index(material), dtype=np.int32))
+        loops.append(remapped.astype(np.int32) + offset)
+        offset += len(used)
+
+    loops = np.concatenate(loops)
+    co = np.concatenate(co)
+    mesh = bpy.data.meshes.new(source.get('name') or node.get('name') or "Mesh")
+    created.append(mesh)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set('co', co.ravel())
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set('vertex_index', loops)
+    mesh.polygons.add(len(loops) // 3)
+    mesh.polygons.foreach_set('loop_start', np.arange(0, len(loops), 3, dtype=np.int32))
+    mesh.update(calc_edges=True)
+    for material in slots:
+        mesh.materials.append(materials[material] if material is not None else None)
+    mesh.polygons.foreach_set('material_index', np.concatenate(face_materials))
+    for n in uv_sets:
+        layer = mesh.uv_layers.new(name="UVMap" if n == 0 else f"UVMap.{n:03d}")
+        layer.data.foreach_set('uv', np.concatenate(uvs[n])[loops].ravel())
+    if with_normals:
+        mesh.polygons.foreach_set('use_smooth', np.ones(len(mesh.polygons), dtype=bool))
+        mesh.normals_split_custom_set_from_vertices(np.concatenate(normals))
+
+    obj = bpy.data.objects.new(node.get('name') or mesh.name, mesh)
+    created.append(obj)
+    collection.objects.link(obj)
+    obj.parent = armature
+    for name in group_names:
+        obj.vertex_groups.new(name=name)
+    if weights:
+        _assign_weights(obj, np.concatenate(weights).astype(np.float64))
+    modifier = obj.modifiers.new("Armature", 'ARMATURE')
+    modifier.object = armature
+
+    if target_count:
+        names = source.get('extras', {}).get('targetNames') or []
+        values = source.get('weights') or []
+        obj.shape_key_add(name="Basis", from_mix=False)
+        for t in range(target_count):
+            kb = obj.shape_key_add(name=names[t] if t < len(names) else f"target_{t}", from_mix=False)
+            kb.points.foreach_set('co', (co + np.concatenate(deltas[t])).ravel())
+            if t < len(values):
+                kb.value = values[t]
+    return obj
+
+def _fast_import_glb(context, filepath):
+    """Import a Ready Player Me GLB without the glTF importer.
+
+    Reads the file through ``rpm_glb`` and builds the armature, meshes,
+    shape keys, vertex groups and materials directly, leaving the new
+    objects selected with the armature active, as ``import_scene.gltf``
+    does. Returns False (having removed anything it created) when the file
+    uses features it does not handle, so the caller can fall back.
+    """
+    created = []
+    try:
+        with rpm_glb.GlbFile(filepath) as glb:
+            rpm_glb.check_supported(glb.gltf)
+            collection = context.view_layer.active_layer_collection.collection
+            images = _glb_images(glb, created)
+            materials = [
+                _glb_material(glb, i, images, created) for i in range(len(glb.gltf.get('materials', [])))
+            ]
+            armature, group_names = _glb_armature(context, glb, collection, created)
+            meshes = [
+                _glb_mesh(glb, i, armature, group_names, materials, collection, created)
+                for i, node in enumerate(glb.gltf['nodes']) if 'mesh' in node
+            ]
+    except Exception as e:
+        reason = e if isinstance(e, rpm_glb.UnsupportedGlb) else f"{type(e).__name__}: {e}"
+        print(f"RPM: Fast GLB loader skipped {os.path.basename(filepath)} ({reason})")
+        bpy.data.batch_remove(created)
+        return False
+    for obj in [armature] + meshes:
+        obj.select_set(True)
+    context.view_layer.objects.active = armature
+    return True
+
+def _use_fast_glb_loader():
+    addon = bpy.context.preferences.addons.get(__name__)
+    return bool(addon and addon.preferences.fast_glb_loader)
+
+def _import_counts(objects):
+    """Size of an imported avatar, for the import trace."""
+    meshes = [obj.data for obj in objects if obj.type == 'MESH']
+    materials = {m for mesh in meshes for m in mesh.materials if m is not None}
+    return {
+        'meshes': len(meshes),
+        'vertices': sum(len(mesh.vertices) for mesh in meshes),
+        'shape_keys': sum(len(mesh.shape_keys.key_blocks) for mesh in meshes if mesh.shape_keys),
+        'materials': len(materials),
+    }
+
+def _get_trace_log_path():
+    """Import trace log: RPM_TRACE_LOG, else the extension's user directory."""
+    path = os.environ.get(rpm_trace.ENV_LOG)
+    if path:
+        return path
+    return os.path.join(
+        bpy.utils.extension_path_user(__package__, path="traces", create=True), rpm_trace.LOG_NAME
+    )
+
+def _finish_trace(operator, trace):
+    """Report an import's stage timings and append them to the trace log."""
+    summary = trace.summary()
+    print(f"RPM: {trace.avatar_id}: {summary}")
+    operator.report({'INFO'}, summary)
+    addon = bpy.context.preferences.addons.get(__name__)
+    if not os.environ.get(rpm_trace.ENV_LOG) and not (addon and addon.preferences.trace_imports):
+        return
+    try:
+        rpm_trace.append_record(_get_trace_log_path(), trace.as_record())
+    except OSError as e:
+        print(f"RPM: Could not write import trace: {e}")
+
+def _imported_objects(context, armature):
+    """The avatar's objects after post-processing: the armature and its children."""
+    if armature is None:
+        return list(context.selected_objects)
+    return [armature] + list(armature.children_recursive)
+
+def _write_cached_avatar(cache, key, objects, avatar_id):
+    """Save post-processed avatar objects (and their data) to the processed cache."""
+    written = cache.temp_path(key)
+    try:
+        bpy.data.libraries.write(written, set(objects), fake_user=False, compress=False)
+        cache.store(key, written, avatar_id)
+    except Exception as e:
+        print(f"RPM: Could not cache processed avatar: {e}")
+        try:
+            os.remove(written)
+        except OSError:
+            pass
+
+def _append_cached_avatar(context, path):
+    """Append a processed avatar from the cache, selected with its armature active."""
+    with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+        data_to.objects = list(data_from.objects)
+    objects = [obj for obj in data_to.objects if obj is not None]
+    armature = next((obj for obj in objects if obj.type == 'ARMATURE'), None)
+    if armature:
+        # The file also holds objects the avatar only references, such as
+        # the glTF importer's bone shapes, which were never in the scene
+        objects = [armature] + list(armature.children_recursive)
+    collection = context.view_layer.active_layer_collection.collection
+    for obj in objects:
+        collection.objects.link(obj)
+        obj.select_set(True)
+    if armature:
+        context.view_layer.objects.active = armature
+    return objects
+
 def _install_pywebview():
     """No-op: pywebview is bundled with the extension as wheels."""
     # Wheels are automatically installed by Blender when extension is installed
@@ -113,6 +839,293 @@ def _install_pywebview():
 
 PYWEBVIEW_OK = False
 preview_col = None
+glb_cache = None
+
+def _get_glb_cache():
+    """Return the shared GLB cache configured from addon preferences, or None."""
+    global glb_cache
+    addon = bpy.context.preferences.addons.get(__name__)
+    if not addon or not addon.preferences.use_glb_cache:
+        return None
+    prefs = addon.preferences
+    if glb_cache is None:
+        root = bpy.utils.extension_path_user(__package__, path="glb_cache", create=True)
+        glb_cache = rpm_cache.GlbCache(root)
+    glb_cache.max_bytes = prefs.glb_cache_max_mb * 1024 * 1024
+    glb_cache.revalidate_after = prefs.glb_cache_revalidate_hours * 3600
+    return glb_cache
+
+blend_cache = None
+
+def _get_blend_cache():
+    """Return the processed avatar cache configured from addon preferences, or None."""
+    global blend_cache
+    addon = bpy.context.preferences.addons.get(__name__)
+    if not addon or not addon.preferences.use_blend_cache:
+        return None
+    if blend_cache is None:
+        root = bpy.utils.extension_path_user(__package__, path="blend_cache", create=True)
+        blend_cache = rpm_blend_cache.BlendCache(root)
+    blend_cache.max_bytes = addon.preferences.blend_cache_max_mb * 1024 * 1024
+    return blend_cache
+
+import_queue = None
+cli_command = None
+
+def _queue_import(options):
+    """Add a UI import request to the session's batch import queue."""
+    global import_queue
+    prefs = bpy.context.preferences.addons[__name__].preferences
+    if import_queue is None:
+        import_queue = rpm_import_queue.ImportQueue(prefs.import_workers)
+    elif import_queue.max_workers != prefs.import_workers and not import_queue.has_pending():
+        # No download is running, so the pool can be rebuilt for the changed
+        # preference; finished items stay until they have been reported
+        resized = rpm_import_queue.ImportQueue(prefs.import_workers)
+        resized.items = import_queue.items
+        import_queue.shutdown()
+        import_queue = resized
+    kwargs = _import_kwargs(options)
+    url = _build_model_url(options['url'], **kwargs)
+    filename = os.path.join(_get_download_dir(), os.path.basename(url).split("?")[0])
+    item_id = options.get('avatar_id') or url
+    item = import_queue.add(rpm_import_queue.ImportItem(
+        item_id, url, filename, kwargs, cache=_get_glb_cache()
+    ))
+    if not bpy.app.timers.is_registered(_process_import_queue):
+        bpy.app.timers.register(_process_import_queue, first_interval=0.1, persistent=True)
+    return item
+
+def _process_import_queue():
+    """Timer: report progress and import at most one finished download per tick."""
+    queue = import_queue
+    if queue is None:
+        return None
+    for item in queue.poll_changes():
+        _notify_ui({'type': 'import_status', **item.as_status()})
+
+    item = queue.next_ready()
+    if item:
+        item.status = rpm_import_queue.IMPORTING
+        _notify_ui({'type': 'import_status', **item.as_status()})
+        try:
+            result = _run_queued_import(item)
+            item.status = rpm_import_queue.DONE if 'FINISHED' in result else rpm_import_queue.FAILED
+        except Exception as e:
+            print(f"RPM: Batch import of {item.item_id} failed: {e}")
+            item.error = e
+            item.status = rpm_import_queue.FAILED
+        print(f"RPM: Batch import {item.item_id}: {item.status}")
+        for changed in queue.poll_changes():
+            _notify_ui({'type': 'import_status', **changed.as_status()})
+
+    queue.prune()
+    return 0.1 if queue.has_pending() else None
+
+def _run_queued_import(item):
+    # Timers run without a window in context; import operators need one
+    with bpy.context.temp_override(**_window_override()):
+        return bpy.ops.rpm.native_import(
+            'EXEC_DEFAULT', model_url=item.job.url, filepath=item.path,
+            download_seconds=item.download_seconds or 0.0, **item.options
+        )
+
+def _cli_batch_import(argv):
+    """``blender -b --command rpm_import``: import the avatars of a manifest.
+
+    See ``rpm_batch`` for the manifest format. Returns the process exit code:
+    0 when every avatar was imported and saved, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog='blender -b --command rpm_import',
+        description='Import Ready Player Me avatars listed in a JSON manifest.',
+    )
+    parser.add_argument('manifest', help='JSON manifest of avatar ids or URLs')
+    parser.add_argument('--output-dir', default='.', help='where .blend files and the report go')
+    parser.add_argument('--combined', metavar='FILE',
+                        help='write all avatars into this one .blend instead of one file each')
+    parser.add_argument('--report', help=f'JSON report path (default: <output-dir>/{rpm_batch.REPORT_NAME})')
+    parser.add_argument('--workers', type=int, help='parallel downloads (default: the preference)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='do not use the GLB download or processed avatar caches')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='split the manifest across this many background Blender processes')
+    parser.add_argument('--retries', type=int, default=1,
+                        help='with --processes: times to retry avatars of failed workers')
+    parser.add_argument('--worker-timeout', type=float,
+                        help='with --processes: seconds before a worker is stopped')
+    args = parser.parse_args(argv)
+
+    try:
+        entries = rpm_batch.load_manifest(args.manifest)
+    except (OSError, rpm_batch.ManifestError) as e:
+        print(f"RPM: Cannot read manifest: {e}")
+        return 1
+    output_dir = os.path.abspath(args.output_dir)
+    download_dir = os.path.join(output_dir, "gltf-DL")
+    os.makedirs(download_dir, exist_ok=True)
+    report_path = args.report or os.path.join(output_dir, rpm_batch.REPORT_NAME)
+    combined = os.path.join(output_dir, args.combined) if args.combined else None
+    addon = bpy.context.preferences.addons.get(__name__)
+    workers = args.workers or (addon.preferences.import_workers if addon else 3)
+    if args.processes > 1:
+        return _cli_batch_pool(args, entries, output_dir, report_path, combined, workers)
+
+    started = time.perf_counter()
+    queue = rpm_import_queue.ImportQueue(max(1, workers))
+    cache = None if args.no_cache else _get_glb_cache()
+    by_item = {}
+    for entry in entries:
+        url = _build_model_url(entry.url, **entry.options)
+        item = queue.add(rpm_import_queue.ImportItem(
+            entry.name, url, os.path.join(download_dir, f"{entry.name}.glb"), entry.options, cache=cache
+        ))
+        by_item[item] = entry
+    print(f"RPM: Batch importing {len(entries)} avatars ({workers} parallel downloads)")
+
+    if combined:
+        bpy.ops.wm.read_homefile(use_empty=True)
+    try:
+        while queue.has_pending():
+            item = queue.next_ready()
+            if item is None:
+                time.sleep(0.02)
+                continue
+            entry = by_item[item]
+            entry.timings['download'] = item.download_seconds
+            item.status = rpm_import_queue.IMPORTING
+            try:
+                _batch_import_entry(entry, item.path, combined is None, output_dir, not args.no_cache)
+                item.status = rpm_import_queue.DONE
+            except Exception as e:
+                print(f"RPM: Batch import of {entry.name} failed: {e}")
+                entry.error = e
+                item.status = rpm_import_queue.FAILED
+            entry.status = item.status
+            print(f"RPM: Batch import {entry.name}: {entry.status}")
+    finally:
+        queue.shutdown()
+
+    for item, entry in by_item.items():
+        if entry.status == 'queued':
+            entry.status = item.status
+            entry.error = item.error
+            entry.timings['download'] = item.download_seconds or 0.0
+    summary = {'workers': workers, 'mode': 'combined' if combined else 'per_avatar'}
+    if combined and any(e.status == rpm_import_queue.DONE for e in entries):
+        save_started = time.perf_counter()
+        bpy.ops.wm.save_as_mainfile(filepath=combined, check_existing=False)
+        summary['combined'] = combined
+        summary['save_seconds'] = round(time.perf_counter() - save_started, 4)
+        for entry in entries:
+            if entry.status == rpm_import_queue.DONE:
+                entry.output = combined
+    wall = time.perf_counter() - started
+    done = sum(1 for e in entries if e.status == rpm_import_queue.DONE)
+    summary['wall_seconds'] = round(wall, 4)
+    summary['avatars_per_minute'] = round(done * 60.0 / wall, 2) if wall else 0.0
+    report = rpm_batch.write_report(report_path, entries, **summary)
+    print(
+        f"RPM: Batch import finished: {report['done']} done, {report['failed']} failed "
+        f"in {summary['wall_seconds']:.1f}s; report at {report_path}"
+    )
+    return 0 if report['failed'] == 0 else 1
+
+def _cli_batch_pool(args, entries, output_dir, report_path, combined, workers):
+    """Coordinate a batch across ``args.processes`` background Blender workers."""
+    # Workers share the output directory; the GLB cache index is not safe to
+    # share between processes, so they download directly
+    pool = rpm_batch.WorkerPool(
+        [bpy.app.binary_path, '-b', '--command', 'rpm_import'],
+        args.processes, output_dir, retries=args.retries, timeout=args.worker_timeout,
+        worker_args=['--workers', str(workers), '--no-cache'],
+    )
+    print(f"RPM: Batch importing {len(entries)} avatars in {pool.processes} processes")
+    wall = pool.run(entries)
+    done = sum(1 for e in entries if e.status == rpm_import_queue.DONE)
+    summary = {
+        'mode': 'processes',
+        'processes': pool.processes,
+        'workers': workers,
+        'attempts': pool.attempts,
+        'runs': pool.runs,
+        'wall_seconds': round(wall, 4),
+        'avatars_per_minute': round(done * 60.0 / wall, 2) if wall else 0.0,
+    }
+    if combined and done:
+        _write_linked_index(combined, entries)
+        summary['combined'] = combined
+    report = rpm_batch.write_report(report_path, entries, **summary)
+    print(
+        f"RPM: Batch import finished: {report['done']} done, {report['failed']} failed "
+        f"in {wall:.1f}s with {pool.processes} processes "
+        f"({summary['avatars_per_minute']:.1f} avatars/min); report at {report_path}"
+    )
+    return 0 if report['failed'] == 0 else 1
+
+def _write_linked_index(filepath, entries):
+    """Write a .blend that links each imported avatar's collection from its own file."""
+    bpy.ops.wm.read_homefile(use_empty=True)
+    scene = bpy.context.scene
+    for entry in entries:
+        if entry.status != rpm_import_queue.DONE or not entry.output:
+            continue
+        with bpy.data.libraries.load(entry.output, link=True) as (data_from, data_to):
+            data_to.collections = [name for name in data_from.collections if name == entry.name]
+        for collection in data_to.collections:
+            scene.collection.children.link(collection)
+    bpy.ops.wm.save_as_mainfile(filepath=filepath, check_existing=False, relative_remap=True)
+
+def _batch_import_entry(entry, path, save_each, output_dir, use_cache=True):
+    """Import one downloaded avatar into its own collection (and .blend)."""
+    if save_each:
+        bpy.ops.wm.read_homefile(use_empty=True)
+    context = bpy.context
+    collection = bpy.data.collections.new(entry.name)
+    context.scene.collection.children.link(collection)
+    context.view_layer.active_layer_collection = \
+        context.view_layer.layer_collection.children[collection.name]
+
+    import_started = time.perf_counter()
+    result = bpy.ops.rpm.native_import(
+        'EXEC_DEFAULT', model_url=entry.url, filepath=path,
+        download_seconds=entry.timings.get('download') or 0.0, use_cache=use_cache,
+        **entry.options
+    )
+    entry.timings['import'] = time.perf_counter() - import_started
+    if 'FINISHED' not in result:
+        raise RuntimeError(f"import returned {result}")
+    if save_each:
+        save_started = time.perf_counter()
+        entry.output = os.path.join(output_dir, f"{entry.name}.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=entry.output, check_existing=False)
+        entry.timings['save'] = time.perf_counter() - save_started
+
+class RPM_OT_ClearGlbCache(bpy.types.Operator):
+    """Delete all cached GLB downloads"""
+    bl_idname = "rpm.clear_glb_cache"
+    bl_label = "Clear GLB Cache"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        cache = _get_glb_cache()
+        if cache:
+            cache.clear()
+        self.report({'INFO'}, "Ready Player Me GLB cache cleared")
+        return {'FINISHED'}
+
+class RPM_OT_ClearBlendCache(bpy.types.Operator):
+    """Delete all cached processed avatars"""
+    bl_idname = "rpm.clear_blend_cache"
+    bl_label = "Clear Processed Cache"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        cache = _get_blend_cache()
+        if cache:
+            cache.clear()
+        self.report({'INFO'}, "Ready Player Me processed avatar cache cleared")
+        return {'FINISHED'}
 
 class RPM_OT_PywebviewMissingDialog(bpy.types.Operator):
     """Show dialog when pywebview is missing"""
@@ -220,6 +1233,142 @@ class RPM_OT_PywebviewMissingDialog(bpy.types.Operator):
             text="If issues persist, reinstall the extension from Preferences."
         )
 
+ui_session = None
+
+def _ui_state(prefs):
+    """Per-open state sent to a warm UI helper with the show message."""
+    return {
+        'email': prefs.login_email or '',
+        'password': prefs.login_password or '',
+        'dev_mode': bool(prefs.dev_mode),
+    }
+
+def _window_override():
+    """Context override for running window-bound operators from a timer."""
+    wm = bpy.context.window_manager
+    window = wm.windows[0] if wm.windows else None
+    area = None
+    if window:
+        area = next((a for a in window.screen.areas if a.type == 'VIEW_3D'), None)
+    return {'window': window, 'area': area}
+
+def _poll_ui_session():
+    """Timer: dispatch UI messages while the helper process is alive."""
+    session = ui_session
+    if session is None:
+        return None
+    if not session.channel.messages.empty():
+        _dispatch_ui_messages(bpy.context, session)
+    if session.finished():
+        # Pick up anything sent right before the helper exited
+        _dispatch_ui_messages(bpy.context, session)
+        _close_ui_session()
+        return None
+    return 0.05
+
+def _close_ui_session():
+    global ui_session
+    session, ui_session = ui_session, None
+    if session is None:
+        return
+    session.shutdown()
+    print("RPM: UI webview closed")
+
+def _notify_ui(message):
+    """Send a message to the UI helper, if one is running."""
+    if ui_session:
+        ui_session.channel.send(message)
+
+def _dispatch_ui_messages(context, session):
+    handlers = {
+        'download': _ui_on_download,
+        'import_batch': _ui_on_import_batch,
+        'save_credentials': _ui_on_save_credentials,
+        'logout': _ui_on_logout,
+        'avatar_delta': _ui_on_avatar_delta,
+        'ui_ready': _ui_on_ready,
+        'window_hidden': _ui_on_hidden,
+    }
+    while True:
+        msg = session.channel.get_nowait()
+        if msg is None:
+            return
+        handler = handlers.get(msg.get('type'))
+        if not handler:
+            print(f"RPM: Ignoring unknown UI message {msg.get('type')!r}")
+            continue
+        try:
+            handler(context, session, msg)
+        except Exception as e:
+            print(f"RPM: Failed to process {msg.get('type')} message: {e}")
+
+def _ui_on_download(context, session, msg):
+    options = msg.get('options') or {}
+    # Trigger import
+    url = options.get('url', '')
+    if url:
+        with context.temp_override(**_window_override()):
+            bpy.ops.rpm.native_import('INVOKE_DEFAULT', model_url=url, **_import_kwargs(options))
+        print(f"RPM: Imported {options.get('avatar_id', 'avatar')}")
+
+def _ui_on_import_batch(context, session, msg):
+    queued = [
+        _queue_import(options) for options in msg.get('items') or []
+        if options.get('url')
+    ]
+    print(f"RPM: Queued {len(queued)} avatars for batch import")
+
+def _ui_on_save_credentials(context, session, msg):
+    p = context.preferences.addons[__name__].preferences
+    p.login_email = msg.get('email', '') or ''
+    p.login_password = msg.get('password', '') or ''
+    print('RPM: Credentials updated in AddonPreferences')
+    _mark_prefs_dirty()
+
+def _ui_on_logout(context, session, msg):
+    p = context.preferences.addons[__name__].preferences
+    p.login_email = ''
+    p.login_password = ''
+    # The helper clears the avatar library itself
+    print('RPM: Logged out - cleared credentials and avatars')
+    _tag_preferences_redraw()
+    _mark_prefs_dirty()
+
+def _ui_on_avatar_delta(context, session, msg):
+    """The helper synced the avatar library; fetch thumbnails for what changed."""
+    delta = {key: msg.get(key) or [] for key in ('added', 'removed', 'changed')}
+    if rpm_library.delta_is_empty(delta):
+        return
+    print(
+        f"RPM: Avatar library updated: +{len(delta['added'])} "
+        f"-{len(delta['removed'])} ~{len(delta['changed'])}"
+    )
+    service = _get_thumbnail_service()
+    for avatar in delta['changed']:
+        avatar_id = avatar.get('avatar_id') or ''
+        service.invalidate(avatar_id)
+        key = f"rpm_{avatar_id}"
+        # del (not pop) so the collection releases the old preview image
+        if preview_col is not None and key in preview_col:
+            del preview_col[key]
+    # Only new or changed thumbnails need fetching
+    service.prefetch(
+        (a.get('avatar_id') or '', a.get('thumb_url') or '')
+        for a in delta['added'] + delta['changed']
+    )
+    if not bpy.app.timers.is_registered(_poll_thumbnails):
+        bpy.app.timers.register(_poll_thumbnails, first_interval=0.25, persistent=True)
+    _tag_preferences_redraw()
+
+def _ui_on_ready(context, session, msg):
+    ready = session.mark_ready()
+    if ready:
+        kind, elapsed = ready
+        print(f"RPM: UI ready in {elapsed * 1000:.0f} ms ({kind} open)")
+
+def _ui_on_hidden(context, session, msg):
+    print("RPM: UI webview hidden (helper kept warm)")
+
 class RPM_OT_OpenUIWebview(bpy.types.Operator):
     """Open Ready Player Me UI in webview"""
     bl_idname = "rpm.webviewui"
@@ -241,10 +1390,6 @@ class RPM_OT_OpenUIWebview(bpy.types.Operator):
             cls.bl_description = "Import Ready Player Me avatars"
         return is_available
 
-    _timer = None
-    _webview_process = None
-    _ui_window = None
-
     def invoke(self, context, event):
         """Handle invocation - show dialog if pywebview is missing"""
         if not _is_pywebview_available():
@@ -257,132 +1402,8 @@ class RPM_OT_OpenUIWebview(bpy.types.Operator):
             return {'CANCELLED'}
         return self.execute(context)
 
-    def modal(self, context, event):
-        if event.type == 'TIMER':
-            # Check if webview is still running
-            if self._webview_process and self._webview_process.poll() is not None:
-                self.cancel(context)
-                return {'CANCELLED'}
-
-            # Check for download requests
-            addon_dir = os.path.dirname(__file__)
-            req_file = os.path.join(addon_dir, 'rpm_download_request.json')
-            if os.path.exists(req_file):
-                try:
-                    with open(req_file, encoding='utf-8') as f:
-                        options = json.load(f)
-                    os.remove(req_file)
-
-                    # Trigger import
-                    url = options.get('url', '')
-                    if url:
-                        bpy.ops.rpm.native_import(
-                            'EXEC_DEFAULT',
-                            model_url=url,
-                            quality=options.get('quality', 'low'),
-                            t_pose=options.get('t_pose', True),
-                            arkit_shapes=options.get('arkit_shapes', True),
-                            enable_texture_atlas=options.get('texture_atlas', True),
-                            texture_atlas_size=options.get('texture_atlas_size', '1024')
-                        )
-                        print(f"RPM: Imported {options.get('avatar_id', 'avatar')}")
-                except Exception as e:
-                    print(f"RPM: Error processing download request: {e}")
-
-            # Check for prefs update requests (credentials)
-            prefs_req = os.path.join(addon_dir, 'rpm_prefs_request.json')
-            if os.path.exists(prefs_req):
-                try:
-                    with open(prefs_req, encoding='utf-8') as f:
-                        data = json.load(f)
-                    os.remove(prefs_req)
-                    if isinstance(data, dict) and data.get('type') == 'save_credentials':
-                        p = context.preferences.addons[__name__].preferences
-                        p.login_email = data.get('email', '') or ''
-                        p.login_password = data.get('password', '') or ''
-                        print('RPM: Credentials updated in AddonPreferences')
-                        try:
-                            bpy.ops.wm.save_userpref()
-                            print('RPM: User preferences saved')
-                        except Exception as se:
-                            print('RPM: Could not save user preferences', se)
-                    elif isinstance(data, dict) and data.get('type') == 'logout':
-                        p = context.preferences.addons[__name__].preferences
-                        p.login_email = ''
-                        p.login_password = ''
-                        p.scraped_avatars_json = ''
-                        p.avatar_items.clear()
-                        print('RPM: Logged out - cleared credentials and avatars')
-                        # Clear the shared avatars temp file if it exists
-                        if (getattr(self, '_avatars_tmp_path', None)
-                                and os.path.exists(self._avatars_tmp_path)):
-                            try:
-                                with open(self._avatars_tmp_path, 'w', encoding='utf-8') as f:
-                                    json.dump([], f)
-                            except Exception as e:
-                                print(f'RPM: Error clearing avatars temp file: {e}')
-                        try:
-                            bpy.ops.wm.save_userpref()
-                            print('RPM: User preferences saved')
-                        except Exception as se:
-                            print('RPM: Could not save user preferences', se)
-                except Exception as e:
-                    print('RPM: Failed to process prefs request', e)
-
-            # Check for avatar updates from UI helper
-            avatar_upd = os.path.join(addon_dir, 'rpm_avatar_update.json')
-            if os.path.exists(avatar_upd):
-                try:
-                    with open(avatar_upd, encoding='utf-8') as f:
-                        data = json.load(f)
-                    os.remove(avatar_upd)
-                    if isinstance(data, dict) and data.get('type') == 'avatar_update':
-                        items = data.get('items') or []
-                        p = context.preferences.addons[__name__].preferences
-                        p.avatar_items.clear()
-                        for it in items:
-                            ni = p.avatar_items.add()
-                            ni.glb_url = it.get('glb_url') or ''
-                            ni.thumb_url = it.get('thumb_url') or ''
-                            ni.avatar_id = it.get('avatar_id') or ''
-                        try:
-                            p.scraped_avatars_json = json.dumps(items)
-                        except Exception:
-                            p.scraped_avatars_json = ''
-                        print(
-                            f'RPM: Updated avatar_items in AddonPreferences: '
-                            f'{len(p.avatar_items)}'
-                        )
-                        # Maintain shared avatars file if exists
-                        try:
-                            if getattr(self, '_avatars_tmp_path', None):
-                                tmp_items = []
-                                for it in p.avatar_items:
-                                    tmp_items.append({
-                                        'glb_url': it.glb_url,
-                                        'thumb_url': it.thumb_url,
-                                        'avatar_id': it.avatar_id
-                                    })
-                                with open(self._avatars_tmp_path, 'w', encoding='utf-8') as f:
-                                    json.dump(tmp_items, f)
-                        except Exception as ee:
-                            print('RPM: Failed to update avatars temp file', ee)
-                        # Persist changes to user preferences
-                        try:
-                            bpy.ops.wm.save_userpref()
-                            print('RPM: User preferences saved')
-                        except Exception as se:
-                            print('RPM: Could not save user preferences', se)
-                except Exception as e:
-                    print('RPM: Failed to process avatar update', e)
-
-        if event.type == 'ESC':
-            self.cancel(context)
-            return {'CANCELLED'}
-
-        return {'PASS_THROUGH'}
-
     def execute(self, context):
+        global ui_session
         # Check pywebview - if called directly via Python
         if not _is_pywebview_available():
             self.report(
@@ -397,6 +1418,14 @@ class RPM_OT_OpenUIWebview(bpy.types.Operator):
             )
             return {'CANCELLED'}
 
+        prefs = context.preferences.addons[__name__].preferences
+
+        # Warm path: the helper from an earlier open is still running hidden
+        if ui_session and ui_session.alive():
+            ui_session.show(_ui_state(prefs))
+            print("RPM: UI webview shown")
+            return {'FINISHED'}
+
         try:
             # Get HTML path
             addon_dir = os.path.dirname(__file__)
@@ -406,27 +1435,6 @@ class RPM_OT_OpenUIWebview(bpy.types.Operator):
                 self.report({'ERROR'}, f"UI file not found: {html_path}")
                 return {'CANCELLED'}
 
-            prefs = context.preferences.addons[__name__].preferences
-
-            # Prepare avatars temp file for UI to read current list
-            try:
-                fd, avatars_tmp = tempfile.mkstemp(
-                    prefix='rpm_avatars_', suffix='.json'
-                )
-                os.close(fd)
-                self._avatars_tmp_path = avatars_tmp
-                items = []
-                for it in prefs.avatar_items:
-                    items.append({
-                        'glb_url': it.glb_url,
-                        'thumb_url': it.thumb_url,
-                        'avatar_id': it.avatar_id
-                    })
-                with open(avatars_tmp, 'w', encoding='utf-8') as f:
-                    json.dump(items, f)
-            except Exception as e:
-                print(f"RPM: Failed to prepare avatars temp file: {e}")
-
             # Start webview in subprocess using Blender's Python
             helper_path = os.path.join(addon_dir, 'rpm_ui_webview.py')
             # Use Blender's Python executable which has access to bundled wheels
@@ -446,7 +1454,9 @@ class RPM_OT_OpenUIWebview(bpy.types.Operator):
             # Pass prefs and defaults via env
             env['RPM_PREFS_EMAIL'] = prefs.login_email or ''
             env['RPM_PREFS_PASSWORD'] = prefs.login_password or ''
-            env['RPM_DEV_MODE'] = '1' if prefs.dev_mode else '0'
+            # Outside dev mode an RPM_DEV_MODE already in the environment
+            # (e.g. 'minimized') picks the scraper's window mode
+            env['RPM_DEV_MODE'] = '1' if prefs.dev_mode else os.environ.get('RPM_DEV_MODE', '0')
             # UI defaults: use ReadyPlayerMeImporter operator defaults
             # (single source of truth)
             dq, dt, da, de, ds = 'high', '1', '1', '1', '1024'
@@ -455,72 +1465,77 @@ class RPM_OT_OpenUIWebview(bpy.types.Operator):
             env['RPM_DEFAULT_ARKIT'] = da
             env['RPM_DEFAULT_ATLAS'] = de
             env['RPM_DEFAULT_ATLAS_SIZE'] = ds
-            if getattr(self, '_avatars_tmp_path', None):
-                env['RPM_AVATARS_PATH'] = self._avatars_tmp_path
-
-            self._webview_process = subprocess.Popen(
-                [cmd, helper_path],
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                bufsize=1,
-                universal_newlines=True
+            # The helper reads and syncs the same avatar library
+            env[rpm_library.ENV_LIBRARY] = _get_library_path()
+            env[rpm_avatar_api.ENV_SESSION] = os.path.join(
+                os.path.dirname(_get_library_path()), rpm_avatar_api.SESSION_NAME
+            )
+            # Cookies and local storage of the scraper persist between refreshes
+            env['RPM_WEBVIEW_STORAGE'] = bpy.utils.extension_path_user(
+                __package__, path="webview", create=True
             )
 
-            # Stream child stdout/stderr to Blender console
-            def _forward_stream(stream, prefix):
-                try:
-                    for line in iter(stream.readline, ''):
-                        try:
-                            print(f"{prefix}{line.rstrip()}")
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-            try:
-                t_out = threading.Thread(
-                    target=_forward_stream,
-                    args=(self._webview_process.stdout, 'RPM UI> '),
-                    daemon=True
-                )
-                t_err = threading.Thread(
-                    target=_forward_stream,
-                    args=(self._webview_process.stderr, 'RPM UI ERR> '),
-                    daemon=True
-                )
-                t_out.start()
-                t_err.start()
-            except Exception:
-                pass
-
-            # Start modal timer
-            wm = context.window_manager
-            self._timer = wm.event_timer_add(0.1, window=context.window)
-            wm.modal_handler_add(self)
+            # The helper stays alive (hidden) between opens; requests from
+            # the UI arrive over its loopback message channel
+            ui_session = rpm_ui_session.UIHelperSession(cmd, helper_path, env)
+            if not bpy.app.timers.is_registered(_poll_ui_session):
+                bpy.app.timers.register(_poll_ui_session, first_interval=0.05, persistent=True)
 
             print("RPM: UI webview started")
-            return {'RUNNING_MODAL'}
+            return {'FINISHED'}
 
         except Exception as e:
             self.report({'ERROR'}, f"Failed to start UI webview: {e}")
             return {'CANCELLED'}
 
-    def cancel(self, context):
-        wm = context.window_manager
-        if self._timer:
-            wm.event_timer_remove(self._timer)
-        if self._webview_process:
-            try:
-                self._webview_process.terminate()
-            except Exception:
-                pass
-        print("RPM: UI webview closed")
-        try:
-            if (getattr(self, '_avatars_tmp_path', None)
-                    and os.path.exists(self._avatars_tmp_path)):
-                os.remove(self._avatars_tmp_path)
-        except Exception:
-            pass
+def _get_download_dir():
+    """gltf-DL folder next to the .blend, falling back to ~/Downloads."""
+    original_dir_path = os.path.join(os.path.dirname(bpy.path.abspath(bpy.data.filepath)), "gltf-DL")
+
+    downloads_path = str(Path.home() / "Downloads")
+    fallback_dir_path = os.path.join(downloads_path, "gltf-DL")
+
+    try:
+        os.makedirs(original_dir_path, exist_ok=True)
+        return original_dir_path
+    except PermissionError:
+        print(
+            "Permission denied for original directory, "
+            "using fallback directory in Downloads."
+        )
+        os.makedirs(fallback_dir_path, exist_ok=True)
+        return fallback_dir_path
+
+def _build_model_url(model_url, quality, t_pose, arkit_shapes,
+                     enable_texture_atlas, texture_atlas_size):
+    """Apply the import options to the model URL's query string."""
+    parsed = urllib.parse.urlparse(model_url)
+    qs = dict(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True))
+    qs['quality'] = quality
+    if t_pose:
+        qs['pose'] = 'T'
+    else:
+        qs.pop('pose', None)
+    if arkit_shapes:
+        qs['morphTargets'] = 'mouthSmile,ARKit'
+    else:
+        qs.pop('morphTargets', None)
+    if enable_texture_atlas and texture_atlas_size != 'none':
+        qs['textureAtlas'] = texture_atlas_size
+    else:
+        qs.pop('textureAtlas', None)
+    new_query = urllib.parse.urlencode(qs, doseq=True)
+    return urllib.parse.urlunparse(parsed._replace(query=new_query))
+
+def _import_kwargs(options):
+    """Map a UI import request onto rpm.native_import properties."""
+    return {
+        'quality': options.get('quality', 'low'),
+        't_pose': options.get('t_pose', True),
+        'arkit_shapes': options.get('arkit_shapes', True),
+        'enable_texture_atlas': options.get('texture_atlas', True),
+        'texture_atlas_size': options.get('texture_atlas_size', '1024'),
+    }
 
 class ReadyPlayerMeImporter(bpy.types.Operator):
     """RPM Native Import"""
@@ -581,121 +1596,192 @@ class ReadyPlayerMeImporter(bpy.types.Operator):
         default='1024'
     )
 
+    filepath: bpy.props.StringProperty(
+        name="File Path",
+        description="Already downloaded GLB to import instead of downloading model_url",
+        default="",
+        options={'HIDDEN', 'SKIP_SAVE'}
+    )
+
+    download_seconds: bpy.props.FloatProperty(
+        name="Download Time",
+        description="Time spent downloading filepath, for the import trace",
+        default=0.0,
+        options={'HIDDEN', 'SKIP_SAVE'}
+    )
+
+    use_cache: bpy.props.BoolProperty(
+        name="Use Processed Cache",
+        description="Reuse a cached post-processed copy of this GLB if there is one",
+        default=True,
+        options={'HIDDEN', 'SKIP_SAVE'}
+    )
+
+    _timer = None
+    _job = None
+    _download_started = 0.0
+
     def execute(self, context):
+        if self.filepath:
+            return self.import_model(context, self.filepath)
         # Only execute if model_url is provided
         if self.model_url:
             return self.download_and_import_model(context)
         return {'FINISHED'}
 
-    def apply_pose_as_basis(context, aobj=None):
-        if aobj is None:
-            aobj = context.active_object
-
-        if aobj.data.shape_keys:
-            act_sk = aobj.active_shape_key
-            ref_sk = aobj.data.shape_keys.reference_key
+    def invoke(self, context, event):
+        """Download on a worker thread, then import from the modal timer."""
+        if not self.model_url:
+            return {'FINISHED'}
+        url, filename = self.resolve_download(self.model_url)
+        cache = _get_glb_cache()
+        if cache:
+            cached = cache.lookup(url)
+            if cached:
+                print(f"RPM: Using cached GLB {cached}")
+                return self.import_model(context, cached)
+        self._download_started = time.perf_counter()
+        self._job = rpm_download.DownloadJob(url, filename, cache=cache).start()
 
-            act_defs = [(act_sk.data[d].co - dat.co) for d, dat in enumerate(ref_sk.data)]
+        wm = context.window_manager
+        wm.progress_begin(0, 100)
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
 
-            for sk in aobj.data.shape_keys.key_blocks:
-                if sk not in (act_sk, ref_sk):
-                    sk_defs = [(sk.data[d].co - dat.co) for d, dat in enumerate(ref_sk.data)]
-                    for d, dat in enumerate(sk.data):
-                        dat.co = ref_sk.data[d].co + act_defs[d] + sk_defs[d]
+    def modal(self, context, event):
+        job = self._job
+        if event.type == 'ESC':
+            job.cancel()
+            self._end_download(context)
+            print(f"RPM: Download cancelled {job.url}")
+            self.report({'WARNING'}, "Ready Player Me download cancelled")
+            return {'CANCELLED'}
 
-            while aobj.data.shape_keys.reference_key.name != act_sk.name:
-                bpy.ops.object.shape_key_move(type='UP')
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
 
-            for sk in aobj.data.shape_keys.key_blocks:
-                if sk != act_sk:
-                    sk.relative_key = act_sk
+        context.window_manager.progress_update(job.percent)
+        if context.workspace:
+            context.workspace.status_text_set(f"{job.status_text()}  (Esc to cancel)")
+        if not job.finished:
+            return {'PASS_THROUGH'}
 
-    def download_and_import_model(self, context):
-        original_dir_path = os.path.join(os.path.dirname(bpy.path.abspath(bpy.data.filepath)), "gltf-DL")
+        self._end_download(context)
+        if job.error:
+            print(f"Failed to download file: {job.error}")
+            self.report({'ERROR'}, f"Failed to download file: {job.error}  ||  (not all sizes + quality combinations are supported)")
+            return {'CANCELLED'}
+        self.download_seconds = time.perf_counter() - self._download_started
+        print(f"Downloaded {job.filename}")
+        return self.import_model(context, job.filename)
 
-        downloads_path = str(Path.home() / "Downloads")
-        fallback_dir_path = os.path.join(downloads_path, "gltf-DL")
+    def _end_download(self, context):
+        wm = context.window_manager
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        if context.workspace:
+            context.workspace.status_text_set(None)
 
-        try:
-            os.makedirs(original_dir_path, exist_ok=True)
-            dir_path = original_dir_path
-        except PermissionError:
-            print(
-                "Permission denied for original directory, "
-                "using fallback directory in Downloads."
-            )
-            os.makedirs(fallback_dir_path, exist_ok=True)
-            dir_path = fallback_dir_path
-
-        model_url = self.model_url
-        parsed = urllib.parse.urlparse(model_url)
-        qs = dict(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True))
-        qs['quality'] = self.quality
-        if self.t_pose:
-            qs['pose'] = 'T'
-        else:
-            qs.pop('pose', None)
-        if self.arkit_shapes:
-            qs['morphTargets'] = 'mouthSmile,ARKit'
-        else:
-            qs.pop('morphTargets', None)
-        if self.enable_texture_atlas and self.texture_atlas_size != 'none':
-            qs['textureAtlas'] = self.texture_atlas_size
-        else:
-            qs.pop('textureAtlas', None)
-        new_query = urllib.parse.urlencode(qs, doseq=True)
-        url = urllib.parse.urlunparse(parsed._replace(query=new_query))
+    def cancel(self, context):
+        if self._job:
+            self._job.cancel()
+        self._end_download(context)
+
+    def resolve_download(self, model_url):
+        """Return the download URL with import options applied and its local path."""
+        url = _build_model_url(
+            model_url, self.quality, self.t_pose, self.arkit_shapes,
+            self.enable_texture_atlas, self.texture_atlas_size
+        )
+        filename = os.path.join(_get_download_dir(), os.path.basename(url).split("?")[0])
+        return url, filename
 
-        filename = os.path.join(dir_path, os.path.basename(url).split("?")[0])
+    def download_and_import_model(self, context):
+        url, filename = self.resolve_download(self.model_url)
+        cache = _get_glb_cache()
+        started = time.perf_counter()
         try:
-            urllib.request.urlretrieve(url, filename)
+            if cache:
+                filename = cache.fetch(url)
+            else:
+                rpm_download.stream_to_file(url, filename)
+            self.download_seconds = time.perf_counter() - started
             print(f"Downloaded {filename}")
         except Exception as e:
             print(f"Failed to download file: {e}")
             self.report({'ERROR'}, f"Failed to download file: {e}  ||  (not all sizes + quality combinations are supported)")
             return {'CANCELLED'}
 
-        bpy.ops.object.select_all(action='DESELECT')
+        return self.import_model(context, filename)
 
-        bpy.ops.import_scene.gltf(filepath=filename)
+    def import_model(self, context, filename):
+        trace = rpm_trace.ImportTrace(
+            rpm_cache.avatar_id_from_url(self.model_url or filename), self.model_url
+        )
+        if self.download_seconds > 0:
+            trace.add('download', self.download_seconds)
+
+        for obj in context.selected_objects:
+            obj.select_set(False)
+
+        cache = _get_blend_cache() if self.use_cache else None
+        key = None
+        if cache:
+            with trace.stage('cache_lookup'):
+                options = {
+                    'quality': self.quality, 't_pose': self.t_pose, 'arkit_shapes': self.arkit_shapes,
+                    'enable_texture_atlas': self.enable_texture_atlas,
+                    'texture_atlas_size': self.texture_atlas_size,
+                    'fast_glb_loader': _use_fast_glb_loader(),
+                }
+                key = rpm_blend_cache.blend_key(rpm_blend_cache.file_digest(filename), options)
+                cached = cache.lookup(key)
+            if cached:
+                try:
+                    with trace.stage('cache_append'):
+                        objects = _append_cached_avatar(context, cached)
+                except Exception as e:
+                    print(f"RPM: Could not load processed avatar {cached}: {e}")
+                    cache.discard(key)
+                    objects = []
+                if objects:
+                    trace.count(**_import_counts(objects))
+                    _finish_trace(self, trace)
+                    self.mark_imported()
+                    return {'FINISHED'}
 
-        bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
-        context.view_layer.update()
+        imported = False
+        if _use_fast_glb_loader():
+            with trace.stage('fast_glb_import'):
+                imported = _fast_import_glb(context, filename)
+        if not imported:
+            with trace.stage('gltf_import'):
+                bpy.ops.import_scene.gltf(filepath=filename)
+        trace.count(**_import_counts(context.selected_objects))
 
         armatures = [obj for obj in context.selected_objects if obj.type == 'ARMATURE']
         armature = armatures[0] if armatures else None
-        armature.data.show_bone_custom_shapes = False
-
-        child_meshes = [obj for obj in armature.children if obj.type == 'MESH']
-
-        if len(child_meshes) > 1:
-            bpy.ops.object.select_all(action='DESELECT')
-            for mesh in child_meshes:
-                mesh.select_set(True)
-            context.view_layer.objects.active = child_meshes[0]
-            bpy.ops.object.join()
-
-        child_meshes = [obj for obj in armature.children if obj.type == 'MESH']
-
-        if armatures and child_meshes:
-            for mesh in child_meshes:
-                context.view_layer.objects.active = mesh
-                for modifier in mesh.modifiers:
-                    if modifier.type == 'ARMATURE' and modifier.object == armature:
-                        bpy.ops.object.modifier_apply_as_shapekey(keep_modifier=True, modifier=modifier.name)
-                        break
-                if mesh.data.shape_keys:
-                    context.object.active_shape_key_index = len(mesh.data.shape_keys.key_blocks) - 1
-                    self.apply_pose_as_basis(aobj=mesh)
-                    mesh.data.shape_keys.key_blocks[1].name = "oldBasis"
-                    mesh.data.shape_keys.key_blocks[0].name = "Basis"
-            context.view_layer.objects.active = armature
-            context.object.show_in_front = True
-            bpy.ops.object.posemode_toggle()
-            bpy.ops.pose.armature_apply(selected=False)
-
+        if armature:
+            _post_import(context, armature, trace)
+        if cache and key:
+            with trace.stage('cache_write'):
+                _write_cached_avatar(cache, key, _imported_objects(context, armature), trace.avatar_id)
+        _finish_trace(self, trace)
+        self.mark_imported()
         return {'FINISHED'}
 
+    def mark_imported(self):
+        """Record the import time in the avatar library."""
+        try:
+            avatar_id = rpm_cache.avatar_id_from_url(self.model_url)
+            if avatar_id:
+                _get_avatar_library().mark_imported(avatar_id)
+        except Exception as e:
+            print(f"RPM: Could not record import time: {e}")
+
 
 def menu_func_import(self, context):
     print(f"RPM: menu_func_import called. PYWEBVIEW_OK={PYWEBVIEW_OK}")
@@ -714,19 +1800,42 @@ def register():
     bpy.utils.register_class(ReadyPlayerMeImporter)
     bpy.utils.register_class(ReadyPlayerMePreferences)
     bpy.utils.register_class(RPM_OT_InstallDependenciesModal)
+    bpy.utils.register_class(RPM_OT_ClearGlbCache)
+    bpy.utils.register_class(RPM_OT_ClearBlendCache)
     PYWEBVIEW_OK = _is_pywebview_available()
     bpy.types.WindowManager.rpm_dep_install_running = bpy.props.BoolProperty(default=False)
     bpy.types.WindowManager.rpm_dep_install_msg = bpy.props.StringProperty(default="")
     bpy.types.TOPBAR_MT_file_import.prepend(menu_func_import)
+    global cli_command
+    cli_command = bpy.utils.register_cli_command('rpm_import', _cli_batch_import)
     global preview_col
     preview_col = previews.new()
+    # Blender exits without calling unregister; don't leave the UI helper behind
+    atexit.register(_close_ui_session)
+    atexit.register(_flush_prefs)
     # Restore preferences from config backup if they were lost on disable
     try:
         _restore_prefs_from_config()
     except Exception as e:
         print(f'RPM: Error restoring preferences: {e}')
+    try:
+        _migrate_legacy_prefs()
+    except Exception as e:
+        print(f'RPM: Error migrating avatars into the library: {e}')
 
 def unregister():
+    global prefs_saver
+    # Write pending preference changes while the classes are still registered
+    if bpy.app.timers.is_registered(_flush_prefs_timer):
+        bpy.app.timers.unregister(_flush_prefs_timer)
+    atexit.unregister(_flush_prefs)
+    _flush_prefs()
+    if prefs_saver is not None:
+        print(
+            f'RPM: Preference saves this session: {prefs_saver.writes} writes for '
+            f'{prefs_saver.requests} updates ({prefs_saver.saved_writes} saved)'
+        )
+        prefs_saver = None
     # Backup preferences before unregistering (survives disable/enable)
     try:
         _backup_prefs_to_config()
@@ -734,6 +1843,12 @@ def unregister():
         print(f'RPM: Error backing up preferences: {e}')
 
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
+    global cli_command
+    if cli_command is not None:
+        bpy.utils.unregister_cli_command(cli_command)
+        cli_command = None
+    bpy.utils.unregister_class(RPM_OT_ClearBlendCache)
+    bpy.utils.unregister_class(RPM_OT_ClearGlbCache)
     bpy.utils.unregister_class(RPM_OT_InstallDependenciesModal)
     bpy.utils.unregister_class(ReadyPlayerMePreferences)
     bpy.utils.unregister_class(ReadyPlayerMeImporter)
@@ -745,13 +1860,32 @@ def unregister():
         del bpy.types.WindowManager.rpm_dep_install_msg
     except Exception:
         pass
-    global preview_col
+    global preview_col, glb_cache, blend_cache, import_queue, thumbnail_service, avatar_library
     try:
         if preview_col:
             previews.remove(preview_col)
             preview_col = None
     except Exception:
         pass
+    glb_cache = None
+    blend_cache = None
+    if bpy.app.timers.is_registered(_process_import_queue):
+        bpy.app.timers.unregister(_process_import_queue)
+    if import_queue:
+        import_queue.shutdown()
+        import_queue = None
+    if bpy.app.timers.is_registered(_poll_ui_session):
+        bpy.app.timers.unregister(_poll_ui_session)
+    atexit.unregister(_close_ui_session)
+    _close_ui_session()
+    if bpy.app.timers.is_registered(_poll_thumbnails):
+        bpy.app.timers.unregister(_poll_thumbnails)
+    if thumbnail_service:
+        thumbnail_service.shutdown()
+        thumbnail_service = None
+    if avatar_library:
+        avatar_library.close()
+        avatar_library = None
 
 rpm_event_queue = []
 
@@ -760,28 +1894,65 @@ class RPM_AvatarItem(bpy.types.PropertyGroup):
     thumb_url: bpy.props.StringProperty(name="Thumbnail URL", default="")
     avatar_id: bpy.props.StringProperty(name="Avatar ID", default="")
 
+thumbnail_service = None
+
+def _get_thumbnail_service():
+    global thumbnail_service
+    if thumbnail_service is None:
+        root = bpy.utils.extension_path_user(__package__, path="thumbnails", create=True)
+        thumbnail_service = rpm_thumbnails.ThumbnailService(root)
+    return thumbnail_service
+
+def _tag_preferences_redraw():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'PREFERENCES':
+                area.tag_redraw()
+
+def _poll_thumbnails():
+    """Timer: redraw preferences once background thumbnail downloads finish."""
+    service = thumbnail_service
+    if service is None:
+        return None
+    if service.pop_completed():
+        _tag_preferences_redraw()
+    return 0.25 if service.busy else None
+
 def _get_preview_icon(thumb_url, key):
-    global preview_col
+    """Icon id for an avatar thumbnail, or 0 while it is still downloading.
+
+    Never blocks: missing thumbnails are fetched by the thumbnail service in
+    the background and the caller should draw a placeholder until then.
+    """
     try:
         if not preview_col:
             return 0
         k = f"rpm_{key}"
         if k in preview_col:
             return preview_col[k].icon_id
-        clean = thumb_url.split('?')[0]
-        fd, tmp = tempfile.mkstemp(prefix='rpm_thumb_', suffix=os.path.splitext(clean)[1] or '.png')
-        os.close(fd)
-        urllib.request.urlretrieve(thumb_url, tmp)
-        preview_col.load(k, tmp, 'IMAGE')
+        path = _get_thumbnail_service().request(key, thumb_url)
+        if not path:
+            if not bpy.app.timers.is_registered(_poll_thumbnails):
+                bpy.app.timers.register(_poll_thumbnails, first_interval=0.25, persistent=True)
+            return 0
+        preview_col.load(k, path, 'IMAGE')
         return preview_col[k].icon_id
     except Exception as e:
         print('RPM: preview load error', e)
         return 0
 
+def _placeholder_icon(name='USER'):
+    """Icon value of a built-in icon, for template_icon placeholders."""
+    items = bpy.types.UILayout.bl_rna.functions['prop'].parameters['icon'].enum_items
+    return items[name].value
+
+
+AVATAR_PAGE_SIZE = 24
 
 class ReadyPlayerMePreferences(bpy.types.AddonPreferences):
     bl_idname = __name__
 
+    # Legacy avatar copies; emptied into the avatar library on register
     scraped_avatars_json: bpy.props.StringProperty(
         name="Scraped Avatars JSON",
         default=""
@@ -791,6 +1962,17 @@ class ReadyPlayerMePreferences(bpy.types.AddonPreferences):
         type=RPM_AvatarItem,
         name="Avatar Items"
     )
+    avatar_search: bpy.props.StringProperty(
+        name="Search",
+        description="Filter avatars by id",
+        default="",
+        options={'TEXTEDIT_UPDATE'}
+    )
+    avatar_page: bpy.props.IntProperty(
+        name="Page",
+        default=1,
+        min=1
+    )
     login_email: bpy.props.StringProperty(
         name="Login Email",
         default=""
@@ -805,6 +1987,54 @@ class ReadyPlayerMePreferences(bpy.types.AddonPreferences):
         description="Show developer webview window during avatar refresh",
         default=False
     )
+    import_workers: bpy.props.IntProperty(
+        name="Parallel Downloads",
+        description="Number of avatars downloaded at once during batch import",
+        default=3,
+        min=1,
+        max=8
+    )
+    fast_glb_loader: bpy.props.BoolProperty(
+        name="Fast GLB Loader",
+        description="Build avatars straight from the GLB instead of through Blender's glTF "
+                    "importer; files it does not handle still use the glTF importer",
+        default=False
+    )
+    use_glb_cache: bpy.props.BoolProperty(
+        name="Cache Downloaded Avatars",
+        description="Reuse previously downloaded GLBs with the same import options",
+        default=True
+    )
+    trace_imports: bpy.props.BoolProperty(
+        name="Log Import Timings",
+        description="Append per-stage timings of every import to a JSON lines log "
+                    "(RPM_TRACE_LOG overrides the location)",
+        default=True
+    )
+    glb_cache_max_mb: bpy.props.IntProperty(
+        name="Cache Size Limit (MB)",
+        description="Least recently used avatars are evicted above this size",
+        default=2048,
+        min=64
+    )
+    glb_cache_revalidate_hours: bpy.props.IntProperty(
+        name="Revalidate After (hours)",
+        description="Check cached avatars for changes on the server after this many hours (0 = never)",
+        default=24,
+        min=0
+    )
+    use_blend_cache: bpy.props.BoolProperty(
+        name="Cache Processed Avatars",
+        description="Keep fully processed avatars in a .blend cache so importing the same "
+                    "avatar again appends it instead of repeating the import and clean-up",
+        default=True
+    )
+    blend_cache_max_mb: bpy.props.IntProperty(
+        name="Processed Cache Limit (MB)",
+        description="Least recently used processed avatars are evicted above this size",
+        default=2048,
+        min=64
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -830,6 +2060,73 @@ class ReadyPlayerMePreferences(bpy.types.AddonPreferences):
         if self.dev_mode:
             dev_box.label(text="Developer webview will be visible", icon='INFO')
 
+        batch_box = layout.box()
+        batch_box.prop(self, 'import_workers')
+        batch_box.prop(self, 'fast_glb_loader')
+
+        library = _get_avatar_library()
+        total = library.count(self.avatar_search)
+        if total or self.avatar_search:
+            avatars_box = layout.box()
+            avatars_box.label(text=f"Avatars ({total})", icon='OUTLINER_OB_ARMATURE')
+            row = avatars_box.row()
+            row.prop(self, 'avatar_search', text="", icon='VIEWZOOM')
+            pages = max(1, -(-total // AVATAR_PAGE_SIZE))
+            page = min(self.avatar_page, pages)
+            sub = row.row(align=True)
+            sub.prop(self, 'avatar_page')
+            sub.label(text=f"of {pages}")
+            # Only the visible page is read from the library
+            grid = avatars_box.grid_flow(row_major=True, columns=6, even_columns=True, align=True)
+            placeholder = _placeholder_icon()
+            for item in library.page((page - 1) * AVATAR_PAGE_SIZE, AVATAR_PAGE_SIZE, self.avatar_search):
+                cell = grid.column(align=True)
+                icon_id = _get_preview_icon(item['thumb_url'], item['avatar_id'])
+                cell.template_icon(icon_value=icon_id or placeholder, scale=4)
+                cell.label(text=item['avatar_id'][:12])
+
+        trace_box = layout.box()
+        trace_box.prop(self, 'trace_imports')
+        if self.trace_imports:
+            trace_box.label(text=_get_trace_log_path(), icon='TEXT')
+
+        cache_box = layout.box()
+        cache_box.prop(self, 'use_glb_cache')
+        if self.use_glb_cache:
+            col = cache_box.column(align=True)
+            col.prop(self, 'glb_cache_max_mb')
+            col.prop(self, 'glb_cache_revalidate_hours')
+            cache = _get_glb_cache()
+            if cache:
+                stats = cache.stats
+                col = cache_box.column(align=True)
+                col.label(
+                    text=f"{len(cache)} avatars, "
+                         f"{rpm_download.format_bytes(cache.total_bytes)} on disk",
+                    icon='FILE_CACHE'
+                )
+                col.label(
+                    text=f"Hits: {stats['hits']}  Misses: {stats['misses']}  "
+                         f"Saved: {rpm_download.format_bytes(stats['bytes_saved'])}"
+                )
+            cache_box.operator(RPM_OT_ClearGlbCache.bl_idname, icon='TRASH')
+
+        blend_box = layout.box()
+        blend_box.prop(self, 'use_blend_cache')
+        if self.use_blend_cache:
+            col = blend_box.column(align=True)
+            col.prop(self, 'blend_cache_max_mb')
+            cache = _get_blend_cache()
+            if cache:
+                col = blend_box.column(align=True)
+                col.label(
+                    text=f"{len(cache)} avatars, "
+                         f"{rpm_download.format_bytes(cache.total_bytes)} on disk",
+                    icon='FILE_BLEND'
+                )
+                col.label(text=f"Hits: {cache.stats['hits']}  Misses: {cache.stats['misses']}")
+            blend_box.operator(RPM_OT_ClearBlendCache.bl_idname, icon='TRASH')
+
 class RPM_OT_InstallDependenciesModal(bpy.types.Operator):
     bl_idname = "readyplayerme.install_dependencies_modal"
     bl_label = "Install Required Packages"
@@ -0,0 +1,55 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run inside Blender, e.g.::
+
+    blender -b --factory-startup --python benchmarks/bench_shape_key_rebase.py
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+import time
+import types
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_MODULE = 'readyplayerme_blender_importer'
+
+
+def load_addon():
+    """Import the addon package from this checkout without installing it."""
+    if ADDON_MODULE in sys.modules:
+        return sys.modules[ADDON_MODULE]
+    spec = importlib.util.spec_from_file_location(
+        ADDON_MODULE,
+        os.path.join(ADDON_DIR, '__init__.py'),
+        submodule_search_locations=[ADDON_DIR],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_MODULE] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_module(name):
+    """Import a bpy-free addon submodule (e.g. ``rpm_cache``) outside Blender.
+
+    The package namespace is registered without executing ``__init__.py`` so
+    relative imports between submodules resolve as they do in Blender.
+    """
+    if ADDON_MODULE not in sys.modules:
+        package = types.ModuleType(ADDON_MODULE)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[ADDON_MODULE] = package
+    return importlib.import_module(f'{ADDON_MODULE}.{name}')
+
+
+def timeit(fn, repeat=3):
+    """Return the best wall time of ``fn()`` over ``repeat`` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,86 @@
+"""
+Headless batch import against the local fixture server.
+
+Exports a synthetic avatar (see ``bench_post_import.build_avatar``) as
+fixture GLBs, serves them from ``fixture_server.FixtureServer`` and runs the
+``rpm_import`` command on a manifest of their ids, once with one .blend per
+avatar and once combined. Prints the per-avatar timings from the JSON
+report. Run with::
+
+    blender -b --factory-startup --python benchmarks/bench_batch_import.py -- [avatars] [workers]
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import load_addon  # noqa: E402
+from bench_post_import import build_avatar  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+
+
+def export_fixtures(glb_dir, ids):
+    build_avatar(parts=4, rows=100)
+    first = os.path.join(glb_dir, ids[0] + '.glb')
+    bpy.ops.export_scene.gltf(filepath=first, export_format='GLB')
+    for avatar_id in ids[1:]:
+        shutil.copyfile(first, os.path.join(glb_dir, avatar_id + '.glb'))
+
+
+def run_batch(addon, manifest, out_dir, workers, combined=False):
+    argv = [manifest, '--output-dir', out_dir, '--workers', str(workers)]
+    if combined:
+        argv += ['--combined', 'combined.blend']
+    code = addon._cli_batch_import(argv)
+    with open(os.path.join(out_dir, 'rpm_import_report.json'), 'r', encoding='utf-8') as f:
+        return code, json.load(f)
+
+
+def print_report(label, report):
+    print(f'RPM bench: {label}: {report["done"]}/{report["avatars"]} done '
+          f'in {report["wall_seconds"] * 1000:.0f} ms')
+    for result in report['results']:
+        s = result['seconds']
+        print(f'RPM bench:   {result["name"]}  download {s.get("download", 0) * 1000:7.1f} ms  '
+              f'import {s.get("import", 0) * 1000:7.1f} ms  save {s.get("save", 0) * 1000:7.1f} ms')
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    count = int(argv[0]) if len(argv) > 0 else 4
+    workers = int(argv[1]) if len(argv) > 1 else 3
+    ids = [f'{i:024x}' for i in range(count)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        glb_dir = os.path.join(tmp, 'fixtures')
+        os.makedirs(glb_dir)
+        export_fixtures(glb_dir, ids)
+        server = FixtureServer(latency=0.05, glb_dir=glb_dir).start_background()
+        manifest = os.path.join(tmp, 'manifest.json')
+        with open(manifest, 'w', encoding='utf-8') as f:
+            json.dump({'models_base': server.base_url, 'avatars': ids}, f)
+
+        addon = load_addon()
+        bpy.utils.register_class(addon.ReadyPlayerMeImporter)
+        try:
+            code_each, each = run_batch(addon, manifest, os.path.join(tmp, 'each'), workers)
+            code_all, combined = run_batch(
+                addon, manifest, os.path.join(tmp, 'combined'), workers, combined=True
+            )
+        finally:
+            bpy.utils.unregister_class(addon.ReadyPlayerMeImporter)
+            server.shutdown()
+
+    print_report('one .blend per avatar', each)
+    print_report('combined .blend', combined)
+    if code_each or code_all:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Batch import throughput against the number of worker processes.
+
+Serves fixture GLBs (see ``bench_batch_import.export_fixtures``) from the
+local fixture server and runs ``rpm_import --processes N`` on the same
+manifest for each worker count, printing avatars per minute so farm nodes
+can be sized. The workers are separate ``blender -b --command rpm_import``
+processes, so the extension must be installed and enabled in this Blender,
+as it is on the farm nodes (hence no ``--factory-startup``)::
+
+    blender -b --python benchmarks/bench_batch_pool.py -- [avatars] [counts...]
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import load_addon  # noqa: E402
+from bench_batch_import import export_fixtures  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    count = int(argv[0]) if argv else 16
+    process_counts = [int(a) for a in argv[1:]] or [1, 2, 4]
+    ids = [f'{i:024x}' for i in range(count)]
+    addon = load_addon()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        glb_dir = os.path.join(tmp, 'fixtures')
+        os.makedirs(glb_dir)
+        export_fixtures(glb_dir, ids)
+        server = FixtureServer(latency=0.05, glb_dir=glb_dir).start_background()
+        manifest = os.path.join(tmp, 'manifest.json')
+        with open(manifest, 'w', encoding='utf-8') as f:
+            json.dump({'models_base': server.base_url, 'avatars': ids}, f)
+        try:
+            for processes in process_counts:
+                out_dir = os.path.join(tmp, f'p{processes}')
+                addon._cli_batch_import([manifest, '--output-dir', out_dir, '--processes', str(processes)])
+                with open(os.path.join(out_dir, 'rpm_import_report.json'), 'r', encoding='utf-8') as f:
+                    report = json.load(f)
+                rows.append((processes, report))
+        finally:
+            server.shutdown()
+
+    print(f'RPM bench: batch import of {count} avatars')
+    for processes, report in rows:
+        print(f'RPM bench:   {processes:2d} processes  {report["done"]:4d} done  '
+              f'{report["wall_seconds"]:7.1f} s  {report["avatars_per_minute"]:7.1f} avatars/min')
+
+
+if __name__ == '__main__':
+    main()
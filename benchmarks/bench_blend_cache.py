@@ -0,0 +1,81 @@
+"""
+Repeat import of one avatar: full import and post-processing vs the cache.
+
+Exports a synthetic avatar (see ``bench_post_import.build_avatar``) as a
+GLB, then times the uncached path (glTF import plus ``_post_import``)
+against appending the processed result from a ``rpm_blend_cache`` entry
+written by ``_write_cached_avatar``, each into an empty scene. Also checks
+that the appended avatar has the same vertices and shape keys. Run with::
+
+    blender -b --factory-startup --python benchmarks/bench_blend_cache.py -- [parts] [rows]
+"""
+
+import os
+import sys
+import tempfile
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import load_addon, timeit  # noqa: E402
+from bench_post_import import build_avatar  # noqa: E402
+
+
+def import_and_process(addon, glb):
+    bpy.ops.wm.read_homefile(use_empty=True)
+    bpy.ops.import_scene.gltf(filepath=glb)
+    armature = next(obj for obj in bpy.context.selected_objects if obj.type == 'ARMATURE')
+    addon._post_import(bpy.context, armature)
+    return armature
+
+
+def append_cached(addon, path):
+    bpy.ops.wm.read_homefile(use_empty=True)
+    return addon._append_cached_avatar(bpy.context, path)
+
+
+def shape(objects):
+    meshes = [obj.data for obj in objects if obj.type == 'MESH']
+    return (
+        sum(len(m.vertices) for m in meshes),
+        sorted(kb.name for m in meshes if m.shape_keys for kb in m.shape_keys.key_blocks),
+    )
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parts = int(argv[0]) if len(argv) > 0 else 6
+    rows = int(argv[1]) if len(argv) > 1 else 200
+    addon = load_addon()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        glb = os.path.join(tmp, 'avatar.glb')
+        build_avatar(parts, rows)
+        bpy.ops.export_scene.gltf(filepath=glb, export_format='GLB')
+
+        cache = addon.rpm_blend_cache.BlendCache(os.path.join(tmp, 'cache'))
+        key = addon.rpm_blend_cache.blend_key(addon.rpm_blend_cache.file_digest(glb), {})
+        armature = import_and_process(addon, glb)
+        processed = shape(addon._imported_objects(bpy.context, armature))
+        addon._write_cached_avatar(cache, key, addon._imported_objects(bpy.context, armature), 'avatar')
+        path = cache.lookup(key)
+
+        t_full = timeit(lambda: import_and_process(addon, glb))
+        t_digest = timeit(lambda: addon.rpm_blend_cache.file_digest(glb))
+        t_cached = timeit(lambda: append_cached(addon, path))
+        appended = shape(append_cached(addon, path))
+        glb_size = os.path.getsize(glb)
+        blend_size = os.path.getsize(path)
+
+    print(f'RPM bench: repeat import, {parts} parts x {rows * 48} verts')
+    print(f'RPM bench:   GLB {glb_size / 1024:.0f} KB, cached .blend {blend_size / 1024:.0f} KB')
+    print(f'RPM bench:   import + post-process  {t_full * 1000:10.1f} ms')
+    print(f'RPM bench:   hash GLB + append      {(t_digest + t_cached) * 1000:10.1f} ms')
+    print(f'RPM bench:   speedup                {t_full / (t_digest + t_cached):10.1f}x')
+    if appended != processed:
+        print(f'RPM bench:   mismatch: {processed[0]} verts vs {appended[0]} appended')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
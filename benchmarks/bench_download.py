@@ -0,0 +1,85 @@
+"""
+Exercise the streaming downloader and GLB cache against the local fixture server.
+
+Runs with plain Python (no Blender needed)::
+
+    python benchmarks/bench_download.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import load_module  # noqa: E402
+from fixture_server import FixtureServer, fake_glb  # noqa: E402
+
+rpm_cache = load_module('rpm_cache')
+rpm_download = load_module('rpm_download')
+
+
+def main():
+    size = 8 * 1024 * 1024
+    server = FixtureServer(size=size, latency=0.05, bandwidth=16 * 1024 * 1024)
+    server.start_background()
+    out_dir = tempfile.mkdtemp(prefix='rpm_bench_dl_')
+
+    # Full download with progress sampling from the "main thread"
+    target = os.path.join(out_dir, 'full.glb')
+    job = rpm_download.DownloadJob(f'{server.base_url}/full.glb?quality=high', target)
+    start = time.perf_counter()
+    job.start()
+    samples = 0
+    while not job.finished:
+        samples += 1
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    assert job.error is None, job.error
+    with open(target, 'rb') as f:
+        assert f.read() == fake_glb('full', size)
+    print(f'RPM bench: streamed {rpm_download.format_bytes(size)} in '
+          f'{elapsed * 1000:.0f} ms, main thread sampled progress {samples}x')
+
+    # Cancellation part way through leaves no file behind
+    target = os.path.join(out_dir, 'cancel.glb')
+    job = rpm_download.DownloadJob(f'{server.base_url}/cancel.glb', target).start()
+    while job.bytes_done < size // 4 and not job.finished:
+        time.sleep(0.005)
+    job.cancel()
+    job.wait(5)
+    assert job.cancelled and job.error is None
+    assert not os.path.exists(target) and not os.path.exists(target + '.part')
+    print(f'RPM bench: cancelled at {job.percent:.0f}%, no partial file left')
+
+    # Cache: a repeat fetch with the same options never reaches the server
+    cache = rpm_cache.GlbCache(os.path.join(out_dir, 'cache'), max_bytes=2 * size)
+    url = f'{server.base_url}/cached.glb?quality=high&pose=T'
+    start = time.perf_counter()
+    cache.fetch(url)
+    t_miss = time.perf_counter() - start
+    requests_before = server.request_count
+    start = time.perf_counter()
+    cache.fetch(f'{server.base_url}/cached.glb?pose=T&quality=high')
+    t_hit = time.perf_counter() - start
+    assert server.request_count == requests_before
+    print(f'RPM bench: cache miss {t_miss * 1000:.0f} ms, hit {t_hit * 1000:.2f} ms, '
+          'no request on hit')
+
+    # Stale entries revalidate with If-None-Match and get a 304
+    cache.revalidate_after = 1e-9
+    cache.fetch(url)
+    assert server.request_count == requests_before + 1
+    assert cache.stats['revalidated'] == 1
+
+    # LRU eviction keeps the cache under its cap
+    for name in ('a', 'b', 'c'):
+        cache.fetch(f'{server.base_url}/{name}.glb')
+    assert cache.total_bytes <= cache.max_bytes
+    print(f'RPM bench: cache stats {cache.stats}, {len(cache)} entries after eviction')
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
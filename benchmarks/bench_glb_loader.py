@@ -0,0 +1,86 @@
+"""
+Compare Blender's glTF importer with the fast GLB loader.
+
+Exports synthetic avatars (see ``bench_post_import.build_avatar``) in a few
+sizes as GLB fixtures and times ``import_scene.gltf`` against
+``_fast_import_glb`` on each, every run into an empty scene. Both results
+are then post-processed with ``_post_import`` and compared: vertex and
+shape key counts, sorted shape key coordinates and bone rest matrices.
+Run with::
+
+    blender -b --factory-startup --python benchmarks/bench_glb_loader.py -- [repeat]
+"""
+
+import os
+import sys
+import tempfile
+
+import bpy
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import load_addon, timeit  # noqa: E402
+from bench_post_import import build_avatar, snapshot  # noqa: E402
+
+# (parts, rows, shape keys)
+SIZES = {
+    'small': (2, 60, 8),
+    'medium': (4, 200, 52),
+    'large': (8, 400, 52),
+}
+
+
+def stock_import(addon, glb):
+    bpy.ops.wm.read_homefile(use_empty=True)
+    bpy.ops.import_scene.gltf(filepath=glb)
+
+
+def fast_import(addon, glb):
+    bpy.ops.wm.read_homefile(use_empty=True)
+    if not addon._fast_import_glb(bpy.context, glb):
+        raise RuntimeError(f'fast loader did not handle {glb}')
+
+
+def processed(addon, importer, glb):
+    """Import with ``importer``, post-process and return counts and a snapshot."""
+    importer(addon, glb)
+    context = bpy.context
+    counts = addon._import_counts(context.selected_objects)
+    armature = next(obj for obj in context.selected_objects if obj.type == 'ARMATURE')
+    addon._post_import(context, armature)
+    return counts, snapshot(armature)
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    repeat = int(argv[0]) if argv else 3
+    addon = load_addon()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        for size, (parts, rows, keys) in SIZES.items():
+            glb = os.path.join(tmp, f'{size}.glb')
+            build_avatar(parts, rows, keys=keys)
+            bpy.ops.export_scene.gltf(filepath=glb, export_format='GLB')
+
+            t_stock = timeit(lambda: stock_import(addon, glb), repeat)
+            t_fast = timeit(lambda: fast_import(addon, glb), repeat)
+            counts_s, (names_s, shapes_s, rest_s) = processed(addon, stock_import, glb)
+            counts_f, (names_f, shapes_f, rest_f) = processed(addon, fast_import, glb)
+            shape_err = max(float(np.abs(shapes_s[n] - shapes_f[n]).max()) for n in shapes_s)
+            rest_err = float(np.abs(rest_s - rest_f).max())
+
+            print(f'RPM bench: {size}: {counts_s["vertices"]:,} verts, {counts_s["shape_keys"]} shape keys, '
+                  f'{os.path.getsize(glb) / 1024:.0f} KB GLB')
+            print(f'RPM bench:   glTF importer   {t_stock * 1000:10.1f} ms')
+            print(f'RPM bench:   fast loader     {t_fast * 1000:10.1f} ms')
+            print(f'RPM bench:   speedup         {t_stock / t_fast:10.1f}x')
+            print(f'RPM bench:   max shape err   {shape_err:.3g}')
+            print(f'RPM bench:   max rest err    {rest_err:.3g}')
+            failed |= counts_s != counts_f or names_s != names_f or shape_err > 1e-4 or rest_err > 1e-4
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Click-to-import latency of the UI request channel, before and after.
+
+"Before" replays the old protocol: the UI writes a JSON request file into the
+addon directory and Blender's 0.1 s modal timer checks three paths with
+``os.path.exists``. "After" sends over ``rpm_ipc`` and the 0.05 s modal timer
+only looks at the in-memory queue. Runs with plain Python::
+
+    python benchmarks/bench_ipc.py [messages]
+"""
+
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import load_module  # noqa: E402
+
+rpm_ipc = load_module('rpm_ipc')
+
+REQUEST_FILES = ('rpm_download_request.json', 'rpm_prefs_request.json',
+                 'rpm_avatar_update.json')
+
+
+def run_consumer(interval, tick, stop):
+    """Emulate Blender's modal timer calling ``tick`` every ``interval`` seconds."""
+    idle_costs = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        if not tick():
+            idle_costs.append(time.perf_counter() - start)
+        time.sleep(interval)
+    return idle_costs
+
+
+def measure(send, tick, interval, count):
+    received = []
+    stop = threading.Event()
+    result = {}
+
+    def consumer():
+        result['idle'] = run_consumer(interval, lambda: tick(received), stop)
+
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    latencies = []
+    for i in range(count):
+        time.sleep(random.uniform(0.02, 0.15))
+        sent = time.perf_counter()
+        send({'type': 'download', 'seq': i, 'sent': sent})
+        while len(received) <= i:
+            time.sleep(0.0005)
+        latencies.append(received[i] - sent)
+    stop.set()
+    thread.join()
+    return latencies, result['idle']
+
+
+def legacy(count):
+    addon_dir = tempfile.mkdtemp(prefix='rpm_bench_ipc_')
+    req_file = os.path.join(addon_dir, REQUEST_FILES[0])
+
+    def send(msg):
+        with open(req_file, 'w', encoding='utf-8') as f:
+            json.dump(msg, f)
+
+    def tick(received):
+        handled = False
+        for name in REQUEST_FILES:
+            path = os.path.join(addon_dir, name)
+            if os.path.exists(path):
+                try:
+                    with open(path, encoding='utf-8') as f:
+                        json.load(f)
+                    os.remove(path)
+                    received.append(time.perf_counter())
+                    handled = True
+                except ValueError:
+                    pass  # partial write, retry next tick
+        return handled
+
+    return measure(send, tick, 0.1, count)
+
+
+def channel(count):
+    server = rpm_ipc.MessageServer()
+    client = rpm_ipc.MessageClient(server.port, server.token)
+
+    def tick(received):
+        if server.messages.empty():
+            return False
+        while server.get_nowait() is not None:
+            received.append(time.perf_counter())
+        return True
+
+    try:
+        return measure(client.send, tick, 0.05, count)
+    finally:
+        client.close()
+        server.close()
+
+
+def report(name, latencies, idle):
+    ms = [v * 1000 for v in latencies]
+    print(f'RPM bench: {name:<18} median {statistics.median(ms):6.1f} ms  '
+          f'max {max(ms):6.1f} ms  idle tick {statistics.median(idle) * 1e6:6.1f} us')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    random.seed(0)
+    report('request files', *legacy(count))
+    report('ipc channel', *channel(count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Cost of syncing the avatar library after a refresh.
+
+Compares the old full replace (serialize and rewrite every avatar) with the
+delta computed by ``rpm_library.diff_avatars`` for a no-change refresh and
+for a refresh that adds, removes and changes a few avatars, then times the
+SQLite ``AvatarStore``: a no-change sync and reading one page near the start
+and near the end of the library. Plain Python::
+
+    python benchmarks/bench_library_sync.py [avatars]
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import load_module, timeit  # noqa: E402
+
+rpm_library = load_module('rpm_library')
+
+
+def make_avatars(count, start=0):
+    return [
+        {
+            'avatar_id': f'{i:024x}',
+            'glb_url': f'https://models.readyplayer.me/{i:024x}.glb',
+            'thumb_url': f'https://models.readyplayer.me/{i:024x}.png',
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    old = make_avatars(count)
+    same = [dict(a) for a in old]
+
+    edited = [dict(a) for a in old[5:]] + make_avatars(3, start=count)
+    edited[0]['thumb_url'] += '?v=2'
+
+    def full_replace():
+        json.dumps([dict(a) for a in same], indent=2)
+
+    no_change = timeit(lambda: rpm_library.diff_avatars(old, same), repeat=20)
+    delta = rpm_library.diff_avatars(old, edited)
+    assert rpm_library.delta_is_empty(rpm_library.diff_avatars(old, same))
+    assert rpm_library.apply_delta(old, delta) == edited, 'delta does not round-trip'
+    small = timeit(lambda: rpm_library.diff_avatars(old, edited), repeat=20)
+
+    print(f'RPM bench: full replace ({count} avatars)  {timeit(full_replace, 20) * 1000:8.3f} ms')
+    print(f'RPM bench: diff, no change                {no_change * 1000:8.3f} ms')
+    print(f'RPM bench: diff, +3 -5 ~1                 {small * 1000:8.3f} ms')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = rpm_library.AvatarStore(os.path.join(tmp, rpm_library.LIBRARY_NAME))
+        store.sync(old)
+        sync = timeit(lambda: store.sync(same), repeat=20)
+        first = timeit(lambda: store.page(0, 24), repeat=20)
+        last = timeit(lambda: store.page(count - 24, 24), repeat=20)
+        store.close()
+    print(f'RPM bench: store sync, no change          {sync * 1000:8.3f} ms')
+    print(f'RPM bench: store page 1                   {first * 1000:8.3f} ms')
+    print(f'RPM bench: store last page                {last * 1000:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+"""
+Compare the operator-based post-import chain with the data-API pipeline.
+
+Builds a synthetic avatar shaped like an imported Ready Player Me GLB (an
+armature with several skinned child meshes with UVs, materials and shape
+keys, in a non-rest pose) and times the original chain of operators
+(select_all, object.join, modifier_apply_as_shapekey, shape_key_move,
+posemode_toggle, pose.armature_apply) against ``_post_import`` and checks
+that both produce the same shapes and rest pose. ``wm.redraw_timer`` from
+the original chain is skipped because it cannot run in background mode.
+Run with::
+
+    blender -b --factory-startup --python benchmarks/bench_post_import.py -- [parts] [rows]
+"""
+
+import os
+import sys
+import time
+
+import bpy
+import numpy as np
+from mathutils import Quaternion
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import load_addon  # noqa: E402
+
+BONES = 12
+COLS = 48
+KEYS = 20
+
+
+def legacy_post_import(context, armature):
+    """The original operator chain from ``import_model``, kept for comparison."""
+    addon = load_addon()
+    context.view_layer.update()
+    armature.data.show_bone_custom_shapes = False
+
+    child_meshes = [obj for obj in armature.children if obj.type == 'MESH']
+    if len(child_meshes) > 1:
+        bpy.ops.object.select_all(action='DESELECT')
+        for mesh in child_meshes:
+            mesh.select_set(True)
+        context.view_layer.objects.active = child_meshes[0]
+        bpy.ops.object.join()
+
+    child_meshes = [obj for obj in armature.children if obj.type == 'MESH']
+    for mesh in child_meshes:
+        context.view_layer.objects.active = mesh
+        for modifier in mesh.modifiers:
+            if modifier.type == 'ARMATURE' and modifier.object == armature:
+                bpy.ops.object.modifier_apply_as_shapekey(keep_modifier=True, modifier=modifier.name)
+                break
+        if mesh.data.shape_keys:
+            context.object.active_shape_key_index = len(mesh.data.shape_keys.key_blocks) - 1
+            act_sk = mesh.active_shape_key
+            addon._rebase_shape_keys(mesh.data, mesh.active_shape_key_index)
+            while mesh.data.shape_keys.reference_key.name != act_sk.name:
+                bpy.ops.object.shape_key_move(type='UP')
+            for sk in mesh.data.shape_keys.key_blocks:
+                if sk != act_sk:
+                    sk.relative_key = act_sk
+            mesh.data.shape_keys.key_blocks[1].name = "oldBasis"
+            mesh.data.shape_keys.key_blocks[0].name = "Basis"
+    context.view_layer.objects.active = armature
+    context.object.show_in_front = True
+    bpy.ops.object.posemode_toggle()
+    bpy.ops.pose.armature_apply(selected=False)
+
+
+def build_avatar(parts, rows, seed=0, keys=KEYS):
+    """Armature plus ``parts`` skinned tube meshes, posed away from rest.
+
+    Every other part gets ``keys`` shape keys on top of its basis.
+    """
+    rng = np.random.default_rng(seed)
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    context = bpy.context
+    scene = context.scene
+
+    armature = bpy.data.objects.new('Armature', bpy.data.armatures.new('Armature'))
+    scene.collection.objects.link(armature)
+    context.view_layer.objects.active = armature
+    bpy.ops.object.mode_set(mode='EDIT')
+    parent = None
+    for i in range(BONES):
+        eb = armature.data.edit_bones.new(f'bone_{i}')
+        eb.head = (0.0, 0.0, i * 0.2)
+        eb.tail = (0.0, 0.0, (i + 1) * 0.2)
+        if parent:
+            eb.parent = parent
+            eb.use_connect = True
+        parent = eb
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    height = BONES * 0.2
+    for p in range(parts):
+        angle = np.linspace(0, 2 * np.pi, COLS, endpoint=False)
+        z = np.linspace(0, height, rows)
+        radius = 0.2 + 0.05 * p
+        verts = np.stack([
+            np.tile(np.cos(angle) * radius, rows),
+            np.tile(np.sin(angle) * radius, rows),
+            np.repeat(z, COLS),
+        ], axis=1)
+        faces = [
+            (r * COLS + c, r * COLS + (c + 1) % COLS,
+             (r + 1) * COLS + (c + 1) % COLS, (r + 1) * COLS + c)
+            for r in range(rows - 1) for c in range(COLS)
+        ]
+        mesh = bpy.data.meshes.new(f'part_{p}')
+        mesh.from_pydata(verts.tolist(), [], faces)
+        mesh.uv_layers.new(name='UVMap')
+        mesh.materials.append(bpy.data.materials.new(f'material_{p}'))
+        obj = bpy.data.objects.new(f'part_{p}', mesh)
+        scene.collection.objects.link(obj)
+        obj.parent = armature
+
+        # Linear blend between the two bones nearest each ring
+        along = verts[:, 2] / 0.2 - 0.5
+        lower = np.clip(np.floor(along), 0, BONES - 1).astype(int)
+        upper = np.clip(lower + 1, 0, BONES - 1)
+        t = np.clip(along - lower, 0.0, 1.0)
+        groups = [obj.vertex_groups.new(name=f'bone_{i}') for i in range(BONES)]
+        for index in range(len(verts)):
+            groups[lower[index]].add([index], float(1.0 - t[index]), 'ADD')
+            if upper[index] != lower[index]:
+                groups[upper[index]].add([index], float(t[index]), 'ADD')
+        modifier = obj.modifiers.new('Armature', 'ARMATURE')
+        modifier.object = armature
+
+        if p % 2 == 0:
+            obj.shape_key_add(name='Basis', from_mix=False)
+            for k in range(keys):
+                kb = obj.shape_key_add(name=f'key_{k}', from_mix=False)
+                co = np.empty(len(verts) * 3, dtype=np.float32)
+                kb.points.foreach_get('co', co)
+                co += rng.standard_normal(co.shape).astype(np.float32) * 0.01
+                kb.points.foreach_set('co', co)
+
+    for i, pb in enumerate(armature.pose.bones):
+        pb.rotation_quaternion = Quaternion((1.0, 0.0, 0.0), 0.05 * (i % 4))
+    for obj in scene.objects:
+        obj.select_set(True)
+    return armature
+
+
+def snapshot(armature):
+    """Order-independent view of the result: sorted key coords and rest matrices."""
+    mesh = next(obj for obj in armature.children if obj.type == 'MESH')
+    keys = mesh.data.shape_keys.key_blocks
+    shapes = {}
+    for name in ('Basis', 'oldBasis'):
+        co = np.empty(len(mesh.data.vertices) * 3, dtype=np.float32)
+        keys[name].points.foreach_get('co', co)
+        co = co.reshape(-1, 3)
+        shapes[name] = co[np.lexsort(np.round(co, 4).T[::-1])]
+    rest = np.array([np.array(b.matrix_local) for b in armature.data.bones])
+    return [k.name for k in keys][:2], shapes, rest
+
+
+def run(fn, parts, rows):
+    armature = build_avatar(parts, rows)
+    start = time.perf_counter()
+    fn(bpy.context, armature)
+    elapsed = time.perf_counter() - start
+    return elapsed, snapshot(armature)
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parts = int(argv[0]) if len(argv) > 0 else 6
+    rows = int(argv[1]) if len(argv) > 1 else 200
+    addon = load_addon()
+
+    legacy = [run(legacy_post_import, parts, rows) for _ in range(3)]
+    native = [run(addon._post_import, parts, rows) for _ in range(3)]
+    t_legacy = min(r[0] for r in legacy)
+    t_native = min(r[0] for r in native)
+
+    names_l, shapes_l, rest_l = legacy[0][1]
+    names, shapes, rest = native[0][1]
+    max_err = max(float(np.abs(shapes_l[name] - shapes[name]).max()) for name in shapes_l)
+    rest_err = float(np.abs(rest_l - rest).max())
+    print(f'RPM bench: post-import, {parts} parts x {rows * COLS} verts, {BONES} bones')
+    print(f'RPM bench:   operator chain  {t_legacy * 1000:10.1f} ms')
+    print(f'RPM bench:   _post_import    {t_native * 1000:10.1f} ms  {t_legacy / t_native:6.1f}x  '
+          f'shape err {max_err:.3g}  rest err {rest_err:.3g}')
+    if names != names_l or max_err > 1e-4 or rest_err > 1e-4:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Avatar refresh through the direct list fetch, against the local fixture server.
+
+The scraper path needs a browser and the live site (up to its 120 s
+timeout); the direct path is a single authenticated request. This checks the
+fast path returns the scraper's result format, that a rejected token raises
+``SessionExpired`` so the caller falls back to scraping, and times it. Plain
+Python::
+
+    python benchmarks/bench_refresh.py [avatars]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import load_module  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+
+rpm_avatar_api = load_module('rpm_avatar_api')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    ids = [f'{i:024x}' for i in range(count)]
+    server = FixtureServer(latency=0.05, listing=ids).start_background()
+    session = {'token': server.token, 'user_id': 'fixture-user'}
+
+    times = []
+    for _ in range(5):
+        start = time.perf_counter()
+        data = rpm_avatar_api.fetch_avatar_list(
+            session, api_base=server.base_url
+        )
+        times.append(time.perf_counter() - start)
+    assert data['type'] == 'list'
+    assert [it['id'] for it in data['items']] == ids
+    assert data['items'][0]['glb'].endswith(f'/{ids[0]}.glb')
+
+    try:
+        rpm_avatar_api.fetch_avatar_list(
+            dict(session, token='expired'), api_base=server.base_url
+        )
+        raise AssertionError('expired token was accepted')
+    except rpm_avatar_api.SessionExpired:
+        pass
+
+    print(f'RPM bench: direct avatar list ({count} avatars, 50 ms latency) '
+          f'{statistics.median(times) * 1000:8.1f} ms (median of {len(times)})')
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
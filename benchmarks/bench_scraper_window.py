@@ -0,0 +1,119 @@
+"""
+Startup time and memory of the scraper window in each window mode.
+
+Opens the scraper's window (``rpm_webview_helper.window_options``) on the
+fixture server's stand-in choose page, in a fresh process per mode, and
+reports the time from process start to the first page load. It also reports
+the peak resident memory of the process and its browser child processes,
+sampled from spawn until the window closes. ``minimized`` is the non-dev
+default on Windows; ``offscreen`` and ``hidden`` are the headless modes. Needs
+pywebview and a display; memory needs psutil::
+
+    python benchmarks/bench_scraper_window.py [avatars] [modes...]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import ADDON_DIR  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+
+MODES = ('minimized', 'offscreen', 'hidden')
+SETTLE = 3.0
+RUNS = 3
+
+
+def child(mode, url):
+    """Open one scraper window, report the first load, close after SETTLE s."""
+    sys.path.insert(0, ADDON_DIR)
+    import webview
+    import rpm_webview_helper
+
+    w = webview.create_window('RPM bench', url=url, **rpm_webview_helper.window_options(mode))
+
+    def started():
+        if rpm_webview_helper.window_event(w, 'loaded').wait(60):
+            print('loaded', flush=True)
+        time.sleep(SETTLE)
+        w.destroy()
+
+    if sys.platform == 'win32':
+        webview.start(started, gui='edgechromium')
+    else:
+        webview.start(started)
+
+
+def tree_rss(proc):
+    try:
+        procs = [proc] + proc.children(recursive=True)
+    except Exception:
+        return 0
+    total = 0
+    for p in procs:
+        try:
+            total += p.memory_info().rss
+        except Exception:
+            pass
+    return total
+
+
+def run_mode(mode, url):
+    """Seconds to first load and peak tree RSS in bytes (None without psutil)."""
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), '--child', mode, url],
+        stdout=subprocess.PIPE, text=True,
+    )
+    watched = psutil.Process(proc.pid) if psutil else None
+    loaded = []
+
+    def read_output():
+        for line in proc.stdout:
+            if line.strip() == 'loaded' and not loaded:
+                loaded.append(time.perf_counter() - start)
+
+    # Sample from spawn onward so the peak includes the load itself
+    reader = threading.Thread(target=read_output, daemon=True)
+    reader.start()
+    peak = 0
+    while proc.poll() is None:
+        if watched:
+            peak = max(peak, tree_rss(watched))
+        time.sleep(0.05)
+    reader.join()
+    if not loaded:
+        raise RuntimeError(f'{mode}: window never loaded')
+    return loaded[0], (peak if watched else None)
+
+
+def main():
+    args = sys.argv[1:]
+    count = int(args.pop(0)) if args and args[0].isdigit() else 200
+    modes = args or MODES
+    server = FixtureServer(listing=[f'{i:024x}' for i in range(count)]).start_background()
+    url = f'{server.base_url}/avatar/choose'
+
+    for mode in modes:
+        results = [run_mode(mode, url) for _ in range(RUNS)]
+        startup = statistics.median(r[0] for r in results)
+        peaks = [r[1] for r in results if r[1] is not None]
+        memory = f'{max(peaks) / (1024 * 1024):8.0f} MB' if peaks else '  (no psutil)'
+        print(f'RPM bench: scraper window {mode:<10} startup {startup * 1000:6.0f} ms  '
+              f'peak RSS {memory}')
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main()
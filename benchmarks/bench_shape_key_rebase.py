@@ -0,0 +1,104 @@
+"""
+Compare the legacy per-vertex shape-key rebase with the NumPy engine.
+
+Run with::
+
+    blender -b --factory-startup --python benchmarks/bench_shape_key_rebase.py -- [keys] [verts]
+"""
+
+import os
+import sys
+
+import bpy
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import load_addon, timeit  # noqa: E402
+
+
+def legacy_rebase(aobj):
+    """The original Vector-list implementation, kept here for comparison."""
+    act_sk = aobj.active_shape_key
+    ref_sk = aobj.data.shape_keys.reference_key
+    act_defs = [(act_sk.data[d].co - dat.co) for d, dat in enumerate(ref_sk.data)]
+    for sk in aobj.data.shape_keys.key_blocks:
+        if sk not in (act_sk, ref_sk):
+            sk_defs = [(sk.data[d].co - dat.co) for d, dat in enumerate(ref_sk.data)]
+            for d, dat in enumerate(sk.data):
+                dat.co = ref_sk.data[d].co + act_defs[d] + sk_defs[d]
+
+
+def build_mesh(key_count, vert_count, seed=0):
+    rng = np.random.default_rng(seed)
+    mesh = bpy.data.meshes.new('rpm_bench_rebase')
+    mesh.vertices.add(vert_count)
+    mesh.vertices.foreach_set('co', rng.standard_normal(vert_count * 3).astype(np.float32))
+    obj = bpy.data.objects.new('rpm_bench_rebase', mesh)
+    bpy.context.scene.collection.objects.link(obj)
+
+    snapshot = []
+    obj.shape_key_add(name='Basis', from_mix=False)
+    for i in range(key_count):
+        kb = obj.shape_key_add(name=f'key_{i}', from_mix=False)
+        co = np.empty(vert_count * 3, dtype=np.float32)
+        kb.points.foreach_get('co', co)
+        co += rng.standard_normal(co.shape).astype(np.float32) * 0.01
+        kb.points.foreach_set('co', co)
+    for kb in mesh.shape_keys.key_blocks:
+        co = np.empty(vert_count * 3, dtype=np.float32)
+        kb.points.foreach_get('co', co)
+        snapshot.append(co)
+    obj.active_shape_key_index = len(mesh.shape_keys.key_blocks) - 1
+    return obj, snapshot
+
+
+def restore(obj, snapshot):
+    for kb, co in zip(obj.data.shape_keys.key_blocks, snapshot):
+        kb.points.foreach_set('co', co)
+
+
+def read_all(obj):
+    addon = load_addon()
+    return addon._read_shape_key_coords(
+        obj.data.shape_keys.key_blocks, len(obj.data.vertices)
+    ).copy()
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    key_count = int(argv[0]) if len(argv) > 0 else 50
+    vert_count = int(argv[1]) if len(argv) > 1 else 20000
+    addon = load_addon()
+
+    obj, snapshot = build_mesh(key_count, vert_count)
+    act_index = obj.active_shape_key_index
+
+    legacy_rebase(obj)
+    expected = read_all(obj)
+    restore(obj, snapshot)
+    addon._rebase_shape_keys(obj.data, act_index)
+    actual = read_all(obj)
+    max_err = float(np.abs(expected - actual).max())
+
+    def run_legacy():
+        restore(obj, snapshot)
+        legacy_rebase(obj)
+
+    def run_numpy():
+        restore(obj, snapshot)
+        addon._rebase_shape_keys(obj.data, act_index)
+
+    t_legacy = timeit(run_legacy, repeat=1)
+    t_numpy = timeit(run_numpy)
+
+    print(f'RPM bench: shape-key rebase, {key_count} keys x {vert_count} verts')
+    print(f'RPM bench:   legacy loop  {t_legacy * 1000:10.1f} ms')
+    print(f'RPM bench:   numpy engine {t_numpy * 1000:10.1f} ms')
+    print(f'RPM bench:   speedup      {t_legacy / t_numpy:10.1f}x')
+    print(f'RPM bench:   max abs err  {max_err:.3g}')
+    if max_err > 1e-5:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+"""
+Offline import benchmark: per-stage timings and peak memory by avatar size.
+
+For each fixture size (shaped like ``bench_post_import.build_avatar``: mesh
+count, vertices per mesh and shape keys per mesh) a fresh background
+Blender exports a fixture GLB, serves it from ``fixture_server`` with the
+given latency and bandwidth, and runs ``rpm.native_import`` on its URL
+``--repeat`` times, the same download-then-import path as the UI. Stage
+timings come from the import trace (``rpm_trace``); each size runs in its
+own process so its peak memory is not hidden by an earlier, larger one.
+
+The report is printed and, with ``--out``, written as JSON together with
+the Blender version and addon commit; ``--compare`` prints the change of
+each stage against an earlier report, so two builds can be compared::
+
+    blender -b --factory-startup --python benchmarks/bench_suite.py -- \\
+        [--sizes small medium large] [--repeat 3] [--latency 0.05] [--kbps 0] \\
+        [--out report.json] [--compare baseline.json]
+
+The UI request channel has its own benchmark, ``bench_ipc.py``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import ADDON_DIR, load_addon  # noqa: E402
+from bench_post_import import build_avatar  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+
+# parts x (rows x 48) vertices; every other part has ``keys`` shape keys
+SIZES = {
+    'small': {'parts': 2, 'rows': 60, 'keys': 8},
+    'medium': {'parts': 4, 'rows': 200, 'keys': 52},
+    'large': {'parts': 8, 'rows': 400, 'keys': 52},
+}
+AVATAR_ID = '0' * 24
+STAGES = ('download', 'cache_lookup', 'cache_append', 'fast_glb_import', 'gltf_import', 'join',
+          'pose_shape_key', 'shape_key_rebase', 'rest_pose', 'cache_write')
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(prog='bench_suite.py')
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds to first byte')
+    parser.add_argument('--kbps', type=float, default=0, help='0 = unthrottled')
+    parser.add_argument('--out', help='write the report as JSON')
+    parser.add_argument('--compare', help='earlier JSON report to compare against')
+    parser.add_argument('--child', choices=list(SIZES), help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def run_size(args):
+    """Child process: import one fixture size ``args.repeat`` times."""
+    addon = load_addon()
+    bpy.utils.register_class(addon.ReadyPlayerMeImporter)
+    with tempfile.TemporaryDirectory() as tmp:
+        # Unsaved files download into ./gltf-DL
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        glb = os.path.join(tmp, AVATAR_ID + '.glb')
+        build_avatar(**SIZES[args.child])
+        bpy.ops.export_scene.gltf(filepath=glb, export_format='GLB')
+        log = os.path.join(tmp, 'trace.jsonl')
+        os.environ[addon.rpm_trace.ENV_LOG] = log
+
+        server = FixtureServer(latency=args.latency, bandwidth=args.kbps * 1024, glb_dir=tmp)
+        server.start_background()
+        failed = 0
+        try:
+            for _ in range(args.repeat):
+                bpy.ops.wm.read_homefile(use_empty=True)
+                result = bpy.ops.rpm.native_import(
+                    'EXEC_DEFAULT', model_url=f'{server.base_url}/{AVATAR_ID}.glb'
+                )
+                failed += 'FINISHED' not in result
+        finally:
+            server.shutdown()
+            bpy.utils.unregister_class(addon.ReadyPlayerMeImporter)
+            os.chdir(cwd)
+
+        with open(log, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        result = {
+            'glb_bytes': os.path.getsize(glb),
+            'counts': records[-1]['counts'] if records else {},
+            'runs': [
+                {
+                    'total': r['total_seconds'],
+                    'stages': {s['stage']: s['seconds'] for s in r['stages']},
+                    'rss_delta': {s['stage']: s['rss_delta'] for s in r['stages']},
+                }
+                for r in records
+            ],
+            'failed': failed,
+            'peak_rss': addon.rpm_trace.peak_rss(),
+        }
+    with open(args.result, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+
+
+def summarize(result):
+    """Median seconds and RSS change per stage over the runs of one size."""
+    runs = result['runs']
+    stages = {}
+    for name in STAGES:
+        seconds = [r['stages'][name] for r in runs if name in r['stages']]
+        deltas = [r['rss_delta'][name] for r in runs if r['rss_delta'].get(name) is not None]
+        if seconds:
+            stages[name] = {
+                'median': round(statistics.median(seconds), 4),
+                'min': round(min(seconds), 4),
+                'rss_delta': int(statistics.median(deltas)) if deltas else None,
+            }
+    return {
+        'glb_bytes': result['glb_bytes'],
+        'counts': result['counts'],
+        'runs': len(runs),
+        'failed': result['failed'],
+        'total': round(statistics.median(r['total'] for r in runs), 4) if runs else None,
+        'stages': stages,
+        'peak_rss': result['peak_rss'],
+    }
+
+
+def addon_commit():
+    try:
+        return subprocess.run(
+            ['git', 'describe', '--always', '--dirty'], cwd=ADDON_DIR,
+            capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_child(args, size, tmp):
+    result = os.path.join(tmp, f'{size}.json')
+    command = [
+        bpy.app.binary_path, '-b', '--factory-startup', '--python', os.path.abspath(__file__), '--',
+        '--child', size, '--result', result, '--repeat', str(args.repeat),
+        '--latency', str(args.latency), '--kbps', str(args.kbps),
+    ]
+    started = time.perf_counter()
+    proc = subprocess.run(command, capture_output=True, text=True)
+    if proc.returncode != 0 or not os.path.isfile(result):
+        print(proc.stdout[-4000:])
+        print(proc.stderr[-4000:])
+        raise SystemExit(f'RPM bench: {size} failed (exit code {proc.returncode})')
+    with open(result, 'r', encoding='utf-8') as f:
+        summary = summarize(json.load(f))
+    summary['process_seconds'] = round(time.perf_counter() - started, 2)
+    return summary
+
+
+def megabytes(value):
+    return f'{value / (1024 * 1024):7.1f} MB' if value is not None else '      n/a'
+
+
+def print_report(report, baseline=None):
+    print(f'RPM bench: import suite, Blender {report["blender"]}, addon {report["addon"]}, '
+          f'latency {report["latency"]}s, {report["kbps"] or "unthrottled"} kbps')
+    for size, summary in report['sizes'].items():
+        counts = summary['counts']
+        print(f'RPM bench: {size}: {counts.get("meshes", 0)} meshes, {counts.get("vertices", 0):,} verts, '
+              f'{counts.get("shape_keys", 0)} shape keys, {summary["glb_bytes"] / 1024:.0f} KB GLB, '
+              f'peak {megabytes(summary["peak_rss"]).strip()}')
+        base = (baseline or {}).get('sizes', {}).get(size, {})
+        rows = list(summary['stages'].items()) + [('total', {'median': summary['total'], 'rss_delta': None})]
+        for name, stage in rows:
+            line = f'RPM bench:   {name:17s} {stage["median"] * 1000:9.1f} ms'
+            if name != 'total':
+                line += f'  {megabytes(stage["rss_delta"])}'
+            old = base.get('total') if name == 'total' else base.get('stages', {}).get(name, {}).get('median')
+            if old:
+                line += f'  {(stage["median"] - old) / old * 100:+6.1f}% vs baseline'
+            print(line)
+
+
+def main():
+    args = parse_args()
+    if args.child:
+        run_size(args)
+        return
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'blender': bpy.app.version_string,
+        'addon': addon_commit(),
+        'host': platform.node(),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'latency': args.latency,
+        'kbps': args.kbps,
+        'fixtures': {size: SIZES[size] for size in args.sizes},
+        'sizes': {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            report['sizes'][size] = run_child(args, size, tmp)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f'RPM bench: report written to {args.out}')
+    if any(s['failed'] for s in report['sizes'].values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Time-to-first-paint of the importer UI, cold versus warm.
+
+Starts the real UI helper the way the addon does, measures the cold open
+(new interpreter, pywebview import, window and page load) and then several
+warm opens of the already running helper. Needs pywebview and a display;
+runs with any Python that can import pywebview (e.g. Blender's)::
+
+    python benchmarks/bench_ui_open.py [warm_opens]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _common import ADDON_DIR, load_module  # noqa: E402
+
+rpm_ui_session = load_module('rpm_ui_session')
+
+
+def wait_ready(session, timeout=60):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        msg = session.channel.get_nowait()
+        if msg is None:
+            if not session.alive():
+                raise RuntimeError('UI helper exited')
+            time.sleep(0.005)
+            continue
+        if msg.get('type') == 'ui_ready':
+            ready = session.mark_ready()
+            if ready:
+                return ready
+    raise TimeoutError('UI helper never reported ui_ready')
+
+
+def main():
+    warm_opens = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    env = os.environ.copy()
+    env['RPM_HTML_PATH'] = os.path.join(ADDON_DIR, 'rpm_ui.html')
+    env['PYTHONUNBUFFERED'] = '1'
+    session = rpm_ui_session.UIHelperSession(
+        sys.executable, os.path.join(ADDON_DIR, 'rpm_ui_webview.py'), env
+    )
+    try:
+        _kind, cold = wait_ready(session)
+        warm = []
+        for _ in range(warm_opens):
+            time.sleep(0.5)
+            session.show({'email': '', 'password': '', 'dev_mode': False})
+            warm.append(wait_ready(session)[1])
+    finally:
+        session.shutdown()
+
+    print(f'RPM bench: UI cold open  {cold * 1000:8.0f} ms')
+    print(f'RPM bench: UI warm open  {statistics.median(warm) * 1000:8.0f} ms '
+          f'(median of {len(warm)})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""
+Local HTTP stand-in for the Ready Player Me model endpoint.
+
+Serves ``/<avatar_id>.glb`` with a deterministic fake payload (or the real
+``<glb_dir>/<avatar_id>.glb`` when a fixture directory is given) and ETag,
+throttled to a configurable bandwidth and first-byte latency so that download
+progress, cancellation and cache revalidation can be exercised offline. It
+also serves the avatar listing at ``/v1/avatars`` (``listing`` ids, bearer
+``token`` required) for the direct avatar-list fetch, and a stand-in for the
+avatar choose page (``/avatar/choose``, one ``/<avatar_id>.png`` image per
+listed id) for timing the scraper window::
+
+    python benchmarks/fixture_server.py --port 8765 --size-mb 40 --kbps 4096
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# 1x1 transparent PNG
+FIXTURE_PNG = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000b49444154789c6360000200000500017a5eab3f0000000049454e44ae426082'
+)
+
+
+def fake_glb(avatar_id, size):
+    """Deterministic bytes of ``size`` length for ``avatar_id``."""
+    seed = hashlib.sha256(avatar_id.encode('utf-8')).digest()
+    return (seed * (size // len(seed) + 1))[:size]
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    server_version = 'RPMFixture/1.0'
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def do_GET(self):
+        path = self.path.split('?')[0].lstrip('/')
+        if path == 'v1/avatars':
+            self._send_listing()
+            return
+        if path == 'avatar/choose':
+            self._send_choose_page()
+            return
+        if path.endswith('.png'):
+            self._send_body(FIXTURE_PNG, 'image/png')
+            return
+        if not path.endswith('.glb'):
+            self.send_error(404)
+            return
+        self.server.request_count += 1
+        body = self.server.payload_for(path[:-len('.glb')])
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        time.sleep(self.server.latency)
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'model/gltf-binary')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+
+        chunk = 64 * 1024
+        bps = self.server.bandwidth
+        try:
+            for start in range(0, len(body), chunk):
+                self.wfile.write(body[start:start + chunk])
+                if bps:
+                    time.sleep(chunk / bps)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _send_listing(self):
+        self.server.request_count += 1
+        time.sleep(self.server.latency)
+        if self.headers.get('Authorization') != f'Bearer {self.server.token}':
+            self.send_error(401)
+            return
+        body = json.dumps({'data': [{'id': i} for i in self.server.listing]}).encode('utf-8')
+        self._send_body(body, 'application/json')
+
+    def _send_choose_page(self):
+        base = self.server.base_url
+        images = ''.join(
+            f'<img width="128" height="128" loading="lazy" src="{base}/{i}.png">'
+            for i in self.server.listing
+        )
+        body = f'<!doctype html><html><body>{images}</body></html>'.encode('utf-8')
+        self._send_body(body, 'text/html; charset=utf-8')
+
+    def _send_body(self, body, content_type):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """Threaded HTTP server with fixture settings attached."""
+
+    daemon_threads = True
+
+    def __init__(self, port=0, size=1024 * 1024, latency=0.0, bandwidth=0,
+                 verbose=False, listing=(), token='fixture-token', glb_dir=None):
+        super().__init__(('127.0.0.1', port), FixtureHandler)
+        self.size = size
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.verbose = verbose
+        self.listing = list(listing)
+        self.token = token
+        self.glb_dir = glb_dir
+        self.request_count = 0
+        self._payloads = {}
+
+    @property
+    def base_url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def payload_for(self, avatar_id):
+        if avatar_id not in self._payloads:
+            fixture = os.path.join(self.glb_dir, avatar_id + '.glb') if self.glb_dir else None
+            if fixture and os.path.isfile(fixture):
+                with open(fixture, 'rb') as f:
+                    self._payloads[avatar_id] = f.read()
+            else:
+                self._payloads[avatar_id] = fake_glb(avatar_id, self.size)
+        return self._payloads[avatar_id]
+
+    def start_background(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--size-mb', type=float, default=20)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds')
+    parser.add_argument('--kbps', type=float, default=0, help='0 = unthrottled')
+    parser.add_argument('--glb-dir', help='serve <avatar_id>.glb files from this directory')
+    args = parser.parse_args()
+    server = FixtureServer(
+        args.port,
+        size=int(args.size_mb * 1024 * 1024),
+        latency=args.latency,
+        bandwidth=args.kbps * 1024,
+        verbose=True,
+        glb_dir=args.glb_dir,
+    )
+    print(f'RPM fixture server on {server.base_url}')
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
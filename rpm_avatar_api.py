@@ -0,0 +1,99 @@
+"""
+Direct avatar-list fetch using a session captured by the scraper.
+
+When the scraper finishes logging in it hands over the web app's bearer
+token and user id. Later refreshes ask the Ready Player Me API for the
+avatar list as JSON with that session, which is one request instead of
+driving the studio pages. If there is no session, or the request fails, the
+caller falls back to the scraper; a rejected token (401/403) also discards
+the stored session.
+
+``RPM_API_BASE`` and ``RPM_MODELS_BASE`` point the fetch at a stand-in
+server (see ``benchmarks/fixture_server.py``).
+
+The UI helper (``rpm_ui_webview.py``) imports this file as a top-level
+module and fetches the list from its own process.
+"""
+
+import json
+import os
+import urllib.error
+import urllib.parse
+import urllib.request
+
+API_BASE = 'https://api.readyplayer.me'
+MODELS_BASE = 'https://models.readyplayer.me'
+ENV_API_BASE = 'RPM_API_BASE'
+ENV_MODELS_BASE = 'RPM_MODELS_BASE'
+ENV_SESSION = 'RPM_SESSION_PATH'
+SESSION_NAME = 'readyplayerme_session.json'
+TIMEOUT = 15
+
+
+class SessionExpired(Exception):
+    """The API rejected the stored session."""
+
+
+def avatar_entry(avatar_id, models_base=None):
+    """An avatar in the scraper's ``{id, thumb, glb}`` format."""
+    base = (models_base or os.environ.get(ENV_MODELS_BASE) or MODELS_BASE).rstrip('/')
+    return {
+        'id': avatar_id,
+        'thumb': f'{base}/{avatar_id}.png',
+        'glb': f'{base}/{avatar_id}.glb',
+    }
+
+
+def load_session(path):
+    """Stored ``{token, user_id}`` or None."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            session = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if isinstance(session, dict) and session.get('token') and session.get('user_id'):
+        return session
+    return None
+
+
+def save_session(path, session):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(session, f)
+    os.replace(tmp, path)
+
+
+def clear_session(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def fetch_avatar_list(session, api_base=None, timeout=TIMEOUT):
+    """Avatar list for ``session`` as a scraper result (``{type: 'list', items}``)."""
+    base = (api_base or os.environ.get(ENV_API_BASE) or API_BASE).rstrip('/')
+    query = urllib.parse.urlencode({'select': 'id', 'userId': session['user_id']})
+    request = urllib.request.Request(
+        f'{base}/v1/avatars?{query}',
+        headers={
+            'Authorization': f'Bearer {session["token"]}',
+            'Accept': 'application/json',
+        },
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as resp:
+            payload = json.load(resp)
+    except urllib.error.HTTPError as e:
+        if e.code in (401, 403):
+            raise SessionExpired(f'HTTP {e.code}') from e
+        raise
+    data = payload.get('data') if isinstance(payload, dict) else payload
+    if not isinstance(data, list):
+        raise ValueError('unexpected avatar list response')
+    items = []
+    for entry in data:
+        avatar_id = entry.get('id') if isinstance(entry, dict) else entry
+        if avatar_id:
+            items.append(avatar_entry(str(avatar_id)))
+    return {'type': 'list', 'items': items}
@@ -0,0 +1,253 @@
+"""
+Manifest and report for headless batch imports.
+
+``blender -b --command rpm_import manifest.json`` (registered by the addon,
+see ``_cli_batch_import``) imports every avatar listed in a JSON manifest::
+
+    {
+      "options": {"quality": "medium", "texture_atlas_size": "512"},
+      "models_base": "http://127.0.0.1:8765",
+      "avatars": [
+        "64f0c1e2a3b4c5d6e7f80912",
+        {"url": "https://models.readyplayer.me/64f0c1e2a3b4c5d6e7f80913.glb",
+         "name": "hero", "options": {"t_pose": false}}
+      ]
+    }
+
+Avatars are given by id (resolved against ``models_base``, then
+``RPM_MODELS_BASE``, then the Ready Player Me model server) or by URL. Top
+level ``options`` apply to every avatar and per-avatar ``options`` override
+them. Downloads run in parallel through ``rpm_import_queue``; the imports run
+one at a time on the main thread and each writes ``<name>.blend``, or all go
+into one combined file. ``write_report`` records per-avatar timings as JSON.
+
+With ``--processes N`` the command coordinates instead of importing:
+``WorkerPool`` splits the manifest across N background Blender processes
+that each run ``rpm_import`` on their share, retries the avatars of failed
+workers, and reports throughput in avatars per minute.
+"""
+
+import json
+import os
+import subprocess
+import time
+
+from . import rpm_avatar_api, rpm_cache
+
+# rpm.native_import properties a manifest may set, with their defaults
+IMPORT_OPTIONS = {
+    'quality': 'high',
+    't_pose': True,
+    'arkit_shapes': True,
+    'enable_texture_atlas': True,
+    'texture_atlas_size': '1024',
+}
+REPORT_NAME = 'rpm_import_report.json'
+
+
+class ManifestError(ValueError):
+    """The manifest cannot be used."""
+
+
+class BatchEntry:
+    """One avatar of a batch and what happened to it."""
+
+    def __init__(self, name, url, options):
+        self.name = name
+        self.url = url
+        self.options = options
+        self.status = 'queued'
+        self.error = None
+        self.output = None
+        self.timings = {}
+
+    def as_report(self):
+        return {
+            'name': self.name,
+            'url': self.url,
+            'options': self.options,
+            'status': self.status,
+            'error': str(self.error) if self.error else None,
+            'output': self.output,
+            'seconds': {k: round(v, 4) for k, v in self.timings.items() if v is not None},
+        }
+
+    def as_manifest(self):
+        return {'url': self.url, 'name': self.name, 'options': self.options}
+
+    def update_from_report(self, result):
+        """Take over a worker's result for this avatar."""
+        self.status = result.get('status', 'failed')
+        self.error = result.get('error')
+        self.output = result.get('output')
+        self.timings = dict(result.get('seconds') or {})
+
+
+def _options(values, where):
+    if not isinstance(values, dict):
+        raise ManifestError(f'{where}: options must be an object')
+    unknown = sorted(set(values) - set(IMPORT_OPTIONS))
+    if unknown:
+        raise ManifestError(f'{where}: unknown options {", ".join(unknown)}')
+    options = dict(values)
+    if 'texture_atlas_size' in options:
+        options['texture_atlas_size'] = str(options['texture_atlas_size'])
+    return options
+
+
+def parse_manifest(data):
+    """``BatchEntry`` list for a decoded manifest."""
+    if isinstance(data, list):
+        data = {'avatars': data}
+    if not isinstance(data, dict) or not isinstance(data.get('avatars'), list):
+        raise ManifestError('manifest needs an "avatars" list')
+    defaults = dict(IMPORT_OPTIONS, **_options(data.get('options', {}), 'options'))
+    models_base = data.get('models_base')
+
+    entries = []
+    names = set()
+    for index, avatar in enumerate(data['avatars']):
+        where = f'avatars[{index}]'
+        if isinstance(avatar, str):
+            avatar = {'url': avatar} if '://' in avatar else {'id': avatar}
+        if not isinstance(avatar, dict):
+            raise ManifestError(f'{where}: expected an id, a URL or an object')
+        url = avatar.get('url')
+        if not url:
+            if not avatar.get('id'):
+                raise ManifestError(f'{where}: needs "id" or "url"')
+            url = rpm_avatar_api.avatar_entry(str(avatar['id']), models_base)['glb']
+        name = str(avatar.get('name') or rpm_cache.avatar_id_from_url(url) or f'avatar_{index}')
+        # Output files are named after the avatar, so names must be unique
+        base, n = name, 1
+        while name in names:
+            n += 1
+            name = f'{base}_{n}'
+        names.add(name)
+        options = dict(defaults, **_options(avatar.get('options', {}), where))
+        entries.append(BatchEntry(name, url, options))
+    if not entries:
+        raise ManifestError('manifest lists no avatars')
+    return entries
+
+
+def load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise ManifestError(f'{path}: {e}') from e
+    return parse_manifest(data)
+
+
+def write_manifest(path, entries):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'avatars': [e.as_manifest() for e in entries]}, f, indent=2)
+
+
+def split(entries, count):
+    """Round-robin ``entries`` into at most ``count`` non-empty shards."""
+    return [shard for shard in (entries[i::count] for i in range(count)) if shard]
+
+
+class WorkerPool:
+    """Import a batch in parallel Blender processes.
+
+    ``command`` starts one worker on a shard manifest, e.g.
+    ``[blender, '-b', '--command', 'rpm_import']``; the shard manifest, output
+    directory and report path are appended. Worker manifests, reports and
+    logs go to ``<output_dir>/workers``. Avatars a worker did not finish
+    (failed, or lost with a crashed or timed out worker) are split across the
+    workers again, up to ``retries`` times.
+    """
+
+    def __init__(self, command, processes, output_dir, retries=1, timeout=None, worker_args=()):
+        self.command = list(command)
+        self.processes = max(1, processes)
+        self.output_dir = output_dir
+        self.retries = retries
+        self.timeout = timeout
+        self.worker_args = list(worker_args)
+        self.work_dir = os.path.join(output_dir, 'workers')
+        self.runs = []
+        self.attempts = 0
+
+    def run(self, entries):
+        """Import ``entries``, updating them in place; returns wall seconds."""
+        os.makedirs(self.work_dir, exist_ok=True)
+        started = time.perf_counter()
+        pending = list(entries)
+        while pending and self.attempts <= self.retries:
+            self.attempts += 1
+            workers = [
+                self._start(f'attempt{self.attempts}_worker{index}', shard)
+                for index, shard in enumerate(split(pending, self.processes))
+            ]
+            for worker in workers:
+                self._finish(*worker)
+            pending = [e for e in pending if e.status != 'done']
+            if pending:
+                print(f'RPM: {len(pending)} avatars left after attempt {self.attempts}')
+        return time.perf_counter() - started
+
+    def _start(self, tag, shard):
+        manifest = os.path.join(self.work_dir, f'{tag}.json')
+        report = os.path.join(self.work_dir, f'{tag}_report.json')
+        write_manifest(manifest, shard)
+        log = open(os.path.join(self.work_dir, f'{tag}.log'), 'w', encoding='utf-8')
+        proc = subprocess.Popen(
+            self.command + [manifest, '--output-dir', self.output_dir, '--report', report]
+            + self.worker_args,
+            stdout=log, stderr=subprocess.STDOUT,
+        )
+        print(f'RPM: Worker {tag} started with {len(shard)} avatars (pid {proc.pid})')
+        return tag, shard, proc, report, log, time.perf_counter()
+
+    def _finish(self, tag, shard, proc, report, log, started):
+        try:
+            remaining = None if self.timeout is None else max(0.0, started + self.timeout - time.perf_counter())
+            code = proc.wait(timeout=remaining)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            code = proc.wait()
+            print(f'RPM: Worker {tag} timed out and was stopped')
+        finally:
+            log.close()
+        results = {}
+        try:
+            with open(report, 'r', encoding='utf-8') as f:
+                results = {r['name']: r for r in json.load(f).get('results', [])}
+        except (OSError, ValueError, KeyError):
+            pass
+        for entry in shard:
+            if entry.name in results:
+                entry.update_from_report(results[entry.name])
+            else:
+                entry.status = 'failed'
+                entry.error = f'worker {tag} exited with code {code}'
+        done = sum(1 for e in shard if e.status == 'done')
+        self.runs.append({
+            'worker': tag,
+            'avatars': len(shard),
+            'done': done,
+            'exit_code': code,
+            'seconds': round(time.perf_counter() - started, 4),
+        })
+        print(f'RPM: Worker {tag} finished: {done}/{len(shard)} done (exit code {code})')
+
+
+def write_report(path, entries, **summary):
+    """Write the batch report; ``summary`` adds top-level fields."""
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'avatars': len(entries),
+        'done': sum(1 for e in entries if e.status == 'done'),
+        'failed': sum(1 for e in entries if e.status != 'done'),
+    }
+    report.update(summary)
+    report['results'] = [e.as_report() for e in entries]
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp, path)
+    return report
@@ -0,0 +1,92 @@
+"""
+Cache of fully post-processed avatars as .blend files.
+
+An import writes the finished armature and meshes (joined, pose applied as
+basis shape key, rest pose applied) to ``<key>.blend`` with
+``bpy.data.libraries.write``; the next import of the same GLB appends them
+in one ``bpy.data.libraries.load`` instead of repeating the glTF import and
+post-processing. The key is the SHA-256 of the GLB contents together with
+the import options and ``PIPELINE_VERSION``, which is bumped whenever
+``_post_import`` changes what it produces. The cache is capped at
+``max_bytes`` with least-recently-used eviction, sharing
+``rpm_cache.IndexedCache`` with the GLB cache.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from . import rpm_cache
+
+PIPELINE_VERSION = 2
+
+
+def file_digest(path, chunk=1024 * 1024):
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def blend_key(glb_digest, options):
+    """Cache key for a GLB's contents imported with ``options``."""
+    payload = json.dumps(
+        {'glb': glb_digest, 'options': options, 'pipeline': PIPELINE_VERSION},
+        sort_keys=True, separators=(',', ':'),
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class BlendCache(rpm_cache.IndexedCache):
+    """Thread-safe on-disk cache of processed avatar .blend files."""
+
+    label = 'processed avatar cache'
+
+    def __init__(self, root, max_bytes=2048 * 1024 * 1024):
+        super().__init__(root, max_bytes)
+
+    # Public API ----------------------------------------------------------
+
+    def lookup(self, key):
+        """Path of the cached .blend for ``key``, or None (counted as a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and os.path.exists(os.path.join(self.root, entry['file'])):
+                entry['last_used'] = time.time()
+                self.stats['hits'] += 1
+                self._save_index()
+                return os.path.join(self.root, entry['file'])
+            self.stats['misses'] += 1
+            return None
+
+    def temp_path(self, key):
+        """Where to write a new .blend before handing it to ``store``."""
+        return os.path.join(self.root, f'{key}.tmp.blend')
+
+    def store(self, key, written, avatar_id=''):
+        """Move ``written`` (see ``temp_path``) into the cache under ``key``."""
+        path = os.path.join(self.root, key + '.blend')
+        os.replace(written, path)
+        with self._lock:
+            now = time.time()
+            self._entries[key] = {
+                'file': key + '.blend',
+                'avatar_id': avatar_id,
+                'size': os.path.getsize(path),
+                'created': now,
+                'last_used': now,
+            }
+            self._evict(keep=key)
+            self._save_index()
+        return path
+
+    def discard(self, key):
+        """Forget ``key``, e.g. when its .blend could not be loaded."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry:
+                self._remove(entry)
+                self._save_index()
@@ -0,0 +1,253 @@
+"""
+Local GLB cache for the Ready Player Me importer.
+
+Downloaded models are stored under a key derived from the avatar id plus the
+normalized query string built by ``ReadyPlayerMeImporter.resolve_download``
+(quality, pose, morphTargets, textureAtlas), so the same avatar fetched with
+the same options is only downloaded once. Entries younger than
+``revalidate_after`` seconds are served without any network access; older
+ones are revalidated with ``If-None-Match`` / ``If-Modified-Since``, and
+used as they are when the server cannot be reached. The cache is capped at
+``max_bytes`` with least-recently-used eviction.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+
+from . import rpm_download
+
+INDEX_NAME = 'index.json'
+
+
+def avatar_id_from_url(url):
+    """Avatar id is the GLB file name without extension."""
+    path = urllib.parse.urlparse(url).path
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def normalized_query(url):
+    """Query string with keys sorted so option order never changes the key."""
+    query = urllib.parse.parse_qsl(urllib.parse.urlparse(url).query, keep_blank_values=True)
+    return urllib.parse.urlencode(sorted(query))
+
+
+def cache_key(avatar_id, query):
+    return hashlib.sha256(f'{avatar_id}?{query}'.encode('utf-8')).hexdigest()
+
+
+class IndexedCache:
+    """Files under ``root`` tracked by a JSON index, with an LRU size cap.
+
+    Shared by ``GlbCache`` and ``rpm_blend_cache.BlendCache``. Subclasses
+    name the cache in log messages with ``label`` and list the counters kept
+    in ``stats`` in ``stat_names``; every entry has at least ``file``,
+    ``size`` and ``last_used``.
+    """
+
+    label = 'cache'
+    stat_names = ('hits', 'misses')
+
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        self._index_path = os.path.join(root, INDEX_NAME)
+        self._entries, self.stats = self._load_index()
+
+    # Index persistence ---------------------------------------------------
+
+    def _load_index(self):
+        stats = dict.fromkeys(self.stat_names, 0)
+        try:
+            with open(self._index_path, encoding='utf-8') as f:
+                data = json.load(f)
+            stats.update(data.get('stats') or {})
+            entries = {
+                k: v for k, v in (data.get('entries') or {}).items()
+                if os.path.exists(os.path.join(self.root, v.get('file', '')))
+            }
+            return entries, stats
+        except (OSError, ValueError):
+            return {}, stats
+
+    def _save_index(self):
+        tmp = self._index_path + '.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'entries': self._entries, 'stats': self.stats}, f, indent=2)
+            os.replace(tmp, self._index_path)
+        except OSError as e:
+            print(f'RPM: Failed to write {self.label} index: {e}')
+
+    # Public API ----------------------------------------------------------
+
+    @property
+    def total_bytes(self):
+        with self._lock:
+            return sum(e.get('size', 0) for e in self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            for entry in self._entries.values():
+                self._remove(entry)
+            self._entries = {}
+            self.stats = dict.fromkeys(self.stat_names, 0)
+            self._save_index()
+
+    # Internals (call with lock held) -------------------------------------
+
+    def _remove(self, entry):
+        try:
+            os.remove(os.path.join(self.root, entry['file']))
+        except OSError:
+            pass
+
+    def _evict(self, keep=None):
+        total = sum(e.get('size', 0) for e in self._entries.values())
+        by_age = sorted(self._entries.items(), key=lambda kv: kv[1].get('last_used', 0))
+        for key, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._remove(entry)
+            total -= entry.get('size', 0)
+            del self._entries[key]
+            print(f"RPM: Evicted {entry.get('avatar_id')} from {self.label}")
+
+
+class GlbCache(IndexedCache):
+    """Thread-safe on-disk GLB cache with an LRU size cap."""
+
+    label = 'GLB cache'
+    stat_names = ('hits', 'misses', 'revalidated', 'bytes_saved')
+
+    def __init__(self, root, max_bytes=1024 * 1024 * 1024, revalidate_after=24 * 3600):
+        super().__init__(root, max_bytes)
+        self.revalidate_after = revalidate_after
+        # key -> [lock, callers] while a fetch of that key is running, so
+        # concurrent fetches of one GLB share a download
+        self._fetch_locks = {}
+
+    # Public API ----------------------------------------------------------
+
+    def lookup(self, url):
+        """Return the cached path for ``url`` if it can be used without the network."""
+        key = cache_key(avatar_id_from_url(url), normalized_query(url))
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry or not self._is_fresh(entry):
+                return None
+            self._record_hit(entry)
+            self._save_index()
+            return os.path.join(self.root, entry['file'])
+
+    def fetch(self, url, progress=None, cancel_event=None):
+        """Return a local path for ``url``, downloading or revalidating as needed.
+
+        Fetches of the same key are serialized: a second caller waits for the
+        first download and is then served from the cache. When a stale entry
+        cannot be revalidated (no network, timeout or a 5xx response) the
+        cached file is used as is and revalidated on a later fetch.
+        """
+        key = cache_key(avatar_id_from_url(url), normalized_query(url))
+        with self._lock:
+            slot = self._fetch_locks.setdefault(key, [threading.Lock(), 0])
+            slot[1] += 1
+        try:
+            with slot[0]:
+                return self._fetch(url, key, progress, cancel_event)
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if not slot[1]:
+                    del self._fetch_locks[key]
+
+    def _fetch(self, url, key, progress, cancel_event):
+        avatar_id = avatar_id_from_url(url)
+        path = os.path.join(self.root, key + '.glb')
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and self._is_fresh(entry):
+                self._record_hit(entry)
+                self._save_index()
+                return path
+            if entry and not os.path.exists(path):
+                entry = None
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            size, resp_headers = rpm_download.stream_to_file(
+                url, path, progress, cancel_event, headers=headers
+            )
+        except urllib.error.HTTPError as e:
+            if not entry or (e.code != 304 and e.code < 500):
+                raise
+            if e.code != 304:
+                print(f'RPM: Could not revalidate {avatar_id} ({e}), using the cached GLB')
+            return self._serve_stale(entry, path, progress, revalidated=e.code == 304)
+        except OSError as e:
+            # URLError, timeouts and dropped connections
+            if not entry:
+                raise
+            print(f'RPM: Could not revalidate {avatar_id} ({e}), using the cached GLB')
+            return self._serve_stale(entry, path, progress, revalidated=False)
+
+        with self._lock:
+            self.stats['misses'] += 1
+            now = time.time()
+            self._entries[key] = {
+                'file': key + '.glb',
+                'avatar_id': avatar_id,
+                'query': normalized_query(url),
+                'size': size,
+                'etag': resp_headers.get('ETag') or '',
+                'last_modified': resp_headers.get('Last-Modified') or '',
+                'fetched': now,
+                'last_used': now,
+            }
+            self._evict(keep=key)
+            self._save_index()
+        return path
+
+    def _serve_stale(self, entry, path, progress, revalidated):
+        """Serve a stale entry; ``revalidated`` restarts its freshness period."""
+        with self._lock:
+            if revalidated:
+                entry['fetched'] = time.time()
+                self.stats['revalidated'] += 1
+            self._record_hit(entry)
+            self._save_index()
+        if progress:
+            progress(entry['size'], entry['size'])
+        return path
+
+    # Internals (call with lock held) -------------------------------------
+
+    def _is_fresh(self, entry):
+        if not os.path.exists(os.path.join(self.root, entry['file'])):
+            return False
+        if self.revalidate_after <= 0:
+            return True
+        return time.time() - entry.get('fetched', 0) < self.revalidate_after
+
+    def _record_hit(self, entry):
+        entry['last_used'] = time.time()
+        self.stats['hits'] += 1
+        self.stats['bytes_saved'] += entry.get('size', 0)
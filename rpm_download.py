@@ -0,0 +1,141 @@
+"""
+Streaming GLB downloads for the Ready Player Me importer.
+
+The transfer runs on a worker thread and writes to a ``.part`` file that is
+only renamed into place once complete, so Blender's main thread stays
+responsive and never imports a truncated GLB. The operators poll a
+``DownloadJob`` from a modal timer for its progress and result.
+"""
+
+import os
+import threading
+import urllib.request
+
+CHUNK_SIZE = 256 * 1024
+TIMEOUT = 30
+
+
+class DownloadCancelled(Exception):
+    """Raised when a streaming download is cancelled before completion."""
+
+
+def stream_to_file(url, filename, progress=None, cancel_event=None,
+                   chunk_size=CHUNK_SIZE, timeout=TIMEOUT, headers=None):
+    """Stream ``url`` into ``filename``.
+
+    Returns ``(bytes_written, response_headers)``. ``progress(done, total)`` is
+    called after every chunk (``total`` is 0 when the server sends no
+    Content-Length). Setting ``cancel_event`` aborts the transfer with
+    ``DownloadCancelled`` and removes the partial file. Extra request
+    ``headers`` are sent as-is, so conditional requests surface a 304 as
+    ``urllib.error.HTTPError``.
+    """
+    part_path = filename + '.part'
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as resp:
+            resp_headers = resp.headers
+            total = int(resp.headers.get('Content-Length') or 0)
+            done = 0
+            if progress:
+                progress(done, total)
+            with open(part_path, 'wb') as f:
+                while True:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise DownloadCancelled(url)
+                    chunk = resp.read(chunk_size)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    done += len(chunk)
+                    if progress:
+                        progress(done, total)
+        if total and done != total:
+            raise OSError(f'Incomplete download: got {done} of {total} bytes')
+        os.replace(part_path, filename)
+        return done, resp_headers
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
+
+
+def format_bytes(count):
+    """Human readable byte count for status messages."""
+    for unit in ('B', 'KB', 'MB'):
+        if count < 1024:
+            return f'{count:.0f} {unit}' if unit == 'B' else f'{count:.1f} {unit}'
+        count /= 1024
+    return f'{count:.1f} GB'
+
+
+class DownloadJob:
+    """Download a single file on a background thread.
+
+    With a ``cache`` (see ``rpm_cache.GlbCache``) the file is fetched through
+    it and ``filename`` is set to the cached path once finished.
+
+    All attributes are plain values so the main thread can read them from a
+    timer without locking; only the worker thread writes them.
+    """
+
+    def __init__(self, url, filename=None, cache=None):
+        self.url = url
+        self.filename = filename
+        self.cache = cache
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self.error = None
+        self.finished = False
+        self._cancel = threading.Event()
+        self._thread = None
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def percent(self):
+        if not self.bytes_total:
+            return 0.0
+        return min(100.0, 100.0 * self.bytes_done / self.bytes_total)
+
+    def status_text(self):
+        done = format_bytes(self.bytes_done)
+        if self.bytes_total:
+            total = format_bytes(self.bytes_total)
+            return f'Downloading avatar: {done} / {total} ({self.percent:.0f}%)'
+        return f'Downloading avatar: {done}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        if self._thread:
+            self._thread.join(timeout)
+        return self.finished
+
+    def _on_progress(self, done, total):
+        self.bytes_done = done
+        self.bytes_total = total
+
+    def run(self):
+        """Perform the download on the calling thread (used by worker pools)."""
+        try:
+            if self.cache is not None:
+                self.filename = self.cache.fetch(self.url, self._on_progress, self._cancel)
+            else:
+                stream_to_file(self.url, self.filename, self._on_progress, self._cancel)
+        except DownloadCancelled:
+            pass
+        except Exception as e:
+            self.error = e
+        finally:
+            self.finished = True
@@ -0,0 +1,241 @@
+"""
+Memory-mapped reader for Ready Player Me GLB files.
+
+``GlbFile`` maps a .glb, parses its JSON chunk and returns accessors as
+NumPy views straight into the mapped binary chunk (no copy, no Python
+lists), ready for ``foreach_set``. ``check_supported`` accepts the subset of
+glTF that Ready Player Me avatars use: one embedded buffer, one skin,
+skinned triangle meshes with position morph targets, and metallic-roughness
+materials with embedded textures. Anything else raises ``UnsupportedGlb``
+so that the caller can fall back to Blender's glTF importer.
+"""
+
+import json
+import mmap
+import struct
+
+import numpy as np
+
+GLB_MAGIC = 0x46546C67  # 'glTF'
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+COMPONENT_TYPES = {
+    5120: np.int8,
+    5121: np.uint8,
+    5122: np.int16,
+    5123: np.uint16,
+    5125: np.uint32,
+    5126: np.float32,
+}
+TYPE_WIDTHS = {'SCALAR': 1, 'VEC2': 2, 'VEC3': 3, 'VEC4': 4, 'MAT4': 16}
+
+MESH_ATTRIBUTES = {'POSITION', 'NORMAL', 'TANGENT', 'TEXCOORD_0', 'TEXCOORD_1'}
+SKIN_ATTRIBUTES = ('JOINTS_', 'WEIGHTS_')
+TARGET_ATTRIBUTES = {'POSITION', 'NORMAL', 'TANGENT'}
+TRIANGLES = 4
+
+
+class UnsupportedGlb(Exception):
+    """The file uses glTF features the fast loader does not handle."""
+
+
+class GlbFile:
+    """A memory-mapped .glb; use as a context manager."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.gltf, self._bin_offset, self._bin_length = self._read_chunks()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        mapped = getattr(self, '_map', None)
+        self._map = None
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                # Accessor views are still alive; the mapping goes with them
+                pass
+        self._file.close()
+
+    def _read_chunks(self):
+        if len(self._map) < 20:
+            raise UnsupportedGlb('file too short for a GLB')
+        magic, version, length = struct.unpack_from('<III', self._map, 0)
+        if magic != GLB_MAGIC or version != 2:
+            raise UnsupportedGlb('not a glTF 2.0 binary')
+        gltf, bin_offset, bin_length = None, None, 0
+        offset = 12
+        while offset + 8 <= min(length, len(self._map)):
+            chunk_length, chunk_type = struct.unpack_from('<II', self._map, offset)
+            start = offset + 8
+            if chunk_type == CHUNK_JSON and gltf is None:
+                gltf = json.loads(self._map[start:start + chunk_length].decode('utf-8'))
+            elif chunk_type == CHUNK_BIN and bin_offset is None:
+                bin_offset, bin_length = start, chunk_length
+            offset = start + chunk_length + (-chunk_length % 4)
+        if gltf is None:
+            raise UnsupportedGlb('no JSON chunk')
+        return gltf, bin_offset, bin_length
+
+    def view_bytes(self, index):
+        """Contents of buffer view ``index`` as a memoryview of the mapping."""
+        view = self.gltf['bufferViews'][index]
+        start = self._bin_offset + view.get('byteOffset', 0)
+        return memoryview(self._map)[start:start + view['byteLength']]
+
+    def accessor(self, index):
+        """Accessor ``index`` as a (count, width) array.
+
+        Float accessors are read-only views of the file; normalized integer
+        accessors are converted to float32 as the glTF spec defines.
+        """
+        acc = self.gltf['accessors'][index]
+        dtype = np.dtype(COMPONENT_TYPES[acc['componentType']]).newbyteorder('<')
+        width = TYPE_WIDTHS[acc['type']]
+        count = acc['count']
+        if 'bufferView' not in acc:
+            return np.zeros((count, width), dtype=np.float32 if acc.get('normalized') else dtype)
+        view = self.gltf['bufferViews'][acc['bufferView']]
+        offset = view.get('byteOffset', 0) + acc.get('byteOffset', 0)
+        stride = view.get('byteStride') or dtype.itemsize * width
+        if count and offset + stride * (count - 1) + dtype.itemsize * width > self._bin_length:
+            raise UnsupportedGlb(f'accessor {index} runs past the binary chunk')
+        array = np.ndarray(
+            (count, width), dtype=dtype, buffer=self._map,
+            offset=self._bin_offset + offset, strides=(stride, dtype.itemsize),
+        )
+        if acc.get('normalized'):
+            info = np.iinfo(dtype)
+            array = np.maximum(array.astype(np.float32) / info.max, -1.0)
+        return array
+
+    def matrices(self, index):
+        """MAT4 accessor ``index`` as (count, 4, 4) row-major float64 matrices."""
+        # glTF stores matrices column by column
+        return self.accessor(index).reshape(-1, 4, 4).transpose(0, 2, 1).astype(np.float64)
+
+
+def _require(condition, reason):
+    if not condition:
+        raise UnsupportedGlb(reason)
+
+
+def check_supported(gltf):
+    """Raise ``UnsupportedGlb`` unless the fast loader can build ``gltf``."""
+    _require(not gltf.get('extensionsRequired'), 'required extensions')
+    _require(not gltf.get('extensionsUsed'), f'extensions {gltf.get("extensionsUsed")}')
+    buffers = gltf.get('buffers', [])
+    _require(len(buffers) <= 1 and all('uri' not in b for b in buffers), 'external buffers')
+    _require(not gltf.get('animations'), 'animations')
+    _require(not gltf.get('cameras'), 'cameras')
+    _require(len(gltf.get('skins', [])) == 1, 'needs exactly one skin')
+    _require(len(gltf.get('scenes', [])) <= 1, 'several scenes')
+    for acc in gltf.get('accessors', []):
+        _require('sparse' not in acc, 'sparse accessors')
+        _require(acc['componentType'] in COMPONENT_TYPES, 'unknown component type')
+        _require(acc['type'] in TYPE_WIDTHS, f'{acc["type"]} accessors')
+        _require(acc['type'] != 'MAT4' or acc['componentType'] == 5126, 'padded matrix accessors')
+
+    joints = set(gltf['skins'][0]['joints'])
+    for node in gltf.get('nodes', []):
+        _require(not node.get('extensions'), 'node extensions')
+        _require('camera' not in node, 'cameras')
+        if 'mesh' in node:
+            _require(node.get('skin') == 0, f'unskinned mesh {node.get("name")}')
+    for mesh in gltf.get('meshes', []):
+        for prim in mesh['primitives']:
+            _require(prim.get('mode', TRIANGLES) == TRIANGLES, 'non-triangle primitives')
+            _require('indices' in prim, 'unindexed primitives')
+            _require(not prim.get('extensions'), 'primitive extensions')
+            for name in prim['attributes']:
+                _require(name in MESH_ATTRIBUTES or name.startswith(SKIN_ATTRIBUTES),
+                         f'{name} attributes')
+            for target in prim.get('targets', []):
+                _require(set(target) <= TARGET_ATTRIBUTES, 'morph target attributes')
+        counts = {len(p.get('targets', [])) for p in mesh['primitives']}
+        _require(len(counts) == 1, 'primitives with different morph targets')
+    for material in gltf.get('materials', []):
+        _require(not material.get('extensions'), 'material extensions')
+        _require(material.get('alphaMode', 'OPAQUE') in ('OPAQUE', 'BLEND'), 'alpha masks')
+        for _slot, info in _material_textures(material):
+            _require(info.get('texCoord', 0) == 0, 'textures on a second UV map')
+            _require(not info.get('extensions'), 'texture transforms')
+    for texture in gltf.get('textures', []):
+        _require('source' in texture and not texture.get('extensions'), 'texture extensions')
+    for image in gltf.get('images', []):
+        _require('bufferView' in image, 'external images')
+    # Besides joints and meshes only the joints' ancestors (the armature) may exist
+    parents = node_parents(gltf)
+    allowed = set(joints)
+    for joint in joints:
+        parent = parents[joint]
+        while parent is not None and parent not in allowed:
+            allowed.add(parent)
+            parent = parents[parent]
+    for index, node in enumerate(gltf.get('nodes', [])):
+        _require(index in allowed or 'mesh' in node, f'empty node {node.get("name", index)}')
+
+
+def _material_textures(material):
+    """(slot, textureInfo) pairs of a material."""
+    pbr = material.get('pbrMetallicRoughness', {})
+    pairs = [(k, pbr[k]) for k in ('baseColorTexture', 'metallicRoughnessTexture') if k in pbr]
+    pairs += [(k, material[k]) for k in ('normalTexture', 'occlusionTexture', 'emissiveTexture')
+              if k in material]
+    return pairs
+
+
+def node_matrix(node):
+    """Local 4x4 transform of a glTF node (row-major, float64)."""
+    if 'matrix' in node:
+        return np.array(node['matrix'], dtype=np.float64).reshape(4, 4).T
+    x, y, z, w = node.get('rotation', (0.0, 0.0, 0.0, 1.0))
+    rotation = np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+    ])
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation * np.asarray(node.get('scale', (1.0, 1.0, 1.0)))
+    matrix[:3, 3] = node.get('translation', (0.0, 0.0, 0.0))
+    return matrix
+
+
+def node_parents(gltf):
+    """Parent index of every node (None for roots)."""
+    parents = [None] * len(gltf.get('nodes', []))
+    for index, node in enumerate(gltf.get('nodes', [])):
+        for child in node.get('children', []):
+            parents[child] = index
+    return parents
+
+
+def world_matrices(gltf):
+    """World transform of every node."""
+    nodes = gltf.get('nodes', [])
+    parents = node_parents(gltf)
+    world = [None] * len(nodes)
+
+    def resolve(index):
+        if world[index] is None:
+            local = node_matrix(nodes[index])
+            parent = parents[index]
+            world[index] = local if parent is None else resolve(parent) @ local
+        return world[index]
+
+    for index in range(len(nodes)):
+        resolve(index)
+    return world
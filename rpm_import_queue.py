@@ -0,0 +1,132 @@
+"""
+Batch import queue for the Ready Player Me importer.
+
+Downloads for queued avatars run in parallel on a bounded thread pool, while
+the ``bpy`` import of each finished download is left to the Blender main
+thread, which takes one ready item at a time via ``next_ready``. The queue
+lives for the whole Blender session, independent of the webview window, so
+requests are never overwritten or dropped when several arrive at once.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import rpm_download
+
+QUEUED = 'queued'
+DOWNLOADING = 'downloading'
+DOWNLOADED = 'downloaded'
+IMPORTING = 'importing'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINAL_STATES = (DONE, FAILED, CANCELLED)
+
+
+class ImportItem:
+    """One avatar moving through download and import."""
+
+    def __init__(self, item_id, url, filename, options, cache=None):
+        self.item_id = item_id
+        self.options = options
+        self.job = rpm_download.DownloadJob(url, filename, cache=cache)
+        self.status = QUEUED
+        self.error = None
+        self.download_seconds = None
+        self._reported = None
+
+    @property
+    def path(self):
+        return self.job.filename
+
+    def as_status(self):
+        return {
+            'id': self.item_id,
+            'status': self.status,
+            'percent': round(self.job.percent),
+            'error': str(self.error) if self.error else None,
+        }
+
+    def _download(self):
+        if self.job.cancelled:
+            self.status = CANCELLED
+            return
+        self.status = DOWNLOADING
+        started = time.perf_counter()
+        self.job.run()
+        self.download_seconds = time.perf_counter() - started
+        if self.job.cancelled:
+            self.status = CANCELLED
+        elif self.job.error:
+            self.error = self.job.error
+            self.status = FAILED
+        else:
+            self.status = DOWNLOADED
+
+
+class ImportQueue:
+    """Ordered queue of ``ImportItem`` with a bounded download pool."""
+
+    def __init__(self, max_workers=3):
+        self.max_workers = max_workers
+        self.items = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='rpm-download')
+
+    def add(self, item):
+        with self._lock:
+            self.items.append(item)
+        self._executor.submit(item._download)
+        return item
+
+    def next_ready(self):
+        """Oldest item whose download finished and is waiting to be imported."""
+        with self._lock:
+            for item in self.items:
+                if item.status == DOWNLOADED:
+                    return item
+        return None
+
+    def has_pending(self):
+        with self._lock:
+            return any(item.status not in FINAL_STATES for item in self.items)
+
+    def poll_changes(self):
+        """Items whose status or whole-percent progress changed since the last call."""
+        changed = []
+        with self._lock:
+            for item in self.items:
+                state = (item.status, round(item.job.percent))
+                if state != item._reported:
+                    item._reported = state
+                    changed.append(item)
+        return changed
+
+    def prune(self):
+        """Forget finished items once they have been reported."""
+        with self._lock:
+            self.items = [
+                item for item in self.items
+                if item.status not in FINAL_STATES
+                or item._reported is None or item._reported[0] != item.status
+            ]
+
+    def cancel_all(self):
+        with self._lock:
+            for item in self.items:
+                if item.status in (QUEUED, DOWNLOADING):
+                    item.job.cancel()
+
+    def shutdown(self):
+        with self._lock:
+            for item in self.items:
+                if item.status == QUEUED:
+                    # cancel_futures drops its download, which would otherwise
+                    # be the one to mark it cancelled
+                    item.job.cancel()
+                    item.status = CANCELLED
+                elif item.status == DOWNLOADING:
+                    item.job.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -7,7 +7,16 @@
     } catch(e) {}
   };
   
-  dbg('inject v1.0.49');
+  // Injected on every document load; a second injection into the same
+  // document (e.g. the first page finishing before the hook was attached)
+  // must not start a second loop
+  if(window.__rpmInstalled) {
+    dbg('inject: already installed in this document, skipping');
+    return;
+  }
+  window.__rpmInstalled = true;
+  
+  dbg('inject v1.0.51');
   
   function updateProgress(percent) {
     try {
@@ -437,17 +446,15 @@
         return box;
       }
       
-      var nodes = [].slice.call(document.querySelectorAll('p, a, span, div'));
-      for(var i = 0; i < nodes.length; i++) {
-        var t = (nodes[i].textContent || '');
-        var m = t.match(re);
-        if(m && m[1]) {
-          var v = isValidSub(m[1]);
-          if(v) {
-            window.__rpmSub = v;
-            dbg('extractSub from text: ' + v);
-            return v;
-          }
+      // One match over the page text instead of every element's textContent
+      var text = (document.body && document.body.textContent) || '';
+      var tm = text.match(/([a-z0-9-]+)\.readyplayer\.me/ig) || [];
+      for(var i = 0; i < tm.length; i++) {
+        var v = isValidSub(tm[i].split('.')[0]);
+        if(v) {
+          window.__rpmSub = v;
+          dbg('extractSub from text: ' + v);
+          return v;
         }
       }
       
@@ -496,65 +503,181 @@
     return null;
   }
   
-  function collect() {
-    var imgs = [].slice.call(document.querySelectorAll('img'));
+  // The logged-in web app's bearer token, sent along with the avatar list so
+  // later refreshes can fetch the list directly
+  function findSession() {
+    try {
+      var stores = [window.localStorage, window.sessionStorage];
+      for(var s = 0; s < stores.length; s++) {
+        var store = stores[s];
+        if(!store) continue;
+        for(var i = 0; i < store.length; i++) {
+          var v = store.getItem(store.key(i)) || '';
+          var m = v.match(/eyJ[\w-]+\.[\w-]+\.[\w-]+/);
+          if(!m) continue;
+          try {
+            var b64 = m[0].split('.')[1].replace(/-/g, '+').replace(/_/g, '/');
+            var claims = JSON.parse(atob(b64));
+            var uid = claims.userId || claims.user_id || claims._id || claims.sub;
+            if(!uid) continue;
+            dbg('Session captured for direct avatar fetch');
+            return {token: m[0], user_id: String(uid)};
+          } catch(_) {}
+        }
+      }
+      dbg('No session token found');
+    } catch(e) {
+      dbg('findSession error: ' + e);
+    }
+    return null;
+  }
+  
+  function avatarIdFromUrl(s) {
+    if(!s) return null;
+    try {
+      var dec = s;
+      var qi = s.indexOf('url=');
+      if(qi !== -1) {
+        var after = s.slice(qi + 4);
+        var amp = after.indexOf('&');
+        var urlParam = amp !== -1 ? after.slice(0, amp) : after;
+        try { dec = decodeURIComponent(urlParam); } catch(_) {}
+      }
+      var candidates = [s, dec];
+      for(var i=0;i<candidates.length;i++) {
+        var str = candidates[i] || '';
+        var m = str.match(/https?:\/\/models\.readyplayer\.me\/([a-f0-9]+)\.(png|glb)/i);
+        if(m) return m[1];
+      }
+    } catch(_) {}
+    return null;
+  }
+  
+  function avatarIdFromImg(img) {
+    var cands = [];
+    var src = img.currentSrc || img.src || '';
+    if(src) cands.push(src);
+    var ss = img.getAttribute('srcset') || '';
+    if(ss) {
+      try {
+        var parts = ss.split(',');
+        for(var k=0;k<parts.length;k++) {
+          var urlOnly = parts[k].trim().split(' ')[0];
+          if(urlOnly) cands.push(urlOnly);
+        }
+      } catch(_) {}
+    }
+    var id = null;
+    for(var j=0;j<cands.length && !id;j++) {
+      id = avatarIdFromUrl(cands[j]);
+    }
+    return id;
+  }
+  
+  // Avatar list on the subdomain pages. The page is scanned once, then a
+  // MutationObserver looks only at images that are added or whose src changes.
+  // The list is reported once no new avatar has shown up for COLLECT_QUIET_MS;
+  // with nothing found yet it keeps waiting (the helper has its own deadline).
+  var COLLECT_QUIET_MS = 400;
+  var COLLECT_MAX_MS = 8000;
+  
+  function collectAvatars(onDone) {
     var out = [];
     var seen = {};
+    var started = Date.now();
+    var quietTimer = null;
+    var observer = null;
+    var done = false;
     
     updateProgress(60);
     
-    function extractIdFromStr(s) {
-      if(!s) return null;
-      try {
-        var dec = s;
-        var qi = s.indexOf('url=');
-        if(qi !== -1) {
-          var after = s.slice(qi + 4);
-          var amp = after.indexOf('&');
-          var urlParam = amp !== -1 ? after.slice(0, amp) : after;
-          try { dec = decodeURIComponent(urlParam); } catch(_) {}
-        }
-        var candidates = [s, dec];
-        for(var i=0;i<candidates.length;i++) {
-          var str = candidates[i] || '';
-          var m = str.match(/https?:\/\/models\.readyplayer\.me\/([a-f0-9]+)\.(png|glb)/i);
-          if(m) return m[1];
-        }
-      } catch(_) {}
-      return null;
+    function addImg(img) {
+      var id = avatarIdFromImg(img);
+      if(!id || seen[id]) return false;
+      seen[id] = 1;
+      out.push({
+        id: id,
+        thumb: 'https://models.readyplayer.me/' + id + '.png',
+        glb: 'https://models.readyplayer.me/' + id + '.glb'
+      });
+      return true;
     }
     
-    for(var i = 0; i < imgs.length; i++) {
-      var cands = [];
-      var src = imgs[i].currentSrc || imgs[i].src || '';
-      if(src) cands.push(src);
-      var ss = imgs[i].getAttribute('srcset') || '';
-      if(ss) {
-        try {
-          var parts = ss.split(',');
-          for(var k=0;k<parts.length;k++) {
-            var urlOnly = parts[k].trim().split(' ')[0];
-            if(urlOnly) cands.push(urlOnly);
-          }
-        } catch(_) {}
-      }
-      var id = null;
-      for(var j=0;j<cands.length && !id;j++) {
-        id = extractIdFromStr(cands[j]);
+    function scan(node) {
+      var found = false;
+      if(node.nodeType !== 1) return false;
+      if(node.tagName === 'IMG') return addImg(node);
+      var imgs = node.getElementsByTagName('img');
+      for(var i = 0; i < imgs.length; i++) {
+        if(addImg(imgs[i])) found = true;
       }
-      if(id && !seen[id]) {
-        seen[id] = 1;
-        out.push({
-          id: id,
-          thumb: 'https://models.readyplayer.me/' + id + '.png',
-          glb: 'https://models.readyplayer.me/' + id + '.glb'
-        });
-        // Progress 60-90% based on avatar collection
-        var progress = 60 + Math.floor((out.length / Math.max(imgs.length, 1)) * 30);
-        updateProgress(Math.min(progress, 90));
+      return found;
+    }
+    
+    function finish() {
+      if(done) return;
+      if(!out.length) {
+        dbg('No avatars yet, still watching the page');
+        return;
       }
+      done = true;
+      if(observer) observer.disconnect();
+      dbg('Collected ' + out.length + ' avatars in ' + (Date.now() - started) + 'ms');
+      onDone(out);
+    }
+    
+    function settle() {
+      // Progress 60-90% as avatars come in
+      updateProgress(Math.min(60 + out.length, 90));
+      if(quietTimer) clearTimeout(quietTimer);
+      var wait = Math.min(COLLECT_QUIET_MS, Math.max(0, started + COLLECT_MAX_MS - Date.now()));
+      quietTimer = setTimeout(finish, wait);
+    }
+    
+    try {
+      observer = new MutationObserver(function(records) {
+        if(done) return;
+        var found = false;
+        for(var r = 0; r < records.length; r++) {
+          var rec = records[r];
+          if(rec.type === 'attributes') {
+            if(rec.target.tagName === 'IMG' && addImg(rec.target)) found = true;
+            continue;
+          }
+          for(var n = 0; n < rec.addedNodes.length; n++) {
+            if(scan(rec.addedNodes[n])) found = true;
+          }
+        }
+        if(found) settle();
+      });
+      observer.observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: ['src', 'srcset']
+      });
+    } catch(e) {
+      dbg('collectAvatars observer error: ' + e);
+    }
+    
+    scan(document.documentElement);
+    settle();
+  }
+  
+  function sendAvatarList(list, closeDelay) {
+    try {
+      window.pywebview.api.on_list({type: 'list', items: list, session: findSession(), sub: location.host.split('.')[0]});
+      dbg('Avatar list sent, closing window in ' + closeDelay + 'ms...');
+      setTimeout(function() {
+        try {
+          window.pywebview.api.close_window();
+        } catch(e) {
+          dbg('close_window error: ' + e);
+        }
+      }, closeDelay);
+    } catch(e) {
+      dbg('on_list API error: ' + e);
     }
-    return out;
   }
   
   function sendCreds(e, p) {
@@ -1009,63 +1132,18 @@
       } else if(/\.readyplayer\.me$/.test(h) && p.indexOf('/avatar/choose') === 0) {
         removeOverlay();
         
-        if(!window.__rpmChoosePageHandled) {
-          window.__rpmChoosePageHandled = true;
-          
-          dbg('Choose page detected, waiting 500ms for avatars to load...');
-          
-          var attemptCollect = function(attempt) {
-            try {
-              var list = collect();
-              dbg('Attempt ' + attempt + ': Collected ' + (list ? list.length : 0) + ' avatars');
-              
-              if(list && list.length) {
-                dbg('Sending avatar list via on_list API...');
-                try {
-                  window.pywebview.api.on_list({type: 'list', items: list});
-                  dbg('Avatar list sent successfully, closing window in 500ms...');
-                  setTimeout(function() {
-                    try {
-                      window.pywebview.api.close_window();
-                    } catch(e) {
-                      dbg('close_window error: ' + e);
-                    }
-                  }, 500);
-                } catch(e) {
-                  dbg('on_list API error: ' + e);
-                }
-              } else if(attempt < 10) {
-                dbg('No avatars yet, retrying in 200ms...');
-                setTimeout(function() { attemptCollect(attempt + 1); }, 200);
-              } else {
-                dbg('ERROR: No avatars collected after 10 attempts!');
-              }
-            } catch(e) {
-              dbg('Choose page handler error: ' + e);
-            }
-          };
-          
-          // Wait 500ms before starting to collect avatars to let them all load
-          setTimeout(function() {
-            dbg('Starting avatar collection...');
-            attemptCollect(1);
-          }, 500);
+        if(!window.__rpmCollecting) {
+          window.__rpmCollecting = true;
+          dbg('Choose page detected, watching for avatars...');
+          collectAvatars(function(list) { sendAvatarList(list, 500); });
         }
         return;
       } else if(/\.readyplayer\.me$/.test(h) && p.indexOf('/avatar') === 0) {
-        var list = collect();
-        if(list && list.length) {
-          try {
-            window.pywebview.api.on_list({type: 'list', items: list});
-            dbg('Avatar list sent, closing window in 1s...');
-            setTimeout(function() {
-              try {
-                window.pywebview.api.close_window();
-              } catch(__) {}
-            }, 1000);
-          } catch(_) {}
-          return;
+        if(!window.__rpmCollecting) {
+          window.__rpmCollecting = true;
+          collectAvatars(function(list) { sendAvatarList(list, 1000); });
         }
+        return;
       }
     } catch(e) {
       dbg('loop error: ' + e);
@@ -1086,17 +1164,6 @@
     } catch(__) {}
   });
   
-  if(!window.__rpmLoopStarted) {
-    window.__rpmLoopStarted = true;
-    dbg('Starting main loop');
-    loop();
-  } else {
-    var timeSinceLastLoop = window.__rpmLastLoopTime ? (Date.now() - window.__rpmLastLoopTime) : 9999;
-    if(timeSinceLastLoop > 2000) {
-      dbg('Loop stopped (last ran ' + timeSinceLastLoop + 'ms ago), restarting');
-      loop();
-    } else {
-      dbg('Loop already running, skipping duplicate start');
-    }
-  }
-})();
\ No newline at end of file
+  dbg('Starting main loop');
+  loop();
+})();
@@ -0,0 +1,196 @@
+"""
+Message channel between Blender and the webview helper processes.
+
+Blender owns a ``MessageServer`` listening on a loopback socket; helpers
+connect with ``MessageClient.from_env()`` using the port and token passed in
+their environment. Messages are JSON objects, one per line (NDJSON), so they
+arrive whole and in send order, and helper log output on stdout can never be
+mistaken for a request. Received messages are put on ``messages`` (a
+``queue.Queue``) for the Blender main thread to drain from a timer.
+
+The helpers run outside Blender and import this file as a top-level module,
+which is why it only uses the standard library.
+"""
+
+import json
+import os
+import queue
+import secrets
+import socket
+import threading
+
+ENV_PORT = 'RPM_IPC_PORT'
+ENV_TOKEN = 'RPM_IPC_TOKEN'
+
+
+def _encode(message):
+    return (json.dumps(message, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+class MessageServer:
+    """Loopback NDJSON server; one instance per helper session."""
+
+    def __init__(self):
+        self.token = secrets.token_hex(16)
+        self.messages = queue.Queue()
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.bind(('127.0.0.1', 0))
+        self._sock.listen()
+        self._conns = []
+        self._readers = []
+        self._lock = threading.Lock()
+        self._closed = False
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    @property
+    def port(self):
+        return self._sock.getsockname()[1]
+
+    def env(self):
+        """Environment entries a helper needs to connect back."""
+        return {ENV_PORT: str(self.port), ENV_TOKEN: self.token}
+
+    def get_nowait(self):
+        """Next pending message or None; never blocks the main thread."""
+        try:
+            return self.messages.get_nowait()
+        except queue.Empty:
+            return None
+
+    def send(self, message):
+        """Send ``message`` to every connected helper."""
+        data = _encode(message)
+        with self._lock:
+            conns = list(self._conns)
+        for conn in conns:
+            try:
+                conn.sendall(data)
+            except OSError:
+                pass
+
+    def wait_closed(self, timeout=None):
+        """Wait for connected helpers to hang up so their last messages are queued.
+
+        Returns True once every connection has closed.
+        """
+        readers = list(self._readers)
+        for reader in readers:
+            reader.join(timeout)
+        return not any(reader.is_alive() for reader in readers)
+
+    def close(self):
+        self._closed = True
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+        with self._lock:
+            for conn in self._conns:
+                try:
+                    conn.close()
+                except OSError:
+                    pass
+            self._conns = []
+
+    def _accept_loop(self):
+        while not self._closed:
+            try:
+                conn, _addr = self._sock.accept()
+            except OSError:
+                return
+            reader = threading.Thread(target=self._read_loop, args=(conn,), daemon=True)
+            self._readers.append(reader)
+            reader.start()
+
+    def _read_loop(self, conn):
+        with conn, conn.makefile('r', encoding='utf-8') as stream:
+            try:
+                hello = json.loads(stream.readline())
+            except (OSError, ValueError):
+                return
+            # Anything but {"token": ...} with our token drops the connection
+            if not isinstance(hello, dict) or hello.get('token') != self.token:
+                return
+            with self._lock:
+                self._conns.append(conn)
+            try:
+                for line in stream:
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        print(f'RPM: Dropped malformed IPC message: {line[:80]!r}')
+                        continue
+                    if isinstance(message, dict):
+                        self.messages.put(message)
+            except OSError:
+                pass
+            finally:
+                with self._lock:
+                    if conn in self._conns:
+                        self._conns.remove(conn)
+
+
+class MessageClient:
+    """Helper-side connection to Blender's ``MessageServer``.
+
+    ``on_message`` (optional) is called on a background thread for every
+    message Blender sends to this helper, and ``on_disconnect`` once Blender
+    closes the connection (e.g. when Blender exits).
+    """
+
+    def __init__(self, port, token, on_message=None, on_disconnect=None):
+        self._sock = socket.create_connection(('127.0.0.1', int(port)))
+        self._lock = threading.Lock()
+        self._on_message = on_message
+        self._on_disconnect = on_disconnect
+        self.send({'token': token})
+        if on_message or on_disconnect:
+            threading.Thread(target=self._read_loop, daemon=True).start()
+
+    @classmethod
+    def from_env(cls, on_message=None, on_disconnect=None):
+        """Connect using the environment Blender provided, or return None."""
+        port = os.environ.get(ENV_PORT)
+        token = os.environ.get(ENV_TOKEN)
+        if not port or not token:
+            return None
+        try:
+            return cls(port, token, on_message, on_disconnect)
+        except OSError as e:
+            print(f'RPM IPC: could not connect to Blender: {e}')
+            return None
+
+    def send(self, message):
+        data = _encode(message)
+        try:
+            with self._lock:
+                self._sock.sendall(data)
+            return True
+        except OSError as e:
+            print(f'RPM IPC: send failed: {e}')
+            return False
+
+    def close(self):
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+
+    def _read_loop(self):
+        try:
+            with self._sock.makefile('r', encoding='utf-8') as stream:
+                for line in stream:
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not self._on_message:
+                        continue
+                    try:
+                        self._on_message(message)
+                    except Exception as e:
+                        print(f'RPM IPC: message handler error: {e}')
+        except OSError:
+            pass
+        if self._on_disconnect:
+            self._on_disconnect()
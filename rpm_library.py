@@ -0,0 +1,181 @@
+"""
+Avatar library shared by the addon and the UI helper.
+
+Avatars are dicts with ``avatar_id``, ``glb_url`` and ``thumb_url``. They
+are kept in one SQLite file (``AvatarStore``) in Blender's config directory,
+indexed by avatar id and by list position, so a page of the library or a
+search costs the same no matter how many avatars there are. A refresh is
+reduced to a delta against the stored list so that only the avatars that
+were added, removed or changed are written and sent to the UI.
+
+The UI helper opens the same store from its own process, importing this
+file as a top-level module rather than through the addon package.
+"""
+
+import sqlite3
+import threading
+import time
+
+AVATAR_FIELDS = ('glb_url', 'thumb_url')
+LIBRARY_NAME = 'readyplayerme_library.sqlite'
+ENV_LIBRARY = 'RPM_LIBRARY_PATH'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS avatars (
+    avatar_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    glb_url TEXT NOT NULL DEFAULT '',
+    thumb_url TEXT NOT NULL DEFAULT '',
+    last_imported REAL
+);
+CREATE INDEX IF NOT EXISTS avatars_position ON avatars (position);
+CREATE INDEX IF NOT EXISTS avatars_last_imported ON avatars (last_imported);
+"""
+
+
+def diff_avatars(old, new):
+    """Delta between two avatar lists, matched by ``avatar_id``.
+
+    Returns ``{'added': [...], 'removed': [ids], 'changed': [...]}``. Added
+    avatars carry their ``index`` in ``new`` so they can be inserted in
+    place; changed avatars are the new versions.
+    """
+    old_by_id = {a.get('avatar_id'): a for a in old}
+    new_ids = set()
+    added = []
+    changed = []
+    for index, avatar in enumerate(new):
+        avatar_id = avatar.get('avatar_id')
+        new_ids.add(avatar_id)
+        previous = old_by_id.get(avatar_id)
+        if previous is None:
+            added.append(dict(avatar, index=index))
+        elif any(previous.get(f) != avatar.get(f) for f in AVATAR_FIELDS):
+            changed.append(dict(avatar))
+    removed = [avatar_id for avatar_id in old_by_id if avatar_id not in new_ids]
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+
+def delta_is_empty(delta):
+    return not (delta['added'] or delta['removed'] or delta['changed'])
+
+
+def apply_delta(avatars, delta):
+    """Return ``avatars`` with ``delta`` applied (used for the shared list file)."""
+    removed = set(delta['removed'])
+    changed = {a['avatar_id']: a for a in delta['changed']}
+    result = [
+        {k: v for k, v in changed.get(a['avatar_id'], a).items() if k != 'index'}
+        for a in avatars if a.get('avatar_id') not in removed
+    ]
+    for avatar in delta['added']:
+        entry = {k: v for k, v in avatar.items() if k != 'index'}
+        result.insert(min(avatar.get('index', len(result)), len(result)), entry)
+    return result
+
+
+class AvatarStore:
+    """The avatar library on disk.
+
+    Blender and the UI helper each open their own store on the same file;
+    WAL mode lets one read while the other writes. One connection is shared
+    by the threads of a process, guarded by a lock.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    @staticmethod
+    def _search_clause(search):
+        if not search:
+            return '', ()
+        pattern = '%' + search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        return " WHERE avatar_id LIKE ? ESCAPE '\\'", (pattern,)
+
+    def count(self, search=''):
+        where, params = self._search_clause(search)
+        return self._query('SELECT COUNT(*) AS n FROM avatars' + where, params)[0]['n']
+
+    def __len__(self):
+        return self.count()
+
+    def page(self, offset=0, limit=None, search=''):
+        """Avatars in library order, ``limit`` at a time starting at ``offset``."""
+        limit = -1 if limit is None else limit
+        columns = 'SELECT avatar_id, glb_url, thumb_url, last_imported FROM avatars'
+        if not search:
+            # Positions are dense (0..n-1), so a page is a single index range scan
+            return self._query(
+                columns + ' WHERE position >= ? ORDER BY position LIMIT ?', (offset, limit)
+            )
+        where, params = self._search_clause(search)
+        return self._query(
+            columns + where + ' ORDER BY position LIMIT ? OFFSET ?', params + (limit, offset)
+        )
+
+    def all(self):
+        return self.page()
+
+    def get(self, avatar_id):
+        rows = self._query(
+            'SELECT avatar_id, glb_url, thumb_url, last_imported FROM avatars WHERE avatar_id = ?',
+            (avatar_id,)
+        )
+        return rows[0] if rows else None
+
+    def recently_imported(self, limit=10):
+        return self._query(
+            'SELECT avatar_id, glb_url, thumb_url, last_imported FROM avatars '
+            'WHERE last_imported IS NOT NULL ORDER BY last_imported DESC LIMIT ?',
+            (limit,)
+        )
+
+    def sync(self, avatars):
+        """Make the library match ``avatars``; returns the applied delta."""
+        current = self._query('SELECT avatar_id, glb_url, thumb_url FROM avatars ORDER BY position')
+        delta = diff_avatars(current, avatars)
+        same_order = [a['avatar_id'] for a in current] == [a.get('avatar_id') for a in avatars]
+        if delta_is_empty(delta) and same_order:
+            return delta
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'DELETE FROM avatars WHERE avatar_id = ?',
+                [(avatar_id,) for avatar_id in delta['removed']]
+            )
+            # Positions are rewritten only when something actually changed
+            self._conn.executemany(
+                'INSERT INTO avatars (avatar_id, position, glb_url, thumb_url) '
+                'VALUES (?, ?, ?, ?) ON CONFLICT(avatar_id) DO UPDATE SET '
+                'position = excluded.position, glb_url = excluded.glb_url, '
+                'thumb_url = excluded.thumb_url',
+                [
+                    (a.get('avatar_id') or '', index, a.get('glb_url') or '', a.get('thumb_url') or '')
+                    for index, a in enumerate(avatars)
+                ]
+            )
+        return delta
+
+    def mark_imported(self, avatar_id, when=None):
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE avatars SET last_imported = ? WHERE avatar_id = ?',
+                (time.time() if when is None else when, avatar_id)
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM avatars')
@@ -0,0 +1,60 @@
+"""
+Debounced persistence of the addon preferences.
+
+Saving Blender's user preferences writes every preference to disk, so
+callers mark the preferences dirty instead of saving them directly.
+``SaveScheduler`` combines a burst of updates into one write once there have
+been no updates for ``delay`` seconds. A steady stream of updates is still
+written at least every ``max_delay`` seconds. ``flush`` writes any pending
+change right away and is called on unregister and at exit. The addon
+checks ``seconds_until_due`` from a Blender timer.
+"""
+
+import time
+
+
+class SaveScheduler:
+    """Coalesces dirty marks into calls to ``save``."""
+
+    def __init__(self, save, delay=2.0, max_delay=10.0, clock=time.monotonic):
+        self._save = save
+        self.delay = delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._first_dirty = None
+        self._last_dirty = None
+        self.requests = 0
+        self.writes = 0
+
+    @property
+    def dirty(self):
+        return self._first_dirty is not None
+
+    def mark_dirty(self):
+        now = self._clock()
+        if self._first_dirty is None:
+            self._first_dirty = now
+        self._last_dirty = now
+        self.requests += 1
+
+    def seconds_until_due(self):
+        """Seconds until the pending write is due, 0 if due now, None if clean."""
+        if self._first_dirty is None:
+            return None
+        due = min(self._last_dirty + self.delay, self._first_dirty + self.max_delay)
+        return max(0.0, due - self._clock())
+
+    def flush(self):
+        """Write pending changes now; returns True if a write happened."""
+        if self._first_dirty is None:
+            return False
+        self._first_dirty = self._last_dirty = None
+        self.writes += 1
+        self._save()
+        return True
+
+    @property
+    def saved_writes(self):
+        """Writes avoided by coalescing so far."""
+        pending = 1 if self.dirty else 0
+        return self.requests - self.writes - pending
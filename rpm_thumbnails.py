@@ -0,0 +1,110 @@
+"""
+Asynchronous avatar thumbnail fetching with a persistent on-disk cache.
+
+``ThumbnailService.request`` never blocks: it returns the local path when the
+thumbnail is already on disk, and otherwise schedules a download on a small
+thread pool and returns None so the caller can draw a placeholder. The
+Blender side polls ``pop_completed`` from a timer to redraw once downloads
+land. Files are keyed by avatar id, so they are reused across sessions
+instead of leaking a new temp file per draw.
+"""
+
+import os
+import re
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from . import rpm_download
+
+
+def _safe_name(avatar_id):
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', avatar_id) or 'avatar'
+
+
+class ThumbnailService:
+    """Thread-pool backed thumbnail downloader writing into ``root``."""
+
+    def __init__(self, root, max_workers=4):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='rpm-thumb')
+        self._lock = threading.Lock()
+        self._in_flight = set()
+        self._failed = set()
+        self._completed = []
+
+    def path_for(self, avatar_id, thumb_url):
+        ext = os.path.splitext(urllib.parse.urlparse(thumb_url).path)[1] or '.png'
+        return os.path.join(self.root, _safe_name(avatar_id) + ext)
+
+    def request(self, avatar_id, thumb_url):
+        """Local path if cached, else start a background fetch and return None."""
+        if not thumb_url:
+            return None
+        path = self.path_for(avatar_id, thumb_url)
+        if os.path.exists(path):
+            return path
+        with self._lock:
+            if avatar_id in self._in_flight or avatar_id in self._failed:
+                return None
+            self._in_flight.add(avatar_id)
+        self._executor.submit(self._fetch, avatar_id, thumb_url, path)
+        return None
+
+    def prefetch(self, avatars):
+        """Queue downloads for ``(avatar_id, thumb_url)`` pairs not yet on disk."""
+        for avatar_id, thumb_url in avatars:
+            self.request(avatar_id, thumb_url)
+
+    @property
+    def busy(self):
+        with self._lock:
+            return bool(self._in_flight)
+
+    def pop_completed(self):
+        """Avatar ids whose thumbnails finished downloading since the last call."""
+        with self._lock:
+            done, self._completed = self._completed, []
+        return done
+
+    def forget(self, avatar_id):
+        """Allow a failed thumbnail to be retried."""
+        with self._lock:
+            self._failed.discard(avatar_id)
+
+    def invalidate(self, avatar_id):
+        """Drop every cached thumbnail of ``avatar_id``, e.g. after its URL changed.
+
+        The file name depends on the URL's extension, so the old thumbnail
+        is found by avatar id rather than rebuilt from the new URL.
+        """
+        self.forget(avatar_id)
+        name = _safe_name(avatar_id)
+        try:
+            files = os.listdir(self.root)
+        except OSError:
+            return
+        for filename in files:
+            if os.path.splitext(filename)[0] == name:
+                try:
+                    os.remove(os.path.join(self.root, filename))
+                except OSError:
+                    pass
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch(self, avatar_id, thumb_url, path):
+        try:
+            rpm_download.stream_to_file(thumb_url, path)
+            ok = True
+        except Exception as e:
+            print(f'RPM: Thumbnail download failed for {avatar_id}: {e}')
+            ok = False
+        with self._lock:
+            self._in_flight.discard(avatar_id)
+            if ok:
+                self._completed.append(avatar_id)
+            else:
+                self._failed.add(avatar_id)
@@ -0,0 +1,150 @@
+"""
+Per-stage timing of avatar imports.
+
+``ImportTrace`` records the wall time and resident-memory change of each
+stage of an import (download, glTF import, join, shape keys, rest pose)
+together with vertex, shape-key and material counts. ``summary`` is a one
+line report for the operator; ``append_record`` appends the trace as one
+JSON line to a log that can be collected from several machines and
+aggregated.
+"""
+
+import contextlib
+import json
+import os
+import platform
+import sys
+import threading
+import time
+
+LOG_NAME = 'import_trace.jsonl'
+ENV_LOG = 'RPM_TRACE_LOG'
+
+_log_lock = threading.Lock()
+
+
+def _windows_memory():
+    """PROCESS_MEMORY_COUNTERS of this process, or None."""
+    import ctypes
+    from ctypes import wintypes
+
+    class Counters(ctypes.Structure):
+        _fields_ = [
+            ('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+            ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+            ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t),
+        ]
+
+    counters = Counters()
+    counters.cb = ctypes.sizeof(Counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        return counters
+    return None
+
+
+def peak_rss():
+    """Peak resident memory of this process in bytes, or None if unknown."""
+    try:
+        if sys.platform == 'win32':
+            counters = _windows_memory()
+            return counters.PeakWorkingSetSize if counters else None
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except Exception:
+        return None
+
+
+def current_rss():
+    """Resident memory of this process in bytes, or None if unknown.
+
+    Linux and Windows report the current value; elsewhere this falls back to
+    the peak, so deltas there only show growth of the peak.
+    """
+    try:
+        if sys.platform.startswith('linux'):
+            with open('/proc/self/statm', 'r') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        if sys.platform == 'win32':
+            counters = _windows_memory()
+            return counters.WorkingSetSize if counters else None
+    except Exception:
+        return None
+    return peak_rss()
+
+
+class ImportTrace:
+    """Stages and counts of one import."""
+
+    def __init__(self, avatar_id='', url='', clock=time.perf_counter, memory=current_rss):
+        self.avatar_id = avatar_id
+        self.url = url
+        self.stages = []
+        self.counts = {}
+        self._clock = clock
+        self._memory = memory
+        self._started = clock()
+        self._wall_started = time.time()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time the enclosed block as stage ``name``."""
+        rss = self._memory()
+        started = self._clock()
+        try:
+            yield
+        finally:
+            after = self._memory()
+            self.add(name, self._clock() - started,
+                     None if rss is None or after is None else after - rss)
+
+    def add(self, name, seconds, rss_delta=None):
+        """Record a stage measured elsewhere (e.g. a download on a worker thread)."""
+        self.stages.append({'stage': name, 'seconds': seconds, 'rss_delta': rss_delta})
+
+    def count(self, **counts):
+        self.counts.update(counts)
+
+    @property
+    def total_seconds(self):
+        """Time since the trace started plus stages measured before it."""
+        before = sum(s['seconds'] for s in self.stages if s['stage'] == 'download')
+        return self._clock() - self._started + before
+
+    def summary(self):
+        stages = ', '.join(f"{s['stage']} {s['seconds']:.2f}s" for s in self.stages)
+        counts = ', '.join(f'{v:,} {k.replace("_", " ")}' for k, v in self.counts.items())
+        text = f'Imported in {self.total_seconds:.2f}s ({stages})'
+        return f'{text}; {counts}' if counts else text
+
+    def as_record(self):
+        return {
+            'type': 'rpm_import',
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self._wall_started)),
+            'host': platform.node(),
+            'pid': os.getpid(),
+            'avatar_id': self.avatar_id,
+            'url': self.url,
+            'total_seconds': round(self.total_seconds, 4),
+            'stages': [
+                {'stage': s['stage'], 'seconds': round(s['seconds'], 4), 'rss_delta': s['rss_delta']}
+                for s in self.stages
+            ],
+            'counts': dict(self.counts),
+        }
+
+
+def stage(trace, name):
+    """``trace.stage(name)``, or a no-op when there is no trace."""
+    return trace.stage(name) if trace is not None else contextlib.nullcontext()
+
+
+def append_record(path, record):
+    """Append ``record`` as one JSON line (safe for several threads of one process)."""
+    line = json.dumps(record, separators=(',', ':')) + '\n'
+    with _log_lock:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line)
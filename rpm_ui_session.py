@@ -0,0 +1,100 @@
+"""
+Long-lived webview UI helper process.
+
+The first time the importer UI is opened in a Blender session the helper
+(``rpm_ui_webview.py``) is started cold: a new interpreter imports pywebview
+and builds the window. Closing the window only hides it, so later opens are a
+single ``show`` message over the IPC channel. ``ready_times`` records the
+time from each open request to the page reporting ``ui_ready`` so cold and
+warm opens can be compared.
+"""
+
+import subprocess
+import threading
+import time
+
+from . import rpm_ipc
+
+COLD = 'cold'
+WARM = 'warm'
+
+
+def _forward_stream(stream, prefix):
+    """Echo a child's output stream to this process's console."""
+    try:
+        for line in iter(stream.readline, ''):
+            try:
+                print(f"{prefix}{line.rstrip()}")
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+
+class UIHelperSession:
+    """One running UI helper process and its message channel."""
+
+    def __init__(self, python, helper_path, env):
+        self.channel = rpm_ipc.MessageServer()
+        self.ready_times = []
+        self._open_kind = COLD
+        self._open_started = time.perf_counter()
+        self._exited_at = None
+
+        env = dict(env)
+        env.update(self.channel.env())
+        self.process = subprocess.Popen(
+            [python, helper_path],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=1,
+            universal_newlines=True
+        )
+        for stream, prefix in ((self.process.stdout, 'RPM UI> '),
+                               (self.process.stderr, 'RPM UI ERR> ')):
+            threading.Thread(target=_forward_stream, args=(stream, prefix), daemon=True).start()
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def finished(self, grace=1.0):
+        """True once the helper has exited and its last messages are queued.
+
+        Never blocks; stops waiting for the connections ``grace`` seconds
+        after the exit was first seen.
+        """
+        if self.alive():
+            return False
+        if self._exited_at is None:
+            self._exited_at = time.monotonic()
+        return (self.channel.wait_closed(timeout=0)
+                or time.monotonic() - self._exited_at >= grace)
+
+    def show(self, state):
+        """Ask the warm helper to show its window with fresh ``state``."""
+        self._open_kind = WARM
+        self._open_started = time.perf_counter()
+        self.channel.send({'type': 'show', **state})
+
+    def mark_ready(self):
+        """Record time-to-first-paint for the pending open; None if none pending."""
+        if self._open_started is None:
+            return None
+        elapsed = time.perf_counter() - self._open_started
+        self._open_started = None
+        self.ready_times.append((self._open_kind, elapsed))
+        return self._open_kind, elapsed
+
+    def shutdown(self, timeout=2.0):
+        """Ask the helper to quit, terminating it if it does not exit in time."""
+        if self.alive():
+            self.channel.send({'type': 'quit'})
+            try:
+                self.process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                try:
+                    self.process.terminate()
+                except Exception:
+                    pass
+        self.channel.close()
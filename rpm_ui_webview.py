@@ -2,18 +2,38 @@ import webview
 import json
 import sys
 import os
+import queue
+import shutil
 import subprocess
-import tempfile
 import threading
+import time
+
+import rpm_avatar_api
+import rpm_ipc
+import rpm_library
 
 print('RPM UI helper: starting')
 
 class UIApi:
     def __init__(self):
         self._window = None
+        self._window_closed = False
         self._addon_name = os.environ.get('RPM_ADDON_NAME', '')
         self._refresh_progress = {'message': 'Idle', 'percent': 0, 'complete': True, 'error': None}
-        self._avatars_path = os.environ.get('RPM_AVATARS_PATH', '')
+        self._last_reported_percent = -1
+        self._session_path = os.environ.get(rpm_avatar_api.ENV_SESSION, '')
+        self._webview_storage = os.environ.get('RPM_WEBVIEW_STORAGE', '')
+        self._library = None
+        library_path = os.environ.get(rpm_library.ENV_LIBRARY, '')
+        if library_path:
+            try:
+                self._library = rpm_library.AvatarStore(library_path)
+            except Exception as e:
+                print(f'RPM UI: Could not open avatar library: {e}')
+        # Scraper window mode used outside dev mode (see rpm_webview_helper.window_mode)
+        self._headless_mode = os.environ.get('RPM_DEV_MODE', '0')
+        if self._headless_mode == '1':
+            self._headless_mode = '0'
         self._init_email = os.environ.get('RPM_PREFS_EMAIL', '')
         self._init_password = os.environ.get('RPM_PREFS_PASSWORD', '')
         self._defaults = {
@@ -23,9 +43,90 @@ class UIApi:
             'enable_texture_atlas': os.environ.get('RPM_DEFAULT_ATLAS', '1') == '1',
             'texture_atlas_size': os.environ.get('RPM_DEFAULT_ATLAS_SIZE', '1024'),
         }
+        # Requests to Blender go over the IPC channel instead of request files
+        self._ipc = rpm_ipc.MessageClient.from_env(
+            on_message=self._on_blender_message,
+            on_disconnect=self._on_blender_gone
+        )
+        if not self._ipc:
+            print('RPM UI: WARNING - no IPC channel to Blender; requests will be dropped')
+
+    def _send_to_blender(self, message):
+        """Deliver a request to the Blender main process"""
+        if self._ipc and self._ipc.send(message):
+            return True
+        print(f'RPM UI: Could not deliver {message.get("type")} request to Blender')
+        return False
     
+    @staticmethod
+    def _closed_event(window):
+        # pywebview 4+ groups events under window.events; 3.x has them on the window
+        return (window.events if hasattr(window, 'events') else window).closed
+
     def set_window(self, window):
         self._window = window
+        self._window_closed = False
+        try:
+            closed = self._closed_event(window)
+            closed += self._on_window_closed
+        except Exception as e:
+            print(f'RPM UI: cannot attach closed event: {e}')
+
+    def _window_alive(self):
+        """Whether the UI window can still be shown and scripted"""
+        window = self._window
+        if window is None or self._window_closed:
+            return False
+        # Also check pywebview's own state, so a destroyed window is never
+        # reused even if the closed handler did not run
+        try:
+            return window in webview.windows and not self._closed_event(window).is_set()
+        except Exception:
+            return False
+
+    def _on_window_closed(self):
+        # The native close button destroys the window; the keep-alive window
+        # keeps this process (and pywebview) warm for the next open
+        self._window_closed = True
+        self._send_to_blender({'type': 'window_hidden'})
+
+    def _on_blender_message(self, message):
+        """Handle messages pushed by Blender"""
+        msg_type = message.get('type')
+        if msg_type == 'import_status' and self._window_alive():
+            self._window.evaluate_js(f'onImportStatus({json.dumps(message)})')
+        elif msg_type == 'show':
+            self._show(message)
+        elif msg_type == 'quit':
+            print('RPM UI: quit requested by Blender')
+            for w in list(webview.windows):
+                try:
+                    w.destroy()
+                except Exception:
+                    pass
+            os._exit(0)
+
+    def _on_blender_gone(self):
+        print('RPM UI: Blender connection closed, exiting helper')
+        os._exit(0)
+
+    def _show(self, state):
+        """Show the UI again for a new open from Blender (warm start)"""
+        self._init_email = state.get('email', '')
+        self._init_password = state.get('password', '')
+        os.environ['RPM_DEV_MODE'] = '1' if state.get('dev_mode') else self._headless_mode
+        if self._window_alive():
+            print('RPM UI: showing warm window')
+            self._window.show()
+            # Reload credentials/avatars; the page reports ui_ready once painted
+            self._window.evaluate_js('loadAvatars();')
+        else:
+            print('RPM UI: recreating window in warm helper')
+            self.set_window(create_ui_window(self))
+
+    def ui_ready(self):
+        """Called by the page once it has painted"""
+        self._send_to_blender({'type': 'ui_ready'})
     
     def console_log(self, message):
         """Pipe JavaScript console logs to Blender console"""
@@ -46,12 +147,12 @@ class UIApi:
     def save_credentials(self, email, password):
         """Save credentials to prefs"""
         try:
-            # Write a request file for Blender main process to update AddonPreferences
-            addon_dir = os.path.dirname(__file__)
-            req_file = os.path.join(addon_dir, 'rpm_prefs_request.json')
-            with open(req_file, 'w', encoding='utf-8') as f:
-                json.dump({'type': 'save_credentials', 'email': email or '', 'password': password or ''}, f)
-            print('RPM UI: Credentials save request written')
+            # Ask Blender main process to update AddonPreferences
+            self._send_to_blender({'type': 'save_credentials', 'email': email or '', 'password': password or ''})
+            print('RPM UI: Credentials save request sent')
+            # A different account must log in again before fetching directly
+            if (email or '') != self._init_email and self._session_path:
+                rpm_avatar_api.clear_session(self._session_path)
             # Update local cached values so UI reflects change immediately
             self._init_email = email or ''
             self._init_password = password or ''
@@ -63,61 +164,61 @@ class UIApi:
     def logout(self):
         """Clear credentials and avatars"""
         try:
-            # Write a logout request file for Blender main process
-            addon_dir = os.path.dirname(__file__)
-            req_file = os.path.join(addon_dir, 'rpm_prefs_request.json')
-            with open(req_file, 'w', encoding='utf-8') as f:
-                json.dump({'type': 'logout'}, f)
-            print('RPM UI: Logout request written')
+            # Ask Blender main process to clear credentials and avatars
+            self._send_to_blender({'type': 'logout'})
+            print('RPM UI: Logout request sent')
             # Update local cached values so UI reflects change immediately
             self._init_email = ''
             self._init_password = ''
-            # Clear avatars file if it exists
-            if self._avatars_path and os.path.exists(self._avatars_path):
+            if self._session_path:
+                rpm_avatar_api.clear_session(self._session_path)
+            # Forget the scraper's browser profile (cookies, local storage)
+            if self._webview_storage:
+                shutil.rmtree(self._webview_storage, ignore_errors=True)
+            # Clear the avatar library
+            if self._library:
                 try:
-                    with open(self._avatars_path, 'w', encoding='utf-8') as f:
-                        json.dump([], f)
-                    print('RPM UI: Cleared avatars file')
+                    self._library.clear()
+                    print('RPM UI: Cleared avatar library')
                 except Exception as e:
-                    print(f'RPM UI: Error clearing avatars file: {e}')
+                    print(f'RPM UI: Error clearing avatar library: {e}')
             return True
         except Exception as e:
             print(f'RPM UI: logout error: {e}')
             return False
     
     def get_refresh_progress(self):
-        """Get current refresh progress"""
-        prog = self._refresh_progress
-        
-        # Print status updates to Blender console for user visibility
-        if prog.get('percent') and not hasattr(self, '_last_reported_percent'):
-            self._last_reported_percent = -1
-        
-        current = prog.get('percent', 0)
-        if current != getattr(self, '_last_reported_percent', -1):
-            if current in [10, 25, 40, 60, 90, 95, 100]:
-                print(f'RPM UI: Refresh progress: {current}%')
-                self._last_reported_percent = current
-        
-        if prog.get('complete'):
-            if prog.get('error'):
-                print(f'RPM UI: Refresh ERROR: {prog.get("error")}')
-            elif prog.get('reload'):
-                print('RPM UI: Refresh COMPLETE - Reloading avatars from prefs file')
-        
-        return prog
+        """Get current refresh progress (the page is also pushed every update)"""
+        return self._refresh_progress
+    
+    def _set_refresh_progress(self, progress):
+        """Record refresh progress and push it to the page"""
+        self._refresh_progress = progress
+        current = progress.get('percent', 0)
+        if current != self._last_reported_percent:
+            print(f'RPM UI: Refresh progress: {current}%')
+            self._last_reported_percent = current
+        if progress.get('complete'):
+            if progress.get('error'):
+                print(f'RPM UI: Refresh ERROR: {progress.get("error")}')
+            elif progress.get('delta'):
+                print('RPM UI: Refresh COMPLETE - Applying avatar delta')
+        if self._window_alive():
+            try:
+                self._window.evaluate_js(f'onRefreshProgress({json.dumps(progress)})')
+            except Exception as e:
+                print(f'RPM UI: Could not push refresh progress: {e}')
     
     def refresh_avatars(self):
-        """Open the login webview to refresh avatars - runs synchronously"""
+        """Start the login webview to refresh avatars; progress is pushed to the page"""
         print('RPM UI: ========================================')
         print('RPM UI: REFRESH AVATARS STARTED')
         print('RPM UI: ========================================')
+        started = time.perf_counter()
         
         # Reset progress tracking
         self._last_reported_percent = -1
-        
-        # Reset progress
-        self._refresh_progress = {'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': False, 'error': None}
+        self._set_refresh_progress({'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': False, 'error': None})
         
         try:
             # Launch the existing RPM webview helper
@@ -125,18 +226,10 @@ class UIApi:
             helper_path = os.path.join(addon_dir, 'rpm_webview_helper.py')
             js_path = os.path.join(addon_dir, 'rpm_inject.js')
             
-            # Create temp file for communication
-            fd, out_path = tempfile.mkstemp(prefix='rpm_ui_', suffix='.json')
-            os.close(fd)
-            
-            # Progress file for communication
-            progress_fd, progress_path = tempfile.mkstemp(prefix='rpm_progress_', suffix='.json')
-            os.close(progress_fd)
-            
             cmd = self._find_python()
             if not cmd:
                 print('RPM UI: No Python command found')
-                self._refresh_progress = {'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': 'Python not found'}
+                self._set_refresh_progress({'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': 'Python not found'})
                 return
             
             # Get prefs from env/in-memory (provided by Blender main process)
@@ -144,22 +237,25 @@ class UIApi:
             password = self._init_password or ''
             
             env = os.environ.copy()
-            env['RPM_OUTPUT_PATH'] = out_path
             env['RPM_INJECT_JS_PATH'] = js_path
             env['RPM_WV_EMAIL'] = email
             env['RPM_WV_PASSWORD'] = password
-            env['RPM_PROGRESS_PATH'] = progress_path
+            # RPM_DEV_MODE (from Blender) is passed through: it picks the
+            # scraper's window mode
             
-            # Check dev mode from env passed by Blender
-            dev_mode = os.environ.get('RPM_DEV_MODE', '0') == '1'
-            
-            env['RPM_DEV_MODE'] = '1' if dev_mode else '0'
-            
-            self._refresh_progress = {'message': 'Retrieving Avatar Data...', 'percent': 5, 'complete': False, 'error': None}
+            self._set_refresh_progress({'message': 'Retrieving Avatar Data...', 'percent': 5, 'complete': False, 'error': None})
             
             # Run the webview helper in background thread to not block UI
             def run_helper():
-                import time
+                # Fast path: one request with the session from an earlier login
+                data = self._fetch_avatar_list_direct()
+                if data is not None:
+                    self._finish_refresh(data, started)
+                    return
+                
+                # Progress, results and errors all arrive as messages on one channel
+                channel = rpm_ipc.MessageServer()
+                env.update(channel.env())
                 
                 # Capture child output and forward to this process stdout
                 proc = subprocess.Popen(
@@ -178,147 +274,51 @@ class UIApi:
                     except Exception:
                         pass
                 
+                def _watch_exit():
+                    # Let the helper finish sending before reporting its exit
+                    return_code = proc.wait()
+                    channel.wait_closed(timeout=1.0)
+                    channel.messages.put({'type': 'exited', 'code': return_code})
+                
                 try:
                     t1 = threading.Thread(target=_forward, args=(proc.stdout, 'RPM helper> '), daemon=True)
                     t2 = threading.Thread(target=_forward, args=(proc.stderr, 'RPM helper ERR> '), daemon=True)
                     t1.start(); t2.start()
                 except Exception:
                     pass
+                threading.Thread(target=_watch_exit, daemon=True).start()
                 
                 print(f'RPM UI: Started helper process PID={proc.pid}')
                 sys.stdout.flush()
                 
-                # Poll for progress updates with timeout
-                start_time = time.time()
-                timeout = 120  # 2 minute timeout
-                last_percent = -1
-                
-                while proc.poll() is None:
-                    # Check timeout
-                    if time.time() - start_time > timeout:
-                        print('RPM UI: Helper process timeout, terminating...')
-                        proc.terminate()
-                        self._refresh_progress = {'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': 'Timeout after 2 minutes'}
-                        return
-                    
-                    if os.path.exists(progress_path):
-                        try:
-                            with open(progress_path, 'r', encoding='utf-8') as f:
-                                progress_data = json.load(f)
-                                percent = progress_data.get('percent', 5)
-                                self._refresh_progress = {'message': 'Retrieving Avatar Data...', 'percent': percent, 'complete': False, 'error': None}
-                                if percent != last_percent:
-                                    print(f'RPM UI: Progress update: {percent}%')
-                                    last_percent = percent
-                        except Exception as e:
-                            # Avoid spamming the console for transient partial writes
-                            pass
-                    time.sleep(0.2)
-                
-                # Wait for completion
-                return_code = proc.wait()
-                print(f'RPM UI: Helper process completed with return code: {return_code}')
-                sys.stdout.flush()
-                
-                self._refresh_progress = {'message': 'Retrieving Avatar Data...', 'percent': 95, 'complete': False, 'error': None}
-                print(f'RPM UI: Checking for output file: {out_path}')
-                sys.stdout.flush()  # Force console output
-                
-                # Wait a bit for file to be written
-                time.sleep(0.5)
-                
-                # Try multiple times to read the file
-                max_attempts = 5
-                file_found = False
-                for attempt in range(max_attempts):
-                    if os.path.exists(out_path):
-                        file_found = True
-                        print(f'RPM UI: Output file found on attempt {attempt + 1}')
-                        break
-                    time.sleep(0.2)
-                
-                # Read the result
-                if file_found:
-                    try:
-                        with open(out_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            print(f'RPM UI: Read data type: {data.get("type")}')
-                            if data.get('type') == 'list':
-                                items = data.get('items', [])
-                                avatar_items = [
-                                    {
-                                        'glb_url': it.get('glb', ''),
-                                        'thumb_url': it.get('thumb', ''),
-                                        'avatar_id': it.get('id', '')
-                                    } for it in items
-                                ]
-                                # Update shared avatars file if provided
-                                try:
-                                    if self._avatars_path:
-                                        with open(self._avatars_path, 'w', encoding='utf-8') as af:
-                                            json.dump(avatar_items, af, indent=2)
-                                        print(f'RPM UI: Wrote {len(avatar_items)} avatars to shared file')
-                                    else:
-                                        print('RPM UI: No shared avatars path set; avatars will not persist')
-                                except Exception as ee:
-                                    print(f'RPM UI: Failed to write shared avatars file: {ee}')
-                                # Write an update request for Blender main process
-                                try:
-                                    addon_dir2 = os.path.dirname(__file__)
-                                    upd_file = os.path.join(addon_dir2, 'rpm_avatar_update.json')
-                                    with open(upd_file, 'w', encoding='utf-8') as uf:
-                                        json.dump({'type': 'avatar_update', 'items': avatar_items}, uf)
-                                except Exception as ee:
-                                    print(f'RPM UI: Failed to write avatar update request: {ee}')
-                                
-                                # Signal completion with success flag
-                                self._refresh_progress = {
-                                    'message': 'Retrieving Avatar Data...', 
-                                    'percent': 100, 
-                                    'complete': True, 
-                                    'error': None,
-                                    'reload': True  # Signal to reload avatars
-                                }
-                                print('RPM UI: *** REFRESH COMPLETE - Avatars should reload now ***')
-                                sys.stdout.flush()
-                            elif data.get('type') == 'error':
-                                error_msg = data.get('message', 'Unknown error')
-                                self._refresh_progress = {'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': error_msg}
-                                print(f'RPM UI: Refresh error: {error_msg}')
-                                print(f'RPM UI: Error type detected - will show login popup in UI')
-                                sys.stdout.flush()
-                        
+                # Block on the channel; every message is handled as it arrives
+                deadline = started + 120  # 2 minute timeout
+                first_progress = None
+                data = None
+                try:
+                    while data is None:
                         try:
-                            os.remove(out_path)
-                        except:
-                            pass
-                    except Exception as e:
-                        self._refresh_progress = {'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': str(e)}
-                        print(f'RPM UI: Error reading result: {e}')
-                        import traceback
-                        traceback.print_exc()
-                else:
-                    print(f'RPM UI: !!! ERROR - Output file not found after {max_attempts} attempts !!!')
-                    print(f'RPM UI: Expected path: {out_path}')
-                    sys.stdout.flush()
-                    # List files in temp directory
-                    try:
-                        temp_dir = os.path.dirname(out_path)
-                        files = os.listdir(temp_dir)
-                        rpm_files = [f for f in files if 'rpm' in f.lower()]
-                        print(f'RPM UI: RPM files in temp dir: {rpm_files}')
-                        sys.stdout.flush()
-                    except Exception as e:
-                        print(f'RPM UI: Could not list temp dir: {e}')
-                        sys.stdout.flush()
-                    self._refresh_progress = {'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': 'Output file not created'}
+                            message = channel.messages.get(timeout=max(0.0, deadline - time.perf_counter()))
+                        except queue.Empty:
+                            print('RPM UI: Helper process timeout, terminating...')
+                            proc.terminate()
+                            self._set_refresh_progress({'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': 'Timeout after 2 minutes'})
+                            return
+                        msg_type = message.get('type')
+                        if msg_type == 'progress':
+                            if first_progress is None:
+                                first_progress = time.perf_counter() - started
+                            self._set_refresh_progress({'message': 'Retrieving Avatar Data...', 'percent': message.get('percent', 5), 'complete': False, 'error': None})
+                        elif msg_type in ('list', 'error'):
+                            data = message
+                        elif msg_type == 'exited':
+                            print(f'RPM UI: Helper process exited with code {message.get("code")} without a result')
+                            self._set_refresh_progress({'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': 'Avatar helper exited without a result'})
+                            return
+                finally:
+                    channel.close()
                 
-                # Cleanup progress file
-                try:
-                    if os.path.exists(progress_path):
-                        os.remove(progress_path)
-                except:
-                    pass
+                self._finish_refresh(data, started, first_progress)
             
             # Start helper in background thread
             helper_thread = threading.Thread(target=run_helper, daemon=True)
@@ -327,26 +327,155 @@ class UIApi:
             print('RPM UI: Progress updates will appear below as refresh proceeds...')
             
         except Exception as e:
-            self._refresh_progress = {'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': str(e)}
+            self._set_refresh_progress({'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': str(e)})
             print(f'RPM UI: refresh_avatars error: {e}')
             import traceback
             traceback.print_exc()
     
-    def get_avatars(self):
-        """Get current avatars list from prefs"""
+    def _finish_refresh(self, data, started, first_progress=None):
+        """Apply a list/error result from the direct fetch or the scraper"""
+        print(f'RPM UI: Received result type: {data.get("type")}')
+        sys.stdout.flush()
+        try:
+            if data.get('type') == 'list':
+                # Keep the web app session for the next refresh's direct fetch
+                if data.get('session') and self._session_path:
+                    try:
+                        rpm_avatar_api.save_session(self._session_path, data['session'])
+                    except Exception as e:
+                        print(f'RPM UI: Could not store session: {e}')
+                items = data.get('items', [])
+                avatar_items = [
+                    {
+                        'glb_url': it.get('glb', ''),
+                        'thumb_url': it.get('thumb', ''),
+                        'avatar_id': it.get('id', '')
+                    } for it in items
+                ]
+                # Only the difference from the library is written
+                delta = self._sync_library(avatar_items)
+                if rpm_library.delta_is_empty(delta):
+                    print(f'RPM UI: Avatar list unchanged ({len(avatar_items)} avatars)')
+                else:
+                    print(
+                        f'RPM UI: Avatar delta: +{len(delta["added"])} '
+                        f'-{len(delta["removed"])} ~{len(delta["changed"])}'
+                    )
+                    # Send the delta to Blender main process
+                    self._send_to_blender({'type': 'avatar_delta', **delta})
+
+                elapsed = time.perf_counter() - started
+                print(
+                    f'RPM UI: *** REFRESH COMPLETE in {elapsed * 1000:.0f} ms '
+                    f'(first progress after {(first_progress or 0) * 1000:.0f} ms) ***'
+                )
+                saved_ms = self._record_refresh_time(data.get('profile'), elapsed)
+                # Signal completion; the page applies the delta to its grid
+                self._set_refresh_progress({
+                    'message': 'Retrieving Avatar Data...', 
+                    'percent': 100, 
+                    'complete': True, 
+                    'error': None,
+                    'delta': delta,
+                    'elapsed_ms': round(elapsed * 1000),
+                    'profile': data.get('profile'),
+                    'saved_ms': saved_ms
+                })
+                sys.stdout.flush()
+            else:
+                error_msg = data.get('message', 'Unknown error')
+                print(f'RPM UI: Refresh error: {error_msg}')
+                print(f'RPM UI: Error type detected - will show login popup in UI')
+                self._set_refresh_progress({'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': error_msg})
+                sys.stdout.flush()
+        except Exception as e:
+            print(f'RPM UI: Error handling result: {e}')
+            import traceback
+            traceback.print_exc()
+            self._set_refresh_progress({'message': 'Retrieving Avatar Data...', 'percent': 0, 'complete': True, 'error': str(e)})
+    
+    def _record_refresh_time(self, profile, elapsed):
+        """Track scraper times with and without a stored browser session.
+        
+        Returns the milliseconds a warm run saved over the last full sign-in,
+        or None when there is nothing to compare.
+        """
+        if profile not in ('warm', 'cold') or not self._webview_storage:
+            return None
+        path = os.path.join(self._webview_storage, 'refresh_metrics.json')
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                metrics = json.load(f)
+        except (OSError, ValueError):
+            metrics = {}
+        metrics[f'{profile}_ms'] = round(elapsed * 1000)
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(metrics, f)
+        except OSError as e:
+            print(f'RPM UI: Could not write refresh metrics: {e}')
+        if profile == 'cold':
+            print(f'RPM UI: Refresh with full sign-in took {metrics["cold_ms"]} ms')
+            return None
+        if 'cold_ms' not in metrics:
+            return None
+        saved = metrics['cold_ms'] - metrics['warm_ms']
+        print(
+            f'RPM UI: Stored browser session saved {saved} ms '
+            f'({metrics["warm_ms"]} ms vs {metrics["cold_ms"]} ms with sign-in)'
+        )
+        return saved
+    
+    def _fetch_avatar_list_direct(self):
+        """Avatar list via the API with the stored session, or None to scrape"""
+        session = rpm_avatar_api.load_session(self._session_path) if self._session_path else None
+        if not session:
+            return None
+        fetch_started = time.perf_counter()
+        try:
+            data = rpm_avatar_api.fetch_avatar_list(session)
+        except rpm_avatar_api.SessionExpired as e:
+            print(f'RPM UI: Stored session rejected ({e}); falling back to the login page')
+            rpm_avatar_api.clear_session(self._session_path)
+            return None
+        except Exception as e:
+            print(f'RPM UI: Direct avatar fetch failed ({e}); falling back to the login page')
+            return None
+        print(
+            f'RPM UI: Fetched {len(data["items"])} avatars directly in '
+            f'{(time.perf_counter() - fetch_started) * 1000:.0f} ms'
+        )
+        return data
+    
+    def _sync_library(self, avatar_items):
+        if not self._library:
+            print('RPM UI: No avatar library; avatars will not persist')
+            return rpm_library.diff_avatars([], avatar_items)
+        try:
+            return self._library.sync(avatar_items)
+        except Exception as e:
+            print(f'RPM UI: Failed to update avatar library: {e}')
+            return rpm_library.diff_avatars([], [])
+    
+    def get_avatars(self, offset=0, limit=None):
+        """Get a page of avatars from the library (all of them without a limit)"""
         try:
-            # Preferred path: read from shared temp file provided by Blender
-            if self._avatars_path and os.path.exists(self._avatars_path):
-                with open(self._avatars_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    print(f'RPM UI: Loading {len(data)} avatars from shared file')
-                    return data
-            print('RPM UI: No shared avatars file, returning empty avatar list')
+            if self._library:
+                return self._library.page(int(offset or 0), None if limit is None else int(limit))
+            print('RPM UI: No avatar library, returning empty avatar list')
             return []
         except Exception as e:
             print(f'RPM UI: get_avatars error: {e}')
             return []
     
+    def count_avatars(self):
+        """Number of avatars in the library"""
+        try:
+            return len(self._library) if self._library else 0
+        except Exception as e:
+            print(f'RPM UI: count_avatars error: {e}')
+            return 0
+    
     def get_defaults(self):
         """Get default property values from Blender"""
         try:
@@ -359,23 +488,30 @@ class UIApi:
         """Trigger download in Blender"""
         print(f'RPM UI: download_avatar called with options: {options}')
         try:
-            # Create a temp file with download request
-            addon_dir = os.path.dirname(__file__)
-            req_file = os.path.join(addon_dir, 'rpm_download_request.json')
-            
-            with open(req_file, 'w', encoding='utf-8') as f:
-                json.dump(options, f)
-            
-            print(f'RPM UI: Download request written to {req_file}')
+            if self._send_to_blender({'type': 'download', 'options': options}):
+                print('RPM UI: Download request sent to Blender')
         except Exception as e:
             print(f'RPM UI: download_avatar error: {e}')
     
+    def import_batch(self, items):
+        """Queue several avatars for import in Blender"""
+        print(f'RPM UI: import_batch called with {len(items or [])} avatars')
+        try:
+            if self._send_to_blender({'type': 'import_batch', 'items': list(items or [])}):
+                print('RPM UI: Batch import request sent to Blender')
+                return True
+        except Exception as e:
+            print(f'RPM UI: import_batch error: {e}')
+        return False
+    
     def close_window(self):
         """Close the webview window"""
         print('RPM UI: close_window called')
         try:
-            if self._window:
-                self._window.destroy()
+            # Hide rather than destroy so the next open is instant
+            if self._window_alive():
+                self._window.hide()
+                self._send_to_blender({'type': 'window_hidden'})
         except Exception as e:
             print(f'RPM UI: close_window error: {e}')
     
@@ -388,6 +524,16 @@ class UIApi:
         return None
 
 
+def create_ui_window(api):
+    return webview.create_window(
+        'Ready Player Me - Blender Importer',
+        os.environ.get('RPM_HTML_PATH', ''),
+        width=900,
+        height=800,
+        js_api=api
+    )
+
+
 def on_loaded():
     """Called when the webview page is loaded"""
     print('RPM UI helper: page loaded, dispatching pywebviewready event')
@@ -402,16 +548,13 @@ def main():
     
     api = UIApi()
     
-    window = webview.create_window(
-        'Ready Player Me - Blender Importer',
-        html_path,
-        width=900,
-        height=800,
-        js_api=api
-    )
-    
+    window = create_ui_window(api)
     api.set_window(window)
     
+    # Invisible window that keeps the GUI loop (and this process) alive when
+    # the user closes the UI window, so Blender can reopen it instantly
+    webview.create_window('RPM keep-alive', html='', width=1, height=1, hidden=True)
+    
     try:
         if sys.platform == 'win32':
             print('RPM UI helper: starting webview with edgechromium')
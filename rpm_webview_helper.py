@@ -2,35 +2,206 @@ import webview
 import json
 import sys
 import os
-import threading
-import time
+
+import rpm_ipc
 
 print('RPM helper: starting')
 sys.stdout.flush()
 
+SIGNIN_URL = 'https://studio.readyplayer.me/signin'
+# Written next to the browser profile after each successful scrape
+PROFILE_NAME = 'rpm_profile.json'
+WINDOW_MODES = ('visible', 'offscreen', 'hidden', 'minimized')
+OFFSCREEN_POS = (-10000, -10000)
+
+
+def use_storage_dir(path):
+    """Keep the webview's cookies and local storage in ``path`` across runs"""
+    os.makedirs(path, exist_ok=True)
+    if sys.platform == 'win32':
+        # EdgeChromium keeps its profile in %LOCALAPPDATA%\pywebview
+        os.environ['LOCALAPPDATA'] = path
+    elif sys.platform.startswith('linux'):
+        # WebKitGTK local storage and cache follow the XDG dirs; cookies are
+        # only kept on disk once the default context is given a file
+        os.environ['XDG_DATA_HOME'] = os.path.join(path, 'data')
+        os.environ['XDG_CACHE_HOME'] = os.path.join(path, 'cache')
+        try:
+            import gi
+            gi.require_version('WebKit2', '4.0')
+            from gi.repository import WebKit2
+            WebKit2.WebContext.get_default().get_cookie_manager().set_persistent_storage(
+                os.path.join(path, 'cookies.sqlite'), WebKit2.CookiePersistentStorage.SQLITE
+            )
+        except Exception as e:
+            print('RPM helper: cookie storage not set', e)
+    # macOS: WKWebView's default data store is already persistent
+
+
+def window_mode(value):
+    """Scraper window mode from ``RPM_DEV_MODE``.
+
+    ``1`` shows the window (dev mode). ``0`` or unset picks the platform's
+    default; a mode name from ``WINDOW_MODES`` selects it directly.
+    """
+    value = (value or '').strip().lower()
+    if value == '1':
+        return 'visible'
+    if value in WINDOW_MODES:
+        return value
+    # WebView2 only initializes once its form is shown, so Windows keeps the
+    # minimized window; ``offscreen`` is opt-in there until it has been
+    # tested on Windows. WebKit loads fine in a hidden window
+    return 'minimized' if sys.platform == 'win32' else 'hidden'
+
+
+def window_options(mode):
+    """``webview.create_window`` keyword arguments for a window mode"""
+    # Full size in every mode so the lazy-loaded avatar grid lays out the
+    # same way it does on screen
+    options = {
+        'width': 1000,
+        'height': 800,
+        'hidden': mode == 'hidden',
+        'minimized': mode == 'minimized',
+    }
+    if mode == 'offscreen':
+        options['x'], options['y'] = OFFSCREEN_POS
+    return options
+
+
+# Win32 values used to keep the off-screen window in the background
+GWL_EXSTYLE = -20
+WS_EX_TOOLWINDOW = 0x00000080
+WS_EX_APPWINDOW = 0x00040000
+WS_EX_NOACTIVATE = 0x08000000
+SW_HIDE = 0
+SW_SHOWNOACTIVATE = 4
+SWP_NOSIZE = 0x0001
+SWP_NOMOVE = 0x0002
+SWP_NOZORDER = 0x0004
+SWP_NOACTIVATE = 0x0010
+SWP_FRAMECHANGED = 0x0020
+
+
+def _user32():
+    import ctypes
+    from ctypes import wintypes
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    user32.EnumWindows.argtypes = (ctypes.c_void_p, wintypes.LPARAM)
+    user32.EnumWindows.restype = wintypes.BOOL
+    user32.GetWindowThreadProcessId.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.DWORD))
+    user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    user32.GetWindowTextW.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+    user32.GetWindowTextW.restype = ctypes.c_int
+    user32.GetForegroundWindow.restype = wintypes.HWND
+    user32.GetWindowLongW.argtypes = (wintypes.HWND, ctypes.c_int)
+    user32.SetWindowLongW.argtypes = (wintypes.HWND, ctypes.c_int, wintypes.LONG)
+    user32.SetWindowPos.argtypes = (wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                                    ctypes.c_int, ctypes.c_int, wintypes.UINT)
+    user32.ShowWindow.argtypes = (wintypes.HWND, ctypes.c_int)
+    user32.SetForegroundWindow.argtypes = (wintypes.HWND,)
+    return user32
+
+
+def foreground_window():
+    """Handle of the window that has focus (Windows only, else None)"""
+    if sys.platform != 'win32':
+        return None
+    try:
+        return _user32().GetForegroundWindow()
+    except Exception:
+        return None
+
+
+def process_windows(title):
+    """Top-level windows of this process titled ``title`` (Windows only)"""
+    import ctypes
+    from ctypes import wintypes
+    user32 = _user32()
+    pid = os.getpid()
+    found = []
+
+    @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    def collect(hwnd, _lparam):
+        owner = wintypes.DWORD()
+        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(owner))
+        if owner.value == pid:
+            text = ctypes.create_unicode_buffer(256)
+            user32.GetWindowTextW(hwnd, text, 256)
+            if text.value == title:
+                found.append(hwnd)
+        return True
+
+    user32.EnumWindows(collect, 0)
+    return found
+
+
+def keep_in_background(w, foreground=None):
+    """Take the off-screen window out of the taskbar, Alt+Tab and focus (Windows)
+
+    WebView2 only starts once its form is shown, and showing the form
+    activates it and gives it a taskbar button. Once it is up it becomes a
+    non-activating tool window; the taskbar only picks up the new style
+    when the window is shown again, which is done without activating it.
+    Focus then goes back to ``foreground``, the window that had it before.
+    """
+    try:
+        if not window_event(w, 'shown').wait(15):
+            print('RPM helper: window not shown, cannot move it to the background')
+            return
+        user32 = _user32()
+        for hwnd in process_windows(w.title):
+            style = user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+            style = (style | WS_EX_NOACTIVATE | WS_EX_TOOLWINDOW) & ~WS_EX_APPWINDOW
+            user32.ShowWindow(hwnd, SW_HIDE)
+            user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style)
+            user32.SetWindowPos(hwnd, None, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOZORDER
+                                | SWP_NOACTIVATE | SWP_FRAMECHANGED)
+            user32.ShowWindow(hwnd, SW_SHOWNOACTIVATE)
+        if foreground:
+            user32.SetForegroundWindow(foreground)
+    except Exception as e:
+        print('RPM helper: could not move window to the background', e)
+
+
+def window_event(w, name):
+    """Window event by name (``w.events.<name>`` on pywebview 4+, ``w.<name>`` on 3.x)"""
+    events = getattr(w, 'events', None)
+    return getattr(events, name) if events is not None else getattr(w, name)
+
+
+def read_profile(storage_dir):
+    try:
+        with open(os.path.join(storage_dir, PROFILE_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_profile(storage_dir, profile):
+    try:
+        with open(os.path.join(storage_dir, PROFILE_NAME), 'w', encoding='utf-8') as f:
+            json.dump(profile, f)
+    except OSError as e:
+        print('RPM helper: could not write profile', e)
+
 class API:
-    def __init__(self, outpath, progress_path=None):
-        self.outpath = outpath
-        self.progress_path = progress_path
+    def __init__(self, channel, storage_dir='', warm=False):
+        # Progress and results are pushed to the UI helper over this channel
+        self._channel = channel
+        self._storage_dir = storage_dir
+        self._warm = warm
         self._email = ''
         self._password = ''
-        
-    def _atomic_write_json(self, path, payload):
-        try:
-            tmp = path + '.tmp'
-            with open(tmp, 'w', encoding='utf-8') as f:
-                json.dump(payload, f, indent=2)
-            os.replace(tmp, path)
-        except Exception as e:
-            print('RPM helper: atomic write failed for', path, e)
+        self._last_percent = None
     
     def update_progress(self, percent):
-        """Write progress update to file"""
-        if self.progress_path:
-            try:
-                self._atomic_write_json(self.progress_path, {'percent': percent})
-            except Exception as e:
-                print(f'RPM helper: Failed to write progress: {e}')
+        """Push a progress update to the UI helper"""
+        if percent == self._last_percent:
+            return
+        self._last_percent = percent
+        self._channel.send({'type': 'progress', 'percent': percent})
     
     def on_list(self, payload):
         print(f'RPM helper: on_list called with payload type: {type(payload)}')
@@ -38,10 +209,16 @@ class API:
         try:
             if isinstance(payload, dict):
                 items_count = len(payload.get('items', []))
-                print(f'RPM helper: Writing {items_count} items to {self.outpath}')
+                print(f'RPM helper: Sending {items_count} items to the UI helper')
                 sys.stdout.flush()
-                self._atomic_write_json(self.outpath, payload)
-                print(f'RPM helper: Successfully wrote output file')
+                if payload.get('type') == 'list':
+                    payload = dict(payload, profile='warm' if self._warm else 'cold')
+                    # Remember where the avatar list lives for the next run
+                    if self._storage_dir and payload.get('sub'):
+                        write_profile(self._storage_dir, {'sub': payload['sub'], 'email': self._email})
+                self._channel.send(payload)
+                self._channel.close()
+                print(f'RPM helper: Result sent')
                 sys.stdout.flush()
             else:
                 print(f'RPM helper: Payload is not a dict: {payload}')
@@ -78,11 +255,6 @@ class API:
                 self._email = (payload.get('email') or '').strip()
                 self._password = payload.get('password') or ''
             print('RPM helper: creds received')
-            try:
-                with open(self.outpath, 'w', encoding='utf-8') as f:
-                    json.dump({'type': 'creds', 'email': self._email, 'password': self._password}, f)
-            except Exception as e:
-                print('RPM helper: failed to write creds', e)
         except Exception as e:
             print('RPM helper: on_creds error', e)
     
@@ -100,7 +272,7 @@ class API:
             print('RPM helper: close_window error', e)
 
 
-def start_inject(w, dev_mode=True):
+def start_inject(w, api=None):
     js_path = os.environ.get('RPM_INJECT_JS_PATH', '')
     if not js_path:
         print('RPM helper: WARNING - No JS file path provided')
@@ -110,14 +282,6 @@ def start_inject(w, dev_mode=True):
         print('RPM helper: ERROR - JS file not found at:', js_path)
         return
     
-    # Minimize window if not in dev mode (called after window is ready)
-    if not dev_mode:
-        try:
-            w.minimize()
-            print('RPM helper: window minimized (non-dev mode)')
-        except Exception as e:
-            print('RPM helper: minimize error', e)
-    
     try:
         with open(js_path, 'r', encoding='utf-8') as f:
             js_code = f.read()
@@ -127,7 +291,6 @@ def start_inject(w, dev_mode=True):
         return
     
     inject_count = {'count': 0}
-    last_url = {'url': ''}
     
     def inject():
         try:
@@ -138,73 +301,92 @@ def start_inject(w, dev_mode=True):
         except Exception as e:
             print('RPM helper: inject error', e)
     
-    def poll_navigation():
-        while True:
-            try:
-                time.sleep(0.5)
-                current_url = w.get_current_url()
-                if current_url and current_url != last_url['url']:
-                    print(f'RPM helper: Navigation detected: {current_url}')
-                    last_url['url'] = current_url
-                    time.sleep(0.3)
-                    inject()
-            except Exception as e:
-                break
+    def on_loaded():
+        # Fires once per document, after pywebview's JS bridge is installed;
+        # in-page (SPA) route changes are followed by the injected loop itself
+        try:
+            current_url = w.get_current_url() or ''
+        except Exception:
+            current_url = ''
+        print(f'RPM helper: Page loaded: {current_url}')
+        if api and api._warm and '/signin' in current_url:
+            # The stored session expired; this run signs in again
+            print('RPM helper: stored browser session expired')
+            api._warm = False
+        inject()
     
     try:
-        w.events.loaded += inject
+        loaded = window_event(w, 'loaded')
+        loaded += on_loaded
+        # The first page may have finished loading before we subscribed;
+        # rpm_inject.js ignores a second injection into the same document
+        if loaded.is_set():
+            on_loaded()
     except Exception as e:
         print('RPM helper: cannot attach loaded event', e)
-    
-    inject()
-    
-    nav_thread = threading.Thread(target=poll_navigation, daemon=True)
-    nav_thread.start()
+        inject()
 
 
-def main(outpath):
+def main(channel):
     print('RPM helper: creating window')
-    print('RPM helper: output path', outpath)
     
-    progress_path = os.environ.get('RPM_PROGRESS_PATH', '')
-    api = API(outpath, progress_path)
+    email = os.environ.get('RPM_WV_EMAIL', '')
+    storage_dir = os.environ.get('RPM_WEBVIEW_STORAGE', '')
+    url = SIGNIN_URL
+    warm = False
+    if storage_dir:
+        use_storage_dir(storage_dir)
+        profile = read_profile(storage_dir)
+        # Still signed in from the last run: go straight to the avatar list;
+        # an expired session redirects to the sign-in flow as before
+        if profile.get('sub') and profile.get('email') == email:
+            url = f'https://{profile["sub"]}.readyplayer.me/avatar/choose'
+            warm = True
+            print('RPM helper: reusing stored browser session')
+    
+    api = API(channel, storage_dir, warm)
     
     try:
-        api._email = os.environ.get('RPM_WV_EMAIL', '')
+        api._email = email
         api._password = os.environ.get('RPM_WV_PASSWORD', '')
         if api._email:
             print('RPM helper: Loaded email from env:', api._email)
     except Exception:
         pass
     
-    # Check dev mode
-    dev_mode = os.environ.get('RPM_DEV_MODE', '0') == '1'
-    print(f'RPM helper: dev_mode = {dev_mode}')
+    # Only dev mode shows the window; see window_mode for the default elsewhere
+    mode = window_mode(os.environ.get('RPM_DEV_MODE', '0'))
+    print(f'RPM helper: window mode = {mode}')
     
+    # Taken before our window exists, so focus can be handed back to it
+    foreground = foreground_window() if mode == 'offscreen' else None
     w = webview.create_window(
         'Ready Player Me',
-        url='https://studio.readyplayer.me/signin',
-        width=1000,
-        height=800,
+        url=url,
         js_api=api,
-        hidden=False
+        **window_options(mode)
     )
+
+    def on_start(w, api):
+        start_inject(w, api)
+        if mode == 'offscreen' and sys.platform == 'win32':
+            keep_in_background(w, foreground)
     
     try:
         if sys.platform == 'win32':
             print('RPM helper: starting webview with edgechromium')
-            webview.start(start_inject, (w, dev_mode), gui='edgechromium', debug=False)
+            webview.start(on_start, (w, api), gui='edgechromium', debug=False)
         else:
             print('RPM helper: starting webview default gui')
-            webview.start(start_inject, (w, dev_mode), debug=False)
+            webview.start(on_start, (w, api), debug=False)
     except Exception as e:
         print('RPM helper: webview.start error', e)
-        webview.start(start_inject, (w, dev_mode), debug=False)
+        webview.start(on_start, (w, api), debug=False)
 
 
 if __name__ == '__main__':
-    output_path = os.environ.get('RPM_OUTPUT_PATH', '')
-    if not output_path:
-        print('RPM helper: ERROR - No output path provided')
+    channel = rpm_ipc.MessageClient.from_env()
+    if not channel:
+        print('RPM helper: ERROR - No channel to the UI helper')
         sys.exit(1)
-    main(output_path)
\ No newline at end of file
+    main(channel)
\ No newline at end of file